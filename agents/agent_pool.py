@@ -0,0 +1,93 @@
+"""
+Agent pool - Process-wide sharing of agent wrappers and their resources.
+
+Session-independent agents (StateResolverAgent, ComplianceAgent, the
+VisualizationAgent renderer) hold no per-session state, so one instance per
+model_id serves every session in the process:
+- shared_agent(cls, model_id): the pooled wrapper for an agent class
+- AgentLease: idle Agno Agent instances of one shared wrapper; every in-flight
+  run checks one out, so concurrent sessions never overwrite each other's
+  instructions mid-run
+- shared_db(filename): one SqliteDb per database file, reused by every
+  session's history-backed agents (instead of one connection per session)
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+from agno.agent import Agent
+from agno.db.sqlite import SqliteDb
+
+from config import Config
+from services.metrics import metrics
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_agents: dict[tuple[type, str], object] = {}
+_dbs: dict[str, SqliteDb] = {}
+
+
+def shared_agent(cls: Callable[..., T], model_id: str | None = None) -> T:
+    """Return the process-wide instance of agent class `cls` for `model_id`."""
+    key = (cls, model_id or Config.MODEL_ID)
+    with _lock:
+        agent = _agents.get(key)
+        if agent is None:
+            agent = _agents[key] = cls(model_id=key[1])
+            metrics.inc("agent_pool.created")
+        else:
+            metrics.inc("agent_pool.reused")
+    return agent
+
+
+def shared_db(filename: str) -> SqliteDb:
+    """Return the process-wide SqliteDb for a file under Config.DB_DIR."""
+    with _lock:
+        db = _dbs.get(filename)
+        if db is None:
+            db = _dbs[filename] = SqliteDb(db_file=Config.get_db_path(filename))
+    return db
+
+
+def clear_pool() -> None:
+    """Drop all pooled agents and databases (tests, model reconfiguration)."""
+    with _lock:
+        _agents.clear()
+        _dbs.clear()
+
+
+class AgentLease:
+    """
+    Idle Agno Agent instances for one shared wrapper.
+
+    lease(instructions) hands out an idle instance (creating one when all are
+    busy) with its instructions set, and returns it to the pool afterwards.
+    """
+
+    def __init__(self, factory: Callable[[str], Agent]):
+        """Use factory(instructions) to build new Agent instances."""
+        self._factory = factory
+        self._idle: list[Agent] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, instructions: str) -> Iterator[Agent]:
+        """Check out an Agent configured with `instructions` for one run."""
+        with self._lock:
+            agent = self._idle.pop() if self._idle else None
+        if agent is None:
+            agent = self._factory(instructions)
+        else:
+            agent.instructions = instructions
+        try:
+            yield agent
+        finally:
+            with self._lock:
+                self._idle.append(agent)
+
+    def clear(self) -> None:
+        """Forget all idle instances."""
+        with self._lock:
+            self._idle.clear()
@@ -5,15 +5,15 @@ This agent uses read-only tools to access graph data and performs
 financial calculations like net profit, net worth, debt-to-income ratio, etc.
 """
 
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.llm_client import openai_chat
 from config import Config
 from memory.graph_memory import GraphMemory
+from services.prompt_registry import PROMPTS
 from agents.tools.calculation_engine_tool import CalculationEngineTool
 
 
@@ -97,9 +97,8 @@ class CalculationAgent:
         self._agent: Agent | None = None
     
     def _load_prompt(self) -> str:
-        """Load prompt template from file."""
-        prompt_path = Path(__file__).parent.parent / "prompts" / "calculation_agent_prompt.txt"
-        return prompt_path.read_text()
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["calculation_agent_prompt"].text
     
     def get_agent(self) -> Agent:
         """Get or create agent (reuse for performance)."""
@@ -112,7 +111,7 @@ class CalculationAgent:
         prompt_template = self._load_prompt()
         
         self._agent = Agent(
-            model=OpenAIChat(id=self.model_id),
+            model=openai_chat(self.model_id),
             tools=[GraphDataTool(self.graph_memory), CalculationEngineTool()],
             instructions=prompt_template,
             output_schema=CalculationResponse,
@@ -136,6 +135,11 @@ class CalculationAgent:
         agent = self.get_agent()
         return agent.run(request).content
     
+    async def acalculate(self, request: str) -> CalculationResponse:
+        """Async variant of calculate() using Agno's arun."""
+        agent = self.get_agent()
+        return (await agent.arun(request)).content
+    
     def update_graph_memory(self, graph_memory: GraphMemory) -> None:
         """Update graph memory and recreate agent with new tools."""
         self.graph_memory = graph_memory
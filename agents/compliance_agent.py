@@ -6,16 +6,24 @@ This agent reviews EVERY response before it goes to the user to ensure:
 - Neutral, educational tone
 - Facts and scenarios only
 - No product recommendations
+
+Server-generated template text and single plain questions that pass the local
+rule-based screen (services.compliance_screener) are approved without an LLM
+call; all other text is escalated.
+Escalated verdicts are cached by content (services.compliance_cache).
 """
 
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import AgentLease
+from agents.llm_client import openai_chat
 from config import Config
+from services.compliance_cache import get_compliance_cache, make_key
+from services.compliance_screener import screen
+from services.prompt_registry import PROMPTS
 
 
 class ComplianceResponse(BaseModel):
@@ -55,39 +63,93 @@ class ComplianceAgent:
     - Maintains educational, neutral tone
     """
     
+    RUN_MESSAGE = (
+        "Review this response for compliance. "
+        "If it violates any rules, rewrite it to be compliant while preserving the intent."
+    )
+    
     def __init__(self, model_id: str | None = None):
         """Initialize ComplianceAgent with model."""
         self.model_id = model_id or Config.MODEL_ID
-        self._agent: Agent | None = None
-        self._prompt_template: str | None = None
+        # Shared across sessions (see agents.agent_pool): one Agent per in-flight run
+        self._agents = AgentLease(self._new_agent)
     
     def _load_prompt(self) -> str:
-        """Load prompt template from file."""
-        if self._prompt_template is None:
-            prompt_path = Path(__file__).parent.parent / "prompts" / "compliance_agent_prompt.txt"
-            self._prompt_template = prompt_path.read_text()
-        return self._prompt_template
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["compliance_agent_prompt"].text
+    
+    def _new_agent(self, instructions: str) -> Agent:
+        """Create an Agno agent for the pool (instructions are replaced per run)."""
+        return Agent(
+            model=openai_chat(self.model_id),
+            instructions=instructions,
+            output_schema=ComplianceResponse,
+            markdown=False,
+            debug_mode=False,  # Less verbose for compliance checks
+            use_json_mode=True,
+        )
+    
+    def _prepare(
+        self,
+        response_text: str,
+        response_type: str,
+        context_summary: str | None,
+    ) -> str:
+        """Render the compliance prompt."""
+        prompt_template = self._load_prompt()
+        
+        prompt = prompt_template.format(
+            response_text=response_text,
+            response_type=response_type,
+            context_summary=context_summary or "General conversation",
+        )
+        
+        return prompt
+    
+    def _cache_key(self, response_text: str, response_type: str) -> str:
+        """Content-addressed key for the verdict cache."""
+        return make_key(response_text, response_type, PROMPTS["compliance_agent_prompt"].version)
+    
+    def _cached(self, key: str) -> ComplianceResponse | None:
+        """Return a cached verdict for key, if any."""
+        verdict = get_compliance_cache().get(key)
+        return ComplianceResponse(**verdict) if verdict else None
+    
+    def _store(self, key: str, response: Any) -> None:
+        """Cache an LLM verdict."""
+        if isinstance(response, ComplianceResponse):
+            get_compliance_cache().set(key, response.model_dump())
+    
+    async def _acached(self, key: str) -> ComplianceResponse | None:
+        """Async _cached(): the on-disk tier is read off the event loop."""
+        verdict = await get_compliance_cache().aget(key)
+        return ComplianceResponse(**verdict) if verdict else None
     
-    def _ensure_agent(self, instructions: str) -> Agent:
-        """Ensure a single agent instance is reused for performance."""
-        if not self._agent:
-            self._agent = Agent(
-                model=OpenAIChat(id=self.model_id),
-                instructions=instructions,
-                output_schema=ComplianceResponse,
-                markdown=False,
-                debug_mode=False,  # Less verbose for compliance checks
-                use_json_mode=True,
-            )
-        else:
-            self._agent.instructions = instructions
-        return self._agent
+    async def _astore(self, key: str, response: Any) -> None:
+        """Async _store(): the on-disk tier is written off the event loop."""
+        if isinstance(response, ComplianceResponse):
+            await get_compliance_cache().aset(key, response.model_dump())
+    
+    def _prescreen(self, response_text: str, server_generated: bool) -> ComplianceResponse | None:
+        """Approve locally if the rule-based screen passes the text; None means escalate to the LLM."""
+        if not Config.COMPLIANCE_PRESCREEN_ENABLED:
+            return None
+        if not screen(response_text, server_generated=server_generated).clean:
+            return None
+        return ComplianceResponse(
+            approved=True,
+            compliant_response=response_text,
+            violations_found=[],
+            changes_made=[],
+            reasoning="Auto-approved by rule-based pre-screen",
+        )
     
     def review(
         self,
         response_text: str,
         response_type: str = "conversation",
         context_summary: str | None = None,
+        server_generated: bool = False,
     ) -> ComplianceResponse:
         """
         Review a response for compliance before sending to user.
@@ -96,28 +158,47 @@ class ComplianceAgent:
             response_text: The response to review
             response_type: Type of response (conversation, summary, visualization_intro)
             context_summary: Brief context for compliance check
+            server_generated: response_text is the orchestrator's own template text
+                (not LLM output), so it may be approved by the rule-based screen
         
         Returns:
             ComplianceResponse with approved status and compliant response
         """
-        prompt_template = self._load_prompt()
-        
-        prompt = prompt_template.format(
-            response_text=response_text,
-            response_type=response_type,
-            context_summary=context_summary or "General conversation",
-        )
-        
-        agent = self._ensure_agent(prompt)
-        
-        response = agent.run(
-            "Review this response for compliance. "
-            "If it violates any rules, rewrite it to be compliant while preserving the intent."
-        ).content
-        
+        prescreened = self._prescreen(response_text, server_generated)
+        if prescreened:
+            return prescreened
+        key = self._cache_key(response_text, response_type)
+        cached = self._cached(key)
+        if cached:
+            return cached
+        prompt = self._prepare(response_text, response_type, context_summary)
+        with self._agents.lease(prompt) as agent:
+            response = agent.run(self.RUN_MESSAGE).content
+        self._store(key, response)
+        return response
+    
+    async def areview(
+        self,
+        response_text: str,
+        response_type: str = "conversation",
+        context_summary: str | None = None,
+        server_generated: bool = False,
+    ) -> ComplianceResponse:
+        """Async variant of review() using Agno's arun (does not block the event loop)."""
+        prescreened = self._prescreen(response_text, server_generated)
+        if prescreened:
+            return prescreened
+        key = self._cache_key(response_text, response_type)
+        cached = await self._acached(key)
+        if cached:
+            return cached
+        prompt = self._prepare(response_text, response_type, context_summary)
+        with self._agents.lease(prompt) as agent:
+            response = (await agent.arun(self.RUN_MESSAGE)).content
+        await self._astore(key, response)
         return response
     
     def cleanup(self) -> None:
         """Clean up agent resources."""
-        self._agent = None
+        self._agents.clear()
 
@@ -16,15 +16,19 @@ It receives FULL context and REASONS about everything:
 """
 
 import json
-from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
-from agno.models.openai import OpenAIChat
+from agno.run.agent import RunContentEvent, RunOutput
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import shared_db
+from agents.llm_client import openai_chat
 from config import Config
+from services.context_compactor import compact_json, prompt_report, schema_format_note
+from services.prompt_registry import PROMPTS
+from services.response_streaming import JsonStringFieldStream, parse_json_model
 
 
 class GoalCandidate(BaseModel):
@@ -176,32 +180,35 @@ class ConversationAgent:
     - Uses SqliteDb for persistent memory across sessions
     """
     
+    RUN_MESSAGE = (
+        "Analyze the user's message in full context. "
+        "Determine intent, detect goals, identify information gaps, and generate an appropriate response. "
+        "Remember: You are Vecta - warm but direct, person-first, one question at a time."
+    )
+    
     def __init__(self, model_id: str | None = None, session_id: str | None = None):
         """Initialize ConversationAgent with model and optional session_id for persistence."""
         self.model_id = model_id or Config.MODEL_ID
         self.session_id = session_id
         self._agent: Agent | None = None
-        self._prompt_template: str | None = None
         self._db: SqliteDb | None = None
     
     def _load_prompt(self) -> str:
-        """Load prompt template from file."""
-        if self._prompt_template is None:
-            prompt_path = Path(__file__).parent.parent / "prompts" / "conversation_agent_prompt.txt"
-            self._prompt_template = prompt_path.read_text()
-        return self._prompt_template
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["conversation_agent_prompt"].text
     
     def _get_db(self) -> SqliteDb:
         """Get or create database connection for persistent memory."""
         if self._db is None:
-            self._db = SqliteDb(db_file=Config.get_db_path("conversation_agent.db"))
+            # One connection pool per file, shared by every session in the process
+            self._db = shared_db("conversation_agent.db")
         return self._db
     
     def _ensure_agent(self, instructions: str) -> Agent:
         """Ensure a single agent instance is reused for performance."""
         if not self._agent:
             self._agent = Agent(
-                model=OpenAIChat(id=self.model_id),
+                model=openai_chat(self.model_id),
                 instructions=instructions,
                 output_schema=ConversationResponse,
                 db=self._get_db(),                # Persistent storage for cross-session memory
@@ -247,7 +254,7 @@ class ConversationAgent:
         
         return "\n".join(summary_parts) if summary_parts else "No data collected yet."
     
-    def process(
+    def _prepare(
         self,
         user_message: str,
         graph_snapshot: dict[str, Any],
@@ -257,7 +264,7 @@ class ConversationAgent:
         visited_nodes: list[str],
         omitted_nodes: list[str],
         pending_nodes: list[str],
-        all_node_schemas: dict[str, Any],
+        all_node_schemas: dict[str, Any] | str,
         field_history: dict[str, Any] | None = None,
         last_question: str | None = None,
         last_question_node: str | None = None,
@@ -265,12 +272,9 @@ class ConversationAgent:
         current_node_being_collected: str | None = None,
         current_node_missing_fields: list[str] | None = None,
         asked_questions: dict[str, list[str]] | None = None,
-    ) -> ConversationResponse:
+    ) -> Agent:
         """
-        Process user message with full context.
-        
-        This is the main entry point - receives everything and reasons about
-        what to do next.
+        Render the conversation prompt with full context.
         
         Note: Conversation history is automatically managed by Agno's 
         add_history_to_context feature - no need to pass it manually.
@@ -284,7 +288,7 @@ class ConversationAgent:
             visited_nodes: Nodes with complete data
             omitted_nodes: Nodes skipped/irrelevant
             pending_nodes: Nodes not yet visited
-            all_node_schemas: Schema definitions for all nodes
+            all_node_schemas: Schema definitions for all nodes (dict or pre-serialized JSON)
             field_history: History of field changes (optional)
             last_question: The question we just asked (if any)
             last_question_node: Which node the last question targeted
@@ -304,38 +308,96 @@ class ConversationAgent:
                     parts.append(f"{node}: [{', '.join(fields)}]")
             asked_questions_formatted = "; ".join(parts) if parts else "None"
         
+        if isinstance(all_node_schemas, str):
+            schemas_formatted = all_node_schemas
+        else:
+            schemas_formatted = json.dumps(all_node_schemas, indent=2)
+        if Config.PROMPT_COMPACTION_ENABLED:
+            snapshot_formatted = compact_json(graph_snapshot)
+            goal_state_formatted = compact_json(goal_state)
+        else:
+            snapshot_formatted = json.dumps(graph_snapshot, indent=2)
+            goal_state_formatted = json.dumps(goal_state, indent=2)
+        
         # Build the prompt with all context
         # Note: Conversation history is automatically added by Agno via add_history_to_context
         prompt = prompt_template.format(
             user_message=user_message,
             current_node_being_collected=current_node_being_collected or "None",
             goal_intake_complete="true" if goal_intake_complete else "false",
-            graph_snapshot=json.dumps(graph_snapshot, indent=2),
+            graph_snapshot=snapshot_formatted,
             data_summary=data_summary,
-            goal_state=json.dumps(goal_state, indent=2),
+            goal_state=goal_state_formatted,
             qualified_goals_list=", ".join(qualified_goals.keys()) if qualified_goals else "None",
             possible_goals_list=", ".join(possible_goals.keys()) if possible_goals else "None",
             rejected_goals_list=", ".join(rejected_goals) if rejected_goals else "None",
             visited_nodes=", ".join(visited_nodes) if visited_nodes else "None",
             omitted_nodes=", ".join(omitted_nodes) if omitted_nodes else "None",
             pending_nodes=", ".join(pending_nodes) if pending_nodes else "None",
-            all_node_schemas=json.dumps(all_node_schemas, indent=2),
+            all_node_schemas=schemas_formatted,
+            schema_format_note=schema_format_note(),
             last_question=last_question or "None",
             last_question_node=last_question_node or "None",
             current_node_missing_fields=", ".join(current_node_missing_fields) if current_node_missing_fields else "None",
             asked_questions=asked_questions_formatted,
         )
+        # Record prompt token metrics (see services.context_compactor)
+        prompt_report(
+            "conversation",
+            prompt,
+            {
+                "template": prompt_template,
+                "all_node_schemas": schemas_formatted,
+                "graph_snapshot": snapshot_formatted,
+                "data_summary": data_summary,
+                "goal_state": goal_state_formatted,
+            },
+        )
         
-        agent = self._ensure_agent(prompt)
+        return self._ensure_agent(prompt)
+    
+    def process(self, user_message: str, **context: Any) -> ConversationResponse:
+        """
+        Process user message with full context.
         
-        # Run the agent
-        response = agent.run(
-            "Analyze the user's message in full context. "
-            "Determine intent, detect goals, identify information gaps, and generate an appropriate response. "
-            "Remember: You are Vecta - warm but direct, person-first, one question at a time."
-        ).content
+        This is the main entry point - receives everything and reasons about
+        what to do next. See _prepare() for the accepted context keys.
+        """
+        agent = self._prepare(user_message=user_message, **context)
+        return agent.run(self.RUN_MESSAGE).content
+    
+    async def aprocess(self, user_message: str, **context: Any) -> ConversationResponse:
+        """Async variant of process() using Agno's arun."""
+        agent = self._prepare(user_message=user_message, **context)
+        return (await agent.arun(self.RUN_MESSAGE)).content
+    
+    async def astream(
+        self,
+        user_message: str,
+        on_text: Callable[[str], Awaitable[None]],
+        **context: Any,
+    ) -> ConversationResponse:
+        """
+        Streaming variant of aprocess(): on_text receives response_text as it is generated.
         
-        return response
+        Agno only parses complete structured outputs, so the streamed run keeps the raw
+        JSON text and it is validated locally once the stream ends.
+        """
+        agent = self._prepare(user_message=user_message, **context)
+        text_stream = JsonStringFieldStream("response_text")
+        raw = ""
+        agent.parse_response = False
+        try:
+            async for event in agent.arun(self.RUN_MESSAGE, stream=True, yield_run_output=True):
+                if isinstance(event, RunOutput):
+                    raw = event.content if isinstance(event.content, str) else raw
+                elif isinstance(event, RunContentEvent) and isinstance(event.content, str):
+                    delta = text_stream.feed(event.content)
+                    if delta:
+                        await on_text(delta)
+        finally:
+            agent.parse_response = True
+        return parse_json_model(ConversationResponse, raw)
     
     def cleanup(self) -> None:
         """Clean up agent resources."""
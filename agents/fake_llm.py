@@ -0,0 +1,377 @@
+"""
+Fake LLM backend - Offline stand-in for the OpenAI chat completions API.
+
+With Config.LLM_BACKEND="fake" the shared HTTP clients in agents.llm_client are
+built on FakeLLMTransport instead of the network, so every agent still runs its
+real Agno / OpenAI SDK code path (prompt rendering, JSON parsing, streaming) and
+only the provider round-trip is replaced:
+- the requested response model is identified from the request (the
+  response_format json_schema name, or the <json_fields> list Agno adds to the
+  system message in JSON mode)
+- the canned JSON for that model is returned after Config.FAKE_LLM_LATENCY_MS,
+  streamed as SSE chunks (Config.FAKE_LLM_CHUNK_LATENCY_MS apart) for stream=True
+- per-model responses can be scripted with FAKE_LLM.script() (a fixed dict, a
+  list cycled through, or a callable taking the FakeRequest)
+
+Benchmarks use it to separate orchestrator overhead from provider latency.
+"""
+
+import asyncio
+import itertools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import httpx
+
+from config import Config
+from services.context_compactor import estimate_tokens
+from services.metrics import metrics
+
+_JSON_FIELDS = re.compile(r"<json_fields>\s*(\[.*?\])\s*</json_fields>", re.DOTALL)
+# Reviewed text at the end of the compliance prompt (before Agno's JSON instructions)
+_REVIEWED_TEXT = re.compile(r"Response Text:\n(.*?)\s*(?:Provide your output as a JSON|$)", re.DOTALL)
+_CHUNK_CHARS = 16
+
+
+class LatencyTally:
+    """Running total of injected latency (calls may complete on several threads)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._seconds += seconds
+
+    @property
+    def seconds(self) -> float:
+        with self._lock:
+            return self._seconds
+
+
+# Per-context accumulator for injected latency (see FakeLLM.tally())
+_tally: ContextVar[LatencyTally | None] = ContextVar("fake_llm_tally", default=None)
+
+# Canned outputs by response model name (valid, minimal, plain data-gathering turn)
+DEFAULT_RESPONSES: dict[str, dict[str, Any]] = {
+    "StateResolverResponse": {
+        "updates": [],
+        "answer_consumed_for_current_node": True,
+        "priority_shift": [],
+        "conflicts_detected": False,
+        "reasoning": "fake",
+    },
+    "ConversationResponse": {
+        "detected_intent": "data_input",
+        "response_text": "Thanks. How old are you?",
+        "question_target_node": "Personal",
+        "question_target_field": "age",
+        "question_intent": "collect",
+        "needs_visualization": False,
+        "phase1_complete": False,
+        "goals_collection_complete": False,
+        "trigger_scenario_framing": False,
+        "reasoning": "fake",
+    },
+    "ComplianceResponse": {
+        "approved": True,
+        "compliant_response": None,  # None -> echo the reviewed text (see _compliance_echo)
+        "violations_found": [],
+        "changes_made": [],
+        "reasoning": "fake",
+    },
+    "CalculationResponse": {"calculations": [], "summary": "fake"},
+    "VisualizationCharts": {"calculation_type": None, "charts": [], "message": "fake"},
+    "ScenarioFramerResponse": {
+        "response_text": "Picture this scenario. Does that goal matter to you?",
+        "turn_number": 1,
+        "goal_confirmed": False,
+        "goal_rejected": False,
+        "should_continue": True,
+        "ready_for_confirmation": False,
+        "reasoning": "fake",
+    },
+    "GoalDetailsResponse": {
+        "question": "What target amount and timeframe are you aiming for?",
+        "extracted_details": {},
+        "missing_fields": [],
+        "done": True,
+        "reasoning": "fake",
+    },
+    "GoalInferenceResponse": {"inferred_goals": [], "trigger_scenario_framing": False, "reasoning": "fake"},
+    # Agno's own schema (agno.session.summary), requested by ConversationAgent's
+    # enable_session_summaries; not a model defined in this repo
+    "SessionSummaryResponse": {"summary": "fake session summary", "topics": []},
+}
+
+
+@dataclass
+class FakeRequest:
+    """One chat completions call seen by the fake backend."""
+
+    model_name: str | None  # response model, None if unrecognized
+    body: dict[str, Any]
+
+    @property
+    def messages(self) -> list[dict[str, Any]]:
+        return self.body.get("messages") or []
+
+    @property
+    def user_message(self) -> str:
+        for message in reversed(self.messages):
+            if message.get("role") == "user":
+                return str(message.get("content") or "")
+        return ""
+
+
+Responder = dict[str, Any] | list[dict[str, Any]] | Callable[[FakeRequest], dict[str, Any]]
+
+
+def _compliance_echo(request: FakeRequest, content: dict[str, Any]) -> dict[str, Any]:
+    """Approve the reviewed text unchanged unless a compliant_response was scripted."""
+    if content.get("compliant_response") is not None:
+        return content
+    for message in request.messages:
+        match = _REVIEWED_TEXT.search(str(message.get("content") or ""))
+        if match:
+            return {**content, "compliant_response": match.group(1)}
+    return {**content, "compliant_response": request.user_message}
+
+
+@dataclass
+class FakeLLM:
+    """Canned responses, injected latency and per-model call statistics."""
+
+    latency_ms: float = 0.0
+    chunk_latency_ms: float = 0.0
+    responses: dict[str, Responder] = field(default_factory=lambda: dict(DEFAULT_RESPONSES))
+    calls: dict[str, int] = field(default_factory=dict)
+    injected_seconds: dict[str, float] = field(default_factory=dict)
+    _cycles: dict[str, Iterator[dict[str, Any]]] = field(default_factory=dict, repr=False)
+    _fields_index: dict[frozenset[str], str] | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_config(cls) -> "FakeLLM":
+        return cls(latency_ms=Config.FAKE_LLM_LATENCY_MS, chunk_latency_ms=Config.FAKE_LLM_CHUNK_LATENCY_MS)
+
+    def script(self, model_name: str, responder: Responder) -> None:
+        """Set the output for one response model (dict, list cycled per call, or callable)."""
+        with self._lock:
+            self.responses[model_name] = responder
+            self._cycles.pop(model_name, None)
+
+    def reset(self) -> None:
+        """Restore the default responses and clear statistics."""
+        with self._lock:
+            self.responses = dict(DEFAULT_RESPONSES)
+            self._cycles.clear()
+            self.calls.clear()
+            self.injected_seconds.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Calls and injected latency per response model."""
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "injected_seconds": {k: round(v, 6) for k, v in self.injected_seconds.items()},
+            }
+
+    def identify(self, body: dict[str, Any]) -> str | None:
+        """Response model name requested by a chat completions body."""
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            return (response_format.get("json_schema") or {}).get("name")
+        for message in body.get("messages") or []:
+            match = _JSON_FIELDS.search(str(message.get("content") or ""))
+            if match:
+                try:
+                    fields = frozenset(json.loads(match.group(1)))
+                except ValueError:
+                    return None
+                return self._index().get(fields)
+        return None
+
+    def _index(self) -> dict[frozenset[str], str]:
+        if self._fields_index is None:
+            # Imported lazily: the agent modules import agents.llm_client, which imports this module
+            from agents.calculation_agent import CalculationResponse
+            from agents.compliance_agent import ComplianceResponse
+            from agents.conversation_agent import ConversationResponse
+            from agents.goal_details_agent import GoalDetailsResponse
+            from agents.goal_inference_agent import GoalInferenceResponse
+            from agents.scenario_framer_agent import ScenarioFramerResponse
+            from agents.state_resolver_agent import StateResolverResponse
+            from agents.visualization_agent import VisualizationCharts
+
+            self._fields_index = {
+                frozenset(model.model_fields): model.__name__
+                for model in (
+                    CalculationResponse, ComplianceResponse, ConversationResponse, GoalDetailsResponse,
+                    GoalInferenceResponse, ScenarioFramerResponse, StateResolverResponse, VisualizationCharts,
+                )
+            }
+        return self._fields_index
+
+    def complete(self, body: dict[str, Any]) -> tuple[str, str]:
+        """Return (response model name, JSON content) for a request and record the call."""
+        name = self.identify(body)
+        request = FakeRequest(model_name=name, body=body)
+        with self._lock:
+            responder = self.responses.get(name or "", {})
+            if isinstance(responder, list):
+                cycle = self._cycles.setdefault(name or "", itertools.cycle(responder or [{}]))
+                content = next(cycle)
+            elif callable(responder):
+                content = None
+            else:
+                content = responder
+            key = name or "unknown"
+            self.calls[key] = self.calls.get(key, 0) + 1
+        if content is None:
+            content = responder(request)
+        if name == "ComplianceResponse":
+            content = _compliance_echo(request, content)
+        metrics.inc("fake_llm.calls")
+        return key, json.dumps(content)
+
+    def record_latency(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.injected_seconds[name] = self.injected_seconds.get(name, 0.0) + seconds
+        tally = _tally.get()
+        if tally is not None:
+            tally.add(seconds)
+
+    @contextmanager
+    def tally(self) -> Iterator[LatencyTally]:
+        """
+        Sum the latency injected into calls made from this context (and tasks it starts).
+
+        Open it inside the coroutine being measured: code run through another event
+        loop (e.g. the sync wrappers' _run_sync) does not see the caller's context.
+        Unlike stats(), the total is not mixed with concurrent sessions.
+        """
+        tally = LatencyTally()
+        token = _tally.set(tally)
+        try:
+            yield tally
+        finally:
+            _tally.reset(token)
+
+
+FAKE_LLM = FakeLLM.from_config()
+
+
+def _usage(body: dict[str, Any], content: str) -> dict[str, int]:
+    prompt_tokens = sum(estimate_tokens(str(m.get("content") or "")) for m in body.get("messages") or [])
+    completion_tokens = estimate_tokens(content)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _completion(body: dict[str, Any], content: str) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "fake"),
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": _usage(body, content),
+    }
+
+
+def _sse_events(body: dict[str, Any], content: str) -> list[bytes]:
+    events = []
+    for i in range(0, len(content), _CHUNK_CHARS):
+        chunk = {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{"index": 0, "delta": {"content": content[i:i + _CHUNK_CHARS]}, "finish_reason": None}],
+        }
+        events.append(f"data: {json.dumps(chunk)}\n\n".encode())
+    if (body.get("stream_options") or {}).get("include_usage"):
+        chunk = {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [],
+            "usage": _usage(body, content),
+        }
+        events.append(f"data: {json.dumps(chunk)}\n\n".encode())
+    events.append(b"data: [DONE]\n\n")
+    return events
+
+
+class _SSEStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Server-sent events with an optional delay between chunks."""
+
+    def __init__(self, events: list[bytes], delay: float, on_delay: Callable[[float], None]):
+        self._events = events
+        self._delay = delay
+        self._on_delay = on_delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        for event in self._events:
+            if self._delay:
+                time.sleep(self._delay)
+                self._on_delay(self._delay)
+            yield event
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for event in self._events:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+                self._on_delay(self._delay)
+            yield event
+
+
+class FakeLLMTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport answering /chat/completions from a FakeLLM."""
+
+    def __init__(self, llm: FakeLLM = FAKE_LLM):
+        self.llm = llm
+
+    def _respond(self, request: httpx.Request) -> tuple[httpx.Response, str, float]:
+        if not request.url.path.endswith("/chat/completions"):
+            return httpx.Response(404, json={"error": {"message": f"fake backend: {request.url.path}"}}), "unknown", 0.0
+        body = json.loads(request.content or b"{}")
+        name, content = self.llm.complete(body)
+        delay = self.llm.latency_ms / 1000
+        if body.get("stream"):
+            chunk_delay = self.llm.chunk_latency_ms / 1000
+            stream = _SSEStream(
+                _sse_events(body, content),
+                chunk_delay,
+                lambda seconds: self.llm.record_latency(name, seconds),
+            )
+            response = httpx.Response(200, headers={"content-type": "text/event-stream"}, stream=stream)
+        else:
+            response = httpx.Response(200, json=_completion(body, content))
+        return response, name, delay
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, name, delay = self._respond(request)
+        if delay:
+            time.sleep(delay)
+            self.llm.record_latency(name, delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response, name, delay = self._respond(request)
+        if delay:
+            await asyncio.sleep(delay)
+            self.llm.record_latency(name, delay)
+        return response
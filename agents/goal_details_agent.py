@@ -5,15 +5,16 @@ This agent uses conversation history to track the goal details collection flow.
 """
 
 import json
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import shared_db
+from agents.llm_client import openai_chat
 from config import Config
+from services.prompt_registry import PROMPTS
 
 
 class GoalDetailsResponse(BaseModel):
@@ -27,28 +28,28 @@ class GoalDetailsResponse(BaseModel):
 
 
 class GoalDetailsParserAgent:
+    RUN_MESSAGE = "Collect goal details. Output JSON only."
+
     def __init__(self, model_id: str | None = None, session_id: str | None = None):
         self.model_id = model_id or Config.MODEL_ID
         self.session_id = session_id
         self._agent: Agent | None = None
-        self._prompt_template: str | None = None
         self._db: SqliteDb | None = None
 
     def _load_prompt(self) -> str:
-        if self._prompt_template is None:
-            prompt_path = Path(__file__).parent.parent / "prompts" / "goal_details_prompt.txt"
-            self._prompt_template = prompt_path.read_text()
-        return self._prompt_template
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["goal_details_prompt"].text
 
     def _get_db(self) -> SqliteDb:
         if self._db is None:
-            self._db = SqliteDb(db_file=Config.get_db_path("goal_details_agent.db"))
+            # One connection pool per file, shared by every session in the process
+            self._db = shared_db("goal_details_agent.db")
         return self._db
 
     def _ensure_agent(self, instructions: str) -> Agent:
         if not self._agent:
             self._agent = Agent(
-                model=OpenAIChat(id=self.model_id),
+                model=openai_chat(self.model_id),
                 instructions=instructions,
                 output_schema=GoalDetailsResponse,
                 db=self._get_db(),
@@ -63,22 +64,42 @@ class GoalDetailsParserAgent:
             self._agent.instructions = instructions
         return self._agent
 
-    def run(
+    def _prepare(
         self,
-        *,
         goal: dict[str, Any],
         goal_state: dict[str, Any],
         graph_snapshot: dict[str, Any],
         user_message: str,
-    ) -> GoalDetailsResponse:
+    ) -> Agent:
         prompt = self._load_prompt().format(
             goal=json.dumps(goal, indent=2),
             goal_state=json.dumps(goal_state, indent=2),
             graph_snapshot=json.dumps(graph_snapshot, indent=2),
             user_message=user_message,
         )
-        agent = self._ensure_agent(prompt)
-        return agent.run("Collect goal details. Output JSON only.").content
+        return self._ensure_agent(prompt)
+
+    def run(
+        self,
+        *,
+        goal: dict[str, Any],
+        goal_state: dict[str, Any],
+        graph_snapshot: dict[str, Any],
+        user_message: str,
+    ) -> GoalDetailsResponse:
+        agent = self._prepare(goal, goal_state, graph_snapshot, user_message)
+        return agent.run(self.RUN_MESSAGE).content
+
+    async def arun(
+        self,
+        *,
+        goal: dict[str, Any],
+        goal_state: dict[str, Any],
+        graph_snapshot: dict[str, Any],
+        user_message: str,
+    ) -> GoalDetailsResponse:
+        agent = self._prepare(goal, goal_state, graph_snapshot, user_message)
+        return (await agent.arun(self.RUN_MESSAGE)).content
 
     def cleanup(self) -> None:
         self._agent = None
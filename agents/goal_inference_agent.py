@@ -9,15 +9,16 @@ Inputs are intentionally constrained for debuggability:
 """
 
 import json
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import shared_db
+from agents.llm_client import openai_chat
 from config import Config
+from services.prompt_registry import PROMPTS
 
 
 class InferredGoal(BaseModel):
@@ -48,28 +49,28 @@ class GoalInferenceResponse(BaseModel):
 class GoalInferenceAgent:
     """Runs goal inference on completed node snapshots only."""
 
+    RUN_MESSAGE = "Infer any financial goals from the visited node data. Output JSON only."
+
     def __init__(self, model_id: str | None = None, session_id: str | None = None):
         self.model_id = model_id or Config.MODEL_ID
         self.session_id = session_id
         self._agent: Agent | None = None
-        self._prompt_template: str | None = None
         self._db: SqliteDb | None = None
 
     def _load_prompt(self) -> str:
-        if self._prompt_template is None:
-            prompt_path = Path(__file__).parent.parent / "prompts" / "goal_inference_prompt.txt"
-            self._prompt_template = prompt_path.read_text()
-        return self._prompt_template
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["goal_inference_prompt"].text
 
     def _get_db(self) -> SqliteDb:
         if self._db is None:
-            self._db = SqliteDb(db_file=Config.get_db_path("goal_inference_agent.db"))
+            # One connection pool per file, shared by every session in the process
+            self._db = shared_db("goal_inference_agent.db")
         return self._db
 
     def _ensure_agent(self, instructions: str) -> Agent:
         if not self._agent:
             self._agent = Agent(
-                model=OpenAIChat(id=self.model_id),
+                model=openai_chat(self.model_id),
                 instructions=instructions,
                 output_schema=GoalInferenceResponse,
                 db=self._get_db(),
@@ -84,6 +85,20 @@ class GoalInferenceAgent:
             self._agent.instructions = instructions
         return self._agent
 
+    def _prepare(
+        self,
+        visited_node_snapshots: dict[str, dict[str, Any]],
+        goal_state: dict[str, Any],
+        goal_type_enum_values: list[str],
+    ) -> Agent:
+        prompt_template = self._load_prompt()
+        prompt = prompt_template.format(
+            goal_type_enum_values=json.dumps(goal_type_enum_values, indent=2),
+            visited_node_snapshots=json.dumps(visited_node_snapshots, indent=2),
+            goal_state=json.dumps(goal_state, indent=2),
+        )
+        return self._ensure_agent(prompt)
+
     def infer(
         self,
         visited_node_snapshots: dict[str, dict[str, Any]],
@@ -98,16 +113,18 @@ class GoalInferenceAgent:
             goal_state: {qualified_goals, possible_goals, rejected_goals} for dedupe
             goal_type_enum_values: Allowed goal types (strings)
         """
-        prompt_template = self._load_prompt()
-        prompt = prompt_template.format(
-            goal_type_enum_values=json.dumps(goal_type_enum_values, indent=2),
-            visited_node_snapshots=json.dumps(visited_node_snapshots, indent=2),
-            goal_state=json.dumps(goal_state, indent=2),
-        )
-        agent = self._ensure_agent(prompt)
-        return agent.run(
-            "Infer any financial goals from the visited node data. Output JSON only."
-        ).content
+        agent = self._prepare(visited_node_snapshots, goal_state, goal_type_enum_values)
+        return agent.run(self.RUN_MESSAGE).content
+
+    async def ainfer(
+        self,
+        visited_node_snapshots: dict[str, dict[str, Any]],
+        goal_state: dict[str, Any],
+        goal_type_enum_values: list[str],
+    ) -> GoalInferenceResponse:
+        """Async variant of infer() using Agno's arun."""
+        agent = self._prepare(visited_node_snapshots, goal_state, goal_type_enum_values)
+        return (await agent.arun(self.RUN_MESSAGE)).content
 
     def cleanup(self) -> None:
         self._agent = None
@@ -0,0 +1,157 @@
+"""
+LLM client - Process-wide pooled HTTP transport for OpenAI models.
+
+Every OpenAIChat normally builds its own OpenAI SDK client with a private
+httpx connection pool, so each agent (and each session) pays for its own TCP/TLS
+handshakes. PooledOpenAIChat routes all agents through one shared pool:
+- one httpx.Client for sync run() calls
+- one httpx.AsyncClient per event loop for arun() calls (httpx async
+  connections cannot be shared across loops)
+- limits / keep-alive / HTTP/2 from Config.OPENAI_HTTP_*
+
+With Config.LLM_BACKEND="fake" both clients use agents.fake_llm's offline
+transport instead of the network.
+
+Every request and its reported token usage are recorded in services.tracing
+(per turn / per stage) and services.metrics.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+
+import httpx
+from agno.models.openai import OpenAIChat
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from agents.fake_llm import FakeLLMTransport
+from config import Config
+from services.metrics import metrics
+from services.tracing import record_llm_call, record_llm_usage
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_sync_client: httpx.Client | None = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_fallback_async_client: httpx.AsyncClient | None = None
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 only when configured and the h2 package is available."""
+    if not Config.OPENAI_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("OPENAI_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def _fake_backend() -> bool:
+    return Config.LLM_BACKEND == "fake"
+
+
+def _on_request(request: httpx.Request) -> None:
+    record_llm_call()
+
+
+async def _aon_request(request: httpx.Request) -> None:
+    record_llm_call()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=Config.OPENAI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.OPENAI_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=Config.OPENAI_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Shared sync HTTP client (created on first use)."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            if _fake_backend():
+                _sync_client = DefaultHttpxClient(transport=FakeLLMTransport())
+            else:
+                _sync_client = DefaultHttpxClient(limits=_limits(), http2=_http2_enabled())
+            _sync_client.event_hooks["request"].append(_on_request)
+            metrics.inc("llm.http_clients_created")
+        return _sync_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Shared async HTTP client for the running event loop (created on first use)."""
+    global _fallback_async_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _lock:
+        client = _async_clients.get(loop) if loop else _fallback_async_client
+        if client is None or client.is_closed:
+            if _fake_backend():
+                client = DefaultAsyncHttpxClient(transport=FakeLLMTransport())
+            else:
+                client = DefaultAsyncHttpxClient(limits=_limits(), http2=_http2_enabled())
+            client.event_hooks["request"].append(_aon_request)
+            metrics.inc("llm.http_clients_created")
+            if loop:
+                _async_clients[loop] = client
+            else:
+                _fallback_async_client = client
+        return client
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared clients (server shutdown)."""
+    global _sync_client, _fallback_async_client
+    with _lock:
+        sync_client, _sync_client = _sync_client, None
+        async_clients = list(_async_clients.values())
+        _async_clients.clear()
+        if _fallback_async_client is not None:
+            async_clients.append(_fallback_async_client)
+            _fallback_async_client = None
+    if sync_client is not None:
+        sync_client.close()
+    for client in async_clients:
+        await client.aclose()
+
+
+class PooledOpenAIChat(OpenAIChat):
+    """OpenAIChat whose SDK clients use the process-wide pooled HTTP transport."""
+
+    def get_client(self) -> OpenAI:
+        if self.client is not None and not self.client.is_closed():
+            return self.client
+        self.client = OpenAI(**self._get_client_params(), http_client=get_http_client())
+        return self.client
+
+    def get_async_client(self) -> AsyncOpenAI:
+        http_client = get_async_http_client()
+        # Rebuild when the cached SDK client is bound to another loop's transport
+        if (
+            self.async_client is not None
+            and not self.async_client.is_closed()
+            and self.async_client._client is http_client
+        ):
+            return self.async_client
+        self.async_client = AsyncOpenAI(**self._get_client_params(), http_client=http_client)
+        return self.async_client
+
+    def _get_metrics(self, response_usage):
+        usage = super()._get_metrics(response_usage)
+        record_llm_usage(usage.input_tokens or 0, usage.output_tokens or 0)
+        return usage
+
+
+def openai_chat(model_id: str) -> OpenAIChat:
+    """Build the model object for an agent (shared HTTP pool)."""
+    if _fake_backend():
+        return PooledOpenAIChat(id=model_id, api_key="fake")
+    return PooledOpenAIChat(id=model_id)
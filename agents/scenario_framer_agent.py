@@ -13,15 +13,16 @@ Key principles:
 """
 
 import json
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import shared_db
+from agents.llm_client import openai_chat
 from config import Config
+from services.prompt_registry import PROMPTS
 
 
 class ScenarioFramerResponse(BaseModel):
@@ -83,32 +84,38 @@ class ScenarioFramerAgent:
     
     MAX_TURNS = 2
     
+    PROCESS_MESSAGE = (
+        "Analyze the user's response and generate the next turn in the scenario conversation. "
+        "Help them emotionally realize the importance of this goal through reflection, not persuasion."
+    )
+    START_MESSAGE = (
+        "Generate the initial scenario question to help the user emotionally realize "
+        "the importance of this goal. Use their actual financial data to make it personal."
+    )
+    
     def __init__(self, model_id: str | None = None, session_id: str | None = None):
         """Initialize ScenarioFramerAgent with model."""
         self.model_id = model_id or Config.MODEL_ID
         self.session_id = session_id
         self._agent: Agent | None = None
-        self._prompt_template: str | None = None
         self._db: SqliteDb | None = None
     
     def _load_prompt(self) -> str:
-        """Load prompt template from file."""
-        if self._prompt_template is None:
-            prompt_path = Path(__file__).parent.parent / "prompts" / "scenario_framer_prompt.txt"
-            self._prompt_template = prompt_path.read_text()
-        return self._prompt_template
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["scenario_framer_prompt"].text
     
     def _get_db(self) -> SqliteDb:
         """Get or create database connection for scenario framing history."""
         if self._db is None:
-            self._db = SqliteDb(db_file=Config.get_db_path("scenario_framer_agent.db"))
+            # One connection pool per file, shared by every session in the process
+            self._db = shared_db("scenario_framer_agent.db")
         return self._db
     
     def _ensure_agent(self, instructions: str) -> Agent:
         """Ensure a single agent instance is reused for performance."""
         if not self._agent:
             self._agent = Agent(
-                model=OpenAIChat(id=self.model_id),
+                model=openai_chat(self.model_id),
                 instructions=instructions,
                 output_schema=ScenarioFramerResponse,
                 db=self._get_db(),
@@ -196,24 +203,15 @@ class ScenarioFramerAgent:
         
         return "\n".join(summary_parts) if summary_parts else "Limited financial data available"
     
-    def process(
+    def _prepare_process(
         self,
         user_message: str,
         goal_candidate: dict[str, Any],
         graph_snapshot: dict[str, Any],
-        current_turn: int = 1,
-        scenario_history: list[dict[str, str]] | None = None,
-    ) -> ScenarioFramerResponse:
-        """
-        Process user message in scenario framing context.
-        
-        Args:
-            user_message: What the user just said
-            goal_candidate: The inferred goal being framed (goal_id, description, confidence, deduced_from)
-            graph_snapshot: All collected financial data
-            current_turn: Which turn we're on (1-3)
-            scenario_history: Previous turns in this scenario conversation
-        """
+        current_turn: int,
+        scenario_history: list[dict[str, str]] | None,
+    ) -> Agent:
+        """Render the prompt for a follow-up scenario turn."""
         prompt_template = self._load_prompt()
         
         # Build financial context summary
@@ -243,34 +241,14 @@ class ScenarioFramerAgent:
             scenario_history=history_str,
         )
         
-        agent = self._ensure_agent(prompt)
-        
-        # Run the agent
-        response = agent.run(
-            "Analyze the user's response and generate the next turn in the scenario conversation. "
-            "Help them emotionally realize the importance of this goal through reflection, not persuasion."
-        ).content
-        
-        # Ensure goal_id is set
-        if not response.goal_id:
-            response.goal_id = goal_candidate.get("goal_id", "unknown")
-        
-        return response
+        return self._ensure_agent(prompt)
     
-    def start_scenario(
+    def _prepare_start(
         self,
         goal_candidate: dict[str, Any],
         graph_snapshot: dict[str, Any],
-    ) -> ScenarioFramerResponse:
-        """
-        Start a new scenario framing conversation.
-        
-        This generates the initial scenario question without user input.
-        
-        Args:
-            goal_candidate: The inferred goal to frame
-            graph_snapshot: All collected financial data
-        """
+    ) -> Agent:
+        """Render the prompt for the opening scenario question."""
         prompt_template = self._load_prompt()
         
         # Build financial context summary
@@ -290,20 +268,81 @@ class ScenarioFramerAgent:
             scenario_history="None (first turn)",
         )
         
-        agent = self._ensure_agent(prompt)
-        
-        # Run the agent
-        response = agent.run(
-            "Generate the initial scenario question to help the user emotionally realize "
-            "the importance of this goal. Use their actual financial data to make it personal."
-        ).content
-        
-        # Ensure goal_id is set
+        return self._ensure_agent(prompt)
+    
+    def _finalize(
+        self,
+        response: ScenarioFramerResponse,
+        goal_candidate: dict[str, Any],
+    ) -> ScenarioFramerResponse:
+        """Ensure goal_id is set on the agent response."""
         if not response.goal_id:
             response.goal_id = goal_candidate.get("goal_id", "unknown")
-        
         return response
     
+    def process(
+        self,
+        user_message: str,
+        goal_candidate: dict[str, Any],
+        graph_snapshot: dict[str, Any],
+        current_turn: int = 1,
+        scenario_history: list[dict[str, str]] | None = None,
+    ) -> ScenarioFramerResponse:
+        """
+        Process user message in scenario framing context.
+        
+        Args:
+            user_message: What the user just said
+            goal_candidate: The inferred goal being framed (goal_id, description, confidence, deduced_from)
+            graph_snapshot: All collected financial data
+            current_turn: Which turn we're on (1-3)
+            scenario_history: Previous turns in this scenario conversation
+        """
+        agent = self._prepare_process(user_message, goal_candidate, graph_snapshot, current_turn, scenario_history)
+        response = agent.run(self.PROCESS_MESSAGE).content
+        return self._finalize(response, goal_candidate)
+    
+    async def aprocess(
+        self,
+        user_message: str,
+        goal_candidate: dict[str, Any],
+        graph_snapshot: dict[str, Any],
+        current_turn: int = 1,
+        scenario_history: list[dict[str, str]] | None = None,
+    ) -> ScenarioFramerResponse:
+        """Async variant of process() using Agno's arun."""
+        agent = self._prepare_process(user_message, goal_candidate, graph_snapshot, current_turn, scenario_history)
+        response = (await agent.arun(self.PROCESS_MESSAGE)).content
+        return self._finalize(response, goal_candidate)
+    
+    def start_scenario(
+        self,
+        goal_candidate: dict[str, Any],
+        graph_snapshot: dict[str, Any],
+    ) -> ScenarioFramerResponse:
+        """
+        Start a new scenario framing conversation.
+        
+        This generates the initial scenario question without user input.
+        
+        Args:
+            goal_candidate: The inferred goal to frame
+            graph_snapshot: All collected financial data
+        """
+        agent = self._prepare_start(goal_candidate, graph_snapshot)
+        response = agent.run(self.START_MESSAGE).content
+        return self._finalize(response, goal_candidate)
+    
+    async def astart_scenario(
+        self,
+        goal_candidate: dict[str, Any],
+        graph_snapshot: dict[str, Any],
+    ) -> ScenarioFramerResponse:
+        """Async variant of start_scenario() using Agno's arun."""
+        agent = self._prepare_start(goal_candidate, graph_snapshot)
+        response = (await agent.arun(self.START_MESSAGE)).content
+        return self._finalize(response, goal_candidate)
+    
     def cleanup(self) -> None:
         """Clean up agent resources."""
         self._agent = None
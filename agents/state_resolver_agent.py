@@ -10,16 +10,18 @@ This agent intercepts every user reply to:
 """
 
 import json
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import AgentLease
+from agents.llm_client import openai_chat
 from config import Config
 from memory.field_history import NodeUpdate
 from memory.graph_memory import GraphMemory
+from services.context_compactor import compact_json, prompt_report, schema_format_note
+from services.prompt_registry import PROMPTS
 
 
 class StateResolverResponse(BaseModel):
@@ -49,76 +51,110 @@ class StateResolverAgent:
     - Triggers replanning on major changes
     """
     
+    RUN_MESSAGE = "Analyze the user message and extract all facts."
+    
     def __init__(self, model_id: str | None = None):
         """Initialize StateResolverAgent with model."""
         self.model_id = model_id or Config.MODEL_ID
-        self._agent: Agent | None = None
+        # Shared across sessions (see agents.agent_pool): one Agent per in-flight run
+        self._agents = AgentLease(self._new_agent)
     
     def _load_prompt(self) -> str:
-        """Load prompt template from file."""
-        prompt_path = Path(__file__).parent.parent / "prompts" / "state_resolver_prompt.txt"
-        return prompt_path.read_text()
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["state_resolver_prompt"].text
     
-    def resolve_state(
+    def _prepare(
         self,
         user_reply: str,
         current_node: str,
         current_question: str | None,
         graph_memory: GraphMemory,
-        all_node_schemas: dict[str, dict[str, Any]],
-    ) -> StateResolverResponse:
-        """
-        Resolve state from user reply.
-        
-        Extracts facts, detects conflicts, maps to correct nodes.
-        
-        Args:
-            user_reply: User's message
-            current_node: Node currently being collected
-            current_question: Question just asked by InfoAgent
-            graph_memory: Current graph state
-            all_node_schemas: All available node schemas
-        
-        Returns:
-            StateResolverResponse with extracted updates and metadata
-        """
+        all_node_schemas: dict[str, dict[str, Any]] | str,
+    ) -> str:
+        """Render the state resolver prompt."""
         prompt_template = self._load_prompt()
         
-        # Format node schemas for prompt
-        schemas_formatted = json.dumps(all_node_schemas, indent=2)
+        # Format node schemas for prompt (pre-serialized JSON text is used as-is)
+        if isinstance(all_node_schemas, str):
+            schemas_formatted = all_node_schemas
+        else:
+            schemas_formatted = json.dumps(all_node_schemas, indent=2)
         
         # Format graph snapshot
-        graph_snapshot = json.dumps(graph_memory.get_all_nodes_data(), indent=2)
+        if Config.PROMPT_COMPACTION_ENABLED:
+            graph_snapshot = compact_json(graph_memory.get_all_nodes_data())
+        else:
+            graph_snapshot = json.dumps(graph_memory.get_all_nodes_data(), indent=2)
         
         # Format prompt
         prompt = prompt_template.format(
             current_node=current_node,
             current_question=current_question or "No question asked yet",
             all_node_schemas=schemas_formatted,
+            schema_format_note=schema_format_note(),
             graph_snapshot=graph_snapshot,
             user_reply=user_reply,
         )
+        # Record prompt token metrics (see services.context_compactor)
+        prompt_report(
+            "state_resolver",
+            prompt,
+            {"template": prompt_template, "all_node_schemas": schemas_formatted, "graph_snapshot": graph_snapshot},
+        )
+        return prompt
+    
+    def _new_agent(self, instructions: str) -> Agent:
+        """Create an Agno agent for the pool (instructions are replaced per run)."""
+        return Agent(
+            model=openai_chat(self.model_id),
+            instructions=instructions,
+            output_schema=StateResolverResponse,
+            markdown=False,
+            debug_mode=False,
+            use_json_mode=True,
+        )
+    
+    def resolve_state(
+        self,
+        user_reply: str,
+        current_node: str,
+        current_question: str | None,
+        graph_memory: GraphMemory,
+        all_node_schemas: dict[str, dict[str, Any]] | str,
+    ) -> StateResolverResponse:
+        """
+        Resolve state from user reply.
         
-        # Create agent if needed (reuse for efficiency)
-        if not self._agent:
-            self._agent = Agent(
-                model=OpenAIChat(id=self.model_id),
-                instructions=prompt,
-                output_schema=StateResolverResponse,
-                markdown=False,
-                debug_mode=False,
-                use_json_mode=True,
-            )
-        else:
-            # Update instructions with new context
-            self._agent.instructions = prompt
+        Extracts facts, detects conflicts, maps to correct nodes.
         
-        # Run agent
-        response = self._agent.run("Analyze the user message and extract all facts.").content
+        Args:
+            user_reply: User's message
+            current_node: Node currently being collected
+            current_question: Question just asked by InfoAgent
+            graph_memory: Current graph state
+            all_node_schemas: All available node schemas (dict or pre-serialized JSON)
         
-        return response
+        Returns:
+            StateResolverResponse with extracted updates and metadata
+        """
+        prompt = self._prepare(user_reply, current_node, current_question, graph_memory, all_node_schemas)
+        with self._agents.lease(prompt) as agent:
+            return agent.run(self.RUN_MESSAGE).content
+    
+    async def aresolve_state(
+        self,
+        user_reply: str,
+        current_node: str,
+        current_question: str | None,
+        graph_memory: GraphMemory,
+        all_node_schemas: dict[str, dict[str, Any]] | str,
+    ) -> StateResolverResponse:
+        """Async variant of resolve_state() using Agno's arun."""
+        prompt = self._prepare(user_reply, current_node, current_question, graph_memory, all_node_schemas)
+        with self._agents.lease(prompt) as agent:
+            return (await agent.arun(self.RUN_MESSAGE)).content
     
     def cleanup(self) -> None:
         """Clean up agent resources."""
-        self._agent = None
+        self._agents.clear()
 
@@ -32,6 +32,7 @@ class CalculationEngineTool:
             # Prune non-serializable callables if present.
             payload.pop("validator", None)
             payload.pop("calculator", None)
+            payload.pop("batch", None)
             out.append(payload)
         return out
 
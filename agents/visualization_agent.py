@@ -4,17 +4,21 @@ VisualizationAgent - Extracts calculation intent and inputs for visualization.
 This agent:
 - Uses GraphDataTool to access financial data
 - Renders charts from already-computed calculation inputs/results
+- Uses deterministic chart builders for known calculators; the LLM renderer
+  is only called for 'custom' or unregistered calculation types
 """
 
-from pathlib import Path
 from typing import Any
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from pydantic import BaseModel, Field
 
+from agents.agent_pool import AgentLease, shared_agent
+from agents.llm_client import openai_chat
 from config import Config
 from memory.graph_memory import GraphMemory
+from services.chart_builders import build_charts, has_chart_builder
+from services.prompt_registry import PROMPTS
 
 
 class GraphDataTool:
@@ -58,6 +62,44 @@ class VisualizationCharts(BaseModel):
     message: str | None = Field(default=None, description="Short explanation of what charts show")
 
 
+class ChartRenderer:
+    """
+    Session-independent LLM chart renderer (shared per model_id via agents.agent_pool).
+
+    Used only for calculation types without a deterministic chart builder.
+    """
+
+    def __init__(self, model_id: str | None = None):
+        """Initialize renderer with model."""
+        self.model_id = model_id or Config.MODEL_ID
+        self._agents = AgentLease(self._new_agent)
+
+    def _load_prompt(self) -> str:
+        """Prompt template (loaded once per process by the prompt registry)."""
+        return PROMPTS["visualization_agent_prompt"].text
+
+    def _new_agent(self, instructions: str) -> Agent:
+        """Create an Agno renderer agent for the pool."""
+        return Agent(
+            model=openai_chat(self.model_id),
+            instructions=instructions,
+            output_schema=VisualizationCharts,
+            markdown=False,
+            debug_mode=False,
+            use_json_mode=True,
+        )
+
+    def render(self, message: str) -> VisualizationCharts:
+        """Render charts for a calculation payload message."""
+        with self._agents.lease(self._load_prompt()) as agent:
+            return agent.run(message).content
+
+    async def arender(self, message: str) -> VisualizationCharts:
+        """Async variant of render()."""
+        with self._agents.lease(self._load_prompt()) as agent:
+            return (await agent.arun(message)).content
+
+
 class VisualizationAgent:
     """
     Agent for rendering charts from calculation outputs.
@@ -69,29 +111,10 @@ class VisualizationAgent:
         """Initialize VisualizationAgent with model and graph memory."""
         self.model_id = model_id or Config.MODEL_ID
         self.graph_memory = graph_memory
-        self._renderer_agent: Agent | None = None
-        self._renderer_prompt_template: str | None = None
-
-    def _load_renderer_prompt(self) -> str:
-        """Load renderer prompt template from file."""
-        prompt_path = Path(__file__).parent.parent / "prompts" / "visualization_agent_prompt.txt"
-        return prompt_path.read_text()
-
-    def get_renderer(self) -> Agent:
-        """Get or create renderer agent (reuse for performance)."""
-        if self._renderer_agent:
-            return self._renderer_agent
-
-        prompt_template = self._renderer_prompt_template or self._load_renderer_prompt()
-        self._renderer_agent = Agent(
-            model=OpenAIChat(id=self.model_id),
-            instructions=prompt_template,
-            output_schema=VisualizationCharts,
-            markdown=False,
-            debug_mode=False,
-            use_json_mode=True,
-        )
-        return self._renderer_agent
+
+    def get_renderer(self) -> ChartRenderer:
+        """Get the process-wide renderer for this model."""
+        return shared_agent(ChartRenderer, self.model_id)
 
     def generate_charts(
         self,
@@ -101,14 +124,48 @@ class VisualizationAgent:
         data_used: list[str] | None = None,
     ) -> VisualizationCharts:
         """Generate charts based on calculation outputs."""
+        if has_chart_builder(calculation_type):
+            return self._build_charts(calculation_type, inputs, result)
+        return self.get_renderer().render(self._render_message(calculation_type, inputs, result, data_used))
+
+    async def agenerate_charts(
+        self,
+        calculation_type: str,
+        inputs: dict[str, Any],
+        result: dict[str, Any],
+        data_used: list[str] | None = None,
+    ) -> VisualizationCharts:
+        """Async variant of generate_charts() using Agno's arun."""
+        if has_chart_builder(calculation_type):
+            return self._build_charts(calculation_type, inputs, result)
+        return await self.get_renderer().arender(self._render_message(calculation_type, inputs, result, data_used))
+
+    def _build_charts(
+        self,
+        calculation_type: str,
+        inputs: dict[str, Any],
+        result: dict[str, Any],
+    ) -> VisualizationCharts:
+        """Build charts for a known calculator without calling the LLM."""
+        charts = [ChartSpec(**chart) for chart in build_charts(calculation_type, inputs, result)]
+        message = charts[0].description if charts else "Not enough data to chart this calculation."
+        return VisualizationCharts(calculation_type=calculation_type, charts=charts, message=message)
+
+    def _render_message(
+        self,
+        calculation_type: str,
+        inputs: dict[str, Any],
+        result: dict[str, Any],
+        data_used: list[str] | None,
+    ) -> str:
+        """Build the renderer input message from calculation outputs."""
         payload = {
             "calculation_type": calculation_type,
             "inputs": inputs,
             "result": result,
             "data_used": data_used or [],
         }
-        renderer = self.get_renderer()
-        return renderer.run(f"CALCULATION_JSON: {payload}").content
+        return f"CALCULATION_JSON: {payload}"
     
     def update_graph_memory(self, graph_memory: GraphMemory) -> None:
         """Update graph memory and recreate agent with new tools."""
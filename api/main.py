@@ -2,16 +2,21 @@
 FastAPI application for Financial Life Graph.
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from api.schemas import SummaryResponse, FieldHistoryResponse
 from api.sessions import session_manager
 from api.websocket import websocket_handler
+from agents.llm_client import aclose_http_clients
 from config import Config
+from services.metrics import metrics
+from services.retirement_simulation import shutdown_pool
 
 # Validate configuration on startup
 Config.validate()
@@ -21,7 +26,11 @@ Config.validate()
 async def lifespan(app: FastAPI):
     """Startup/shutdown."""
     os.makedirs(Config.DB_DIR, exist_ok=True)
+    session_manager.start()
     yield
+    await session_manager.stop()
+    await aclose_http_clients()
+    await asyncio.to_thread(shutdown_pool)
 
 
 app = FastAPI(
@@ -54,7 +63,7 @@ async def websocket_existing_session(websocket: WebSocket, session_id: str):
 @app.get("/session/{session_id}/summary")
 async def get_summary(session_id: str) -> SummaryResponse:
     """Get summary of collected data (REST endpoint for convenience)."""
-    orchestrator = session_manager.get_session(session_id)
+    orchestrator = await session_manager.get_session(session_id)
     
     if not orchestrator:
         from fastapi import HTTPException
@@ -76,23 +85,14 @@ async def get_summary(session_id: str) -> SummaryResponse:
 @app.get("/session/{session_id}/history")
 async def get_field_history(session_id: str) -> FieldHistoryResponse:
     """Get field history for a session."""
-    orchestrator = session_manager.get_session(session_id)
+    orchestrator = await session_manager.get_session(session_id)
     
     if not orchestrator:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Serialize field history
-    field_history = {}
-    for node_name, fields in orchestrator.graph_memory.field_history.items():
-        field_history[node_name] = {}
-        for field_name, history_entries in fields.items():
-            field_history[node_name][field_name] = [
-                entry.model_dump() for entry in history_entries
-            ]
-    
     return FieldHistoryResponse(
-        field_history=field_history,
+        field_history=orchestrator.graph_memory.get_field_history_dict(),
         conflicts=orchestrator.graph_memory.conflicts,
     )
 
@@ -100,4 +100,13 @@ async def get_field_history(session_id: str) -> FieldHistoryResponse:
 @app.get("/health")
 async def health():
     """Health check."""
-    return {"status": "healthy"}
+    return {"status": "healthy", "sessions": session_manager.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> str:
+    """
+    Prometheus text exposition of process metrics: counters plus per-turn and
+    per-stage latency, LLM call and token histograms (services.tracing).
+    """
+    return metrics.to_prometheus()
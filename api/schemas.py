@@ -32,6 +32,17 @@ class WSQuestion(BaseModel):
     planned_target_node: str | None = None
     planned_target_field: str | None = None
     goal_state: dict[str, Any] | None = None
+    streamed: bool = False  # question_delta frames preceded this message
+    stream_revised: bool = False  # streamed text differs from question (replace it)
+
+
+class WSQuestionDelta(BaseModel):
+    """Server → Client: Incremental question text (STREAM_RESPONSES); the final WSQuestion is authoritative."""
+    type: str = "question_delta"
+    delta: str = ""
+    seq: int = 0
+    done: bool = False
+    discard: bool = False  # Turn ended without a question: drop the streamed text
 
 
 class WSComplete(BaseModel):
@@ -123,6 +134,12 @@ class WSGoalQualification(BaseModel):
     goal_state: dict[str, Any] | None = None
 
 
+class WSTurnTrace(BaseModel):
+    """Server → Client: Per-stage timing of the turn (TURN_TRACE_IN_RESPONSE, debugging)."""
+    type: str = "trace"
+    trace: dict[str, Any]
+
+
 # REST Schemas (for summary endpoint)
 
 class SummaryResponse(BaseModel):
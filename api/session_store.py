@@ -0,0 +1,342 @@
+"""
+Durable, shareable session backend.
+
+Stores Orchestrator.to_state() snapshots so sessions survive restarts and
+LRU/idle eviction, and can be shared by several worker processes:
+- SQLiteSessionStore (default): one row per session in a single SQLite file
+- FileSessionStore: one JSON file per session in a directory
+- InMemorySessionStore: process-local fake for tests / single-process dev
+
+Snapshots are handed to stores as EncodedState (JSON encoded by the caller),
+so a write running in a worker thread never reads state a later turn is changing.
+
+Every store also provides:
+- revision(): the revision of the stored snapshot, so a worker can tell its
+  cached copy is stale
+- try_lock()/unlock(): a per-session lease that works across processes (with
+  expiry, so a crashed worker cannot hold a session forever)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+from config import Config
+
+SessionState = dict[str, Any]
+
+_SAFE_SESSION_ID = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+def _dumps(state: SessionState) -> str:
+    # datetimes (field history timestamps) serialize as ISO strings
+    return json.dumps(state, default=str)
+
+
+@dataclass(frozen=True)
+class EncodedState:
+    """A session snapshot serialized at snapshot time (safe to write from another thread)."""
+
+    revision: int
+    data: str
+
+
+def encode_state(state: SessionState) -> EncodedState:
+    """Serialize a snapshot now, detaching it from the live session objects."""
+    return EncodedState(revision=int(state.get("revision") or 0), data=_dumps(state))
+
+
+def decode_state(encoded: EncodedState) -> SessionState:
+    """Fresh SessionState from an encoded snapshot."""
+    return json.loads(encoded.data)
+
+
+def new_lock_owner() -> str:
+    """Unique owner token for one lock acquisition."""
+    return f"{os.getpid()}:{uuid.uuid4().hex}"
+
+
+class SessionStore(ABC):
+    """Base class for session snapshot stores."""
+
+    @abstractmethod
+    def load(self, session_id: str) -> SessionState | None:
+        """Return the latest snapshot for a session, or None."""
+
+    @abstractmethod
+    def save_many(self, states: dict[str, EncodedState]) -> None:
+        """Persist a batch of encoded snapshots {session_id: state}."""
+
+    def save(self, session_id: str, state: EncodedState) -> None:
+        """Persist a single encoded snapshot."""
+        self.save_many({session_id: state})
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session snapshot."""
+
+    def revision(self, session_id: str) -> int:
+        """Revision of the stored snapshot (0 if missing)."""
+        state = self.load(session_id)
+        return int((state or {}).get("revision") or 0)
+
+    @abstractmethod
+    def try_lock(self, session_id: str, owner: str, ttl_seconds: float) -> bool:
+        """Take the session lease for owner if free or expired. Returns True on success."""
+
+    @abstractmethod
+    def unlock(self, session_id: str, owner: str) -> None:
+        """Release the session lease if owner still holds it."""
+
+    def close(self) -> None:
+        """Release resources."""
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store (tests, single-worker development)."""
+
+    def __init__(self):
+        """Initialize empty state and lease tables."""
+        self._lock = threading.Lock()
+        self._states: dict[str, str] = {}
+        self._leases: dict[str, tuple[str, float]] = {}
+
+    def load(self, session_id: str) -> SessionState | None:
+        with self._lock:
+            raw = self._states.get(session_id)
+        return json.loads(raw) if raw is not None else None
+
+    def save_many(self, states: dict[str, EncodedState]) -> None:
+        with self._lock:
+            self._states.update({session_id: state.data for session_id, state in states.items()})
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._states.pop(session_id, None)
+
+    def try_lock(self, session_id: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            lease = self._leases.get(session_id)
+            if lease and lease[0] != owner and lease[1] > now:
+                return False
+            self._leases[session_id] = (owner, now + ttl_seconds)
+            return True
+
+    def unlock(self, session_id: str, owner: str) -> None:
+        with self._lock:
+            lease = self._leases.get(session_id)
+            if lease and lease[0] == owner:
+                del self._leases[session_id]
+
+
+class SQLiteSessionStore(SessionStore):
+    """All sessions in one SQLite table (WAL mode, safe for concurrent readers)."""
+
+    def __init__(self, path: str):
+        """Open (or create) the store at path."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(session_id TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL, "
+            "revision INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_locks "
+            "(session_id TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def load(self, session_id: str) -> SessionState | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_many(self, states: dict[str, EncodedState]) -> None:
+        if not states:
+            return
+        now = time.time()
+        rows = [(session_id, state.data, now, state.revision) for session_id, state in states.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sessions (session_id, state, updated_at, revision) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def revision(self, session_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT revision FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def try_lock(self, session_id: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            # Atomic: insert, or take over only an expired (or our own) lease
+            self._conn.execute(
+                "INSERT INTO session_locks (session_id, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE session_locks.expires_at < ? OR session_locks.owner = excluded.owner",
+                (session_id, owner, now + ttl_seconds, now),
+            )
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT owner FROM session_locks WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return bool(row) and row[0] == owner
+
+    def unlock(self, session_id: str, owner: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM session_locks WHERE session_id = ? AND owner = ?", (session_id, owner)
+            )
+            self._conn.commit()
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class FileSessionStore(SessionStore):
+    """One <session_id>.json file per session (atomic replace on write)."""
+
+    def __init__(self, directory: str):
+        """Use (and create) directory for snapshot files."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def _path(self, session_id: str) -> str:
+        if not _SAFE_SESSION_ID.match(session_id):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        return os.path.join(self.directory, f"{session_id}.json")
+
+    def load(self, session_id: str) -> SessionState | None:
+        try:
+            with open(self._path(session_id), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save_many(self, states: dict[str, EncodedState]) -> None:
+        for session_id, state in states.items():
+            path = self._path(session_id)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(state.data)
+            os.replace(tmp_path, path)
+
+    def delete(self, session_id: str) -> None:
+        try:
+            os.remove(self._path(session_id))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def _lock_path(self, session_id: str) -> str:
+        return self._path(session_id)[: -len(".json")] + ".lock"
+
+    def _create_lock(self, path: str, owner: str, expires_at: float) -> bool:
+        # Written in full to a private file, then linked into place: os.link fails if
+        # the lock exists, and a competitor never sees a half-written lock file
+        tmp_path = f"{path}.{owner}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{owner}\n{expires_at}")
+        try:
+            os.link(tmp_path, path)
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            os.remove(tmp_path)
+
+    @staticmethod
+    def _read_lock(path: str) -> str | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _owns_lock(self, path: str, owner: str) -> bool:
+        body = self._read_lock(path)
+        return body is not None and body.partition("\n")[0] == owner
+
+    def try_lock(self, session_id: str, owner: str, ttl_seconds: float) -> bool:
+        path = self._lock_path(session_id)
+        now = time.time()
+        if self._create_lock(path, owner, now + ttl_seconds):
+            return True
+        body = self._read_lock(path)
+        if body is None:
+            # Released in the meantime
+            return self._create_lock(path, owner, now + ttl_seconds) and self._owns_lock(path, owner)
+        held_by, _, expires_at = body.partition("\n")
+        if held_by == owner:
+            return True
+        try:
+            expired = float(expires_at) < now
+        except ValueError:
+            expired = True  # lock files are only ever linked in complete, so this one is corrupt
+        if not expired:
+            return False
+        # Stale lease from a crashed worker. Move it aside atomically and make sure it is
+        # the lease we read: a competitor may have broken it and taken a fresh one since.
+        stale_path = f"{path}.{owner}.stale"
+        try:
+            os.rename(path, stale_path)
+        except FileNotFoundError:
+            return False
+        try:
+            if self._read_lock(stale_path) != body:
+                # Moved a live lease aside: put it back (unless yet another lease exists)
+                try:
+                    os.link(stale_path, path)
+                except FileExistsError:
+                    pass
+                return False
+        finally:
+            os.remove(stale_path)
+        return self._create_lock(path, owner, now + ttl_seconds) and self._owns_lock(path, owner)
+
+    def unlock(self, session_id: str, owner: str) -> None:
+        path = self._lock_path(session_id)
+        try:
+            with open(path, encoding="utf-8") as f:
+                held_by = f.read().partition("\n")[0]
+            if held_by == owner:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def create_session_store() -> SessionStore | None:
+    """Build the store selected by Config.SESSION_PERSISTENCE (None when disabled)."""
+    backend = (Config.SESSION_PERSISTENCE or "none").lower()
+    if backend == "sqlite":
+        return SQLiteSessionStore(Config.SESSION_STORE_PATH or Config.get_db_path("sessions.db"))
+    if backend == "file":
+        return FileSessionStore(Config.SESSION_STORE_PATH or os.path.join(Config.DB_DIR, "sessions"))
+    if backend == "memory":
+        return InMemorySessionStore()
+    if backend == "none":
+        return None
+    raise ValueError(f"Unknown SESSION_PERSISTENCE backend: {backend}")
@@ -1,36 +1,413 @@
 """
 Session management for orchestrator instances.
+
+Sessions live in a bounded in-memory store:
+- LRU eviction once SESSION_MAX_COUNT is reached
+- Idle sessions (no access for SESSION_IDLE_TTL_SECONDS) removed by a background reaper
+- Eviction counters in services.metrics
+
+With persistence enabled (SESSION_PERSISTENCE), each turn marks its session
+dirty; a background flusher snapshots dirty sessions and writes them in
+batches (write-behind). Evicted or restarted sessions are rehydrated lazily
+from the store on the next get_session(). Store I/O always runs in worker
+threads (asyncio.to_thread), never on the event loop.
+
+With a shared backend (SESSION_SHARED_BACKEND, for uvicorn --workers N) every
+turn runs inside turn(): it takes a cross-process session lease, reloads the
+session if another worker wrote a newer revision, and writes the snapshot
+through to the store before releasing the lease.
+
+Turns for one session are serialized by a per-session asyncio lock (a FIFO
+queue of waiters), while different sessions run fully concurrently. Sessions
+with a turn in flight are never evicted or snapshotted mid-turn.
 """
 
+import asyncio
 import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+from api.session_store import (
+    EncodedState,
+    SessionStore,
+    create_session_store,
+    decode_state,
+    encode_state,
+    new_lock_owner,
+)
+from config import Config
 from orchestrator import Orchestrator
+from services.metrics import metrics
 
 
 class SessionManager:
     """Manages orchestrator sessions."""
-    
-    def __init__(self):
-        """Initialize session manager."""
-        self.sessions: dict[str, Orchestrator] = {}
-    
-    def create_session(self, initial_context: str | None = None) -> str:
+
+    def __init__(
+        self,
+        max_sessions: int | None = None,
+        idle_ttl_seconds: float | None = None,
+        store: SessionStore | None = None,
+        shared: bool | None = None,
+    ):
+        """
+        Initialize session manager.
+
+        Args:
+            max_sessions: Max sessions held in memory (<= 0 means unbounded)
+            idle_ttl_seconds: Evict sessions idle for longer than this (<= 0 disables)
+            store: Snapshot store for persistence (None disables persistence)
+            shared: Store is shared with other worker processes (lease + write-through turns)
+        """
+        self.max_sessions = Config.SESSION_MAX_COUNT if max_sessions is None else max_sessions
+        self.idle_ttl_seconds = (
+            Config.SESSION_IDLE_TTL_SECONDS if idle_ttl_seconds is None else idle_ttl_seconds
+        )
+        # session_id -> orchestrator, least recently used first
+        self.sessions: OrderedDict[str, Orchestrator] = OrderedDict()
+        self._last_access: dict[str, float] = {}
+        self._reaper_task: asyncio.Task | None = None
+        # Persistence (write-behind): sessions changed since the last flush, and
+        # snapshots taken at eviction time that still need writing
+        self.store = store
+        self._dirty: set[str] = set()
+        self._pending: dict[str, EncodedState] = {}
+        self._flusher_task: asyncio.Task | None = None
+        # Held by flush() for its whole batch write and by delete_session() for the
+        # store delete, so an in-flight flush can't write a deleted session back
+        self._flush_lock = asyncio.Lock()
+        # Multi-worker: revision of the snapshot each cached session corresponds to
+        self.shared = bool(store) and (Config.SESSION_SHARED_BACKEND if shared is None else shared)
+        self._revisions: dict[str, int] = {}
+        # Per-session turn serialization: lock + number of turns running or waiting
+        self._turn_locks: dict[str, asyncio.Lock] = {}
+        self._turn_depth: dict[str, int] = {}
+        self._max_turn_depth = 0
+
+    async def create_session(self, initial_context: str | None = None) -> str:
         """Create a new session and return session ID."""
         session_id = os.urandom(16).hex()
-        self.sessions[session_id] = Orchestrator(
-            initial_context=initial_context,
-            session_id=session_id,
+        self._put(
+            session_id,
+            Orchestrator(
+                initial_context=initial_context,
+                session_id=session_id,
+            ),
         )
+        metrics.inc("sessions.created")
+        if self.shared:
+            # Visible to other workers immediately
+            await asyncio.to_thread(self.store.save, session_id, self._snapshot(session_id))
+        else:
+            self.mark_dirty(session_id)
         return session_id
-    
-    def get_session(self, session_id: str) -> Orchestrator | None:
-        """Get orchestrator for a session."""
-        return self.sessions.get(session_id)
-    
-    def delete_session(self, session_id: str) -> None:
-        """Delete a session."""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-
-
-session_manager = SessionManager()
+
+    async def get_session(self, session_id: str) -> Orchestrator | None:
+        """Get orchestrator for a session (marks it as recently used)."""
+        orchestrator = self.sessions.get(session_id)
+        if orchestrator is not None and self.shared:
+            # Another worker may have advanced this session since we cached it
+            stored_revision = await asyncio.to_thread(self.store.revision, session_id)
+            if stored_revision > self._revisions.get(session_id, 0):
+                metrics.inc("sessions.stale_reloads")
+                orchestrator.discard_speculation("stale")
+                orchestrator = None
+        if orchestrator is None:
+            cached = self.sessions.get(session_id)
+            orchestrator = await self._rehydrate(session_id)
+            if orchestrator is None:
+                return None
+            current = self.sessions.get(session_id)
+            if current is not None and current is not cached:
+                # Rehydrated concurrently by another caller while we loaded
+                self.touch(session_id)
+                return current
+            self._put(session_id, orchestrator)
+            return orchestrator
+        self.touch(session_id)
+        return orchestrator
+
+    async def delete_session(self, session_id: str) -> None:
+        """Delete a session (including its persisted snapshot)."""
+        orchestrator = self.sessions.pop(session_id, None)
+        if orchestrator is not None:
+            orchestrator.discard_speculation("deleted")
+        self._last_access.pop(session_id, None)
+        self._dirty.discard(session_id)
+        self._pending.pop(session_id, None)
+        self._revisions.pop(session_id, None)
+        if self.store:
+            async with self._flush_lock:
+                # A failed flush may have re-queued the session while we waited
+                self._pending.pop(session_id, None)
+                await asyncio.to_thread(self.store.delete, session_id)
+
+    def _put(self, session_id: str, orchestrator: Orchestrator) -> None:
+        """Insert a session and evict least recently used ones beyond max_sessions."""
+        self.sessions[session_id] = orchestrator
+        self.touch(session_id)
+        if self.max_sessions <= 0:
+            return
+        while len(self.sessions) > self.max_sessions:
+            # Least recently used session without a turn in flight
+            victim = next(
+                (sid for sid in self.sessions if sid != session_id and not self.is_busy(sid)),
+                None,
+            )
+            if victim is None:
+                break  # everything busy: allow a temporary overshoot
+            self._evict(victim, reason="lru")
+
+    def touch(self, session_id: str, orchestrator: Orchestrator | None = None) -> None:
+        """
+        Mark a session as recently used (called on every turn).
+
+        If the live orchestrator of a connected socket was evicted meanwhile, it is put back.
+        """
+        if orchestrator is not None and self.sessions.get(session_id) is not orchestrator:
+            self._put(session_id, orchestrator)
+            return
+        if session_id not in self.sessions:
+            return
+        self.sessions.move_to_end(session_id)
+        self._last_access[session_id] = time.monotonic()
+
+    def mark_dirty(self, session_id: str) -> None:
+        """Schedule a session snapshot for the next write-behind flush."""
+        if self.store and session_id in self.sessions:
+            self._dirty.add(session_id)
+
+    async def _rehydrate(self, session_id: str) -> Orchestrator | None:
+        """Restore an evicted/restarted session from the store (None if unknown)."""
+        if not self.store:
+            return None
+        pending = self._pending.get(session_id)
+        # Decode queued snapshots afresh: the queued copy must not alias the new session
+        state = decode_state(pending) if pending else await asyncio.to_thread(self.store.load, session_id)
+        if not state or state.get("state_version") != Orchestrator.STATE_VERSION:
+            return None
+        metrics.inc("sessions.rehydrated")
+        self._revisions[session_id] = int(state.get("revision") or 0)
+        return Orchestrator.from_state(state)
+
+    def _snapshot(self, session_id: str) -> EncodedState:
+        """
+        Snapshot a cached session under a new revision.
+
+        Encoded on the event loop: to_state() shares dicts with the live session,
+        which the next turn may change while a worker thread writes the snapshot.
+        """
+        revision = self._revisions.get(session_id, 0) + 1
+        self._revisions[session_id] = revision
+        state = self.sessions[session_id].to_state()
+        state["revision"] = revision
+        return encode_state(state)
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        """Drop a session from memory and record why."""
+        if session_id in self._dirty:
+            self._dirty.discard(session_id)
+            self._pending[session_id] = self._snapshot(session_id)
+        orchestrator = self.sessions.pop(session_id, None)
+        if orchestrator is not None:
+            # Its background compliance review would otherwise keep running unobserved
+            orchestrator.discard_speculation("evicted")
+        self._last_access.pop(session_id, None)
+        self._revisions.pop(session_id, None)
+        metrics.inc("sessions.evicted")
+        metrics.inc(f"sessions.evicted.{reason}")
+
+    def reap_idle(self) -> int:
+        """Evict sessions idle longer than idle_ttl_seconds. Returns the number evicted."""
+        if self.idle_ttl_seconds <= 0:
+            return 0
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        # Least recently used first, so stop at the first session still fresh
+        expired = []
+        for session_id in self.sessions:
+            if self._last_access.get(session_id, 0) > cutoff:
+                break
+            if not self.is_busy(session_id):
+                expired.append(session_id)
+        for session_id in expired:
+            self._evict(session_id, reason="idle")
+        return len(expired)
+
+    async def flush(self) -> int:
+        """
+        Write snapshots of all dirty/evicted sessions in one batch.
+
+        Snapshots are taken and encoded on the event loop between turns, so each
+        one reflects a single revision; the store write runs in a worker thread. Flushes
+        and session deletes are serialized. Returns the number of sessions written.
+        """
+        if not self.store:
+            return 0
+        async with self._flush_lock:
+            return await self._flush_locked()
+
+    async def _flush_locked(self) -> int:
+        batch = self._pending
+        self._pending = {}
+        busy: set[str] = set()
+        for session_id in self._dirty:
+            if self.is_busy(session_id):
+                busy.add(session_id)  # snapshot after the turn completes
+            elif session_id in self.sessions:
+                batch[session_id] = self._snapshot(session_id)
+        self._dirty = busy
+        if not batch:
+            return 0
+        try:
+            await asyncio.to_thread(self.store.save_many, batch)
+        except Exception:
+            # Keep the batch for the next flush (newer snapshots win)
+            self._pending = {**batch, **self._pending}
+            metrics.inc("sessions.flush_errors")
+            raise
+        metrics.inc("sessions.flushes")
+        metrics.inc("sessions.snapshots_written", len(batch))
+        return len(batch)
+
+    async def _acquire_lease(self, session_id: str, owner: str) -> None:
+        """Wait for the cross-process session lease (raises TimeoutError)."""
+        deadline = time.monotonic() + Config.SESSION_LOCK_TIMEOUT_SECONDS
+        delay = 0.02
+        while not await asyncio.to_thread(
+            self.store.try_lock, session_id, owner, Config.SESSION_LOCK_TTL_SECONDS
+        ):
+            if time.monotonic() >= deadline:
+                metrics.inc("sessions.lock_timeouts")
+                raise TimeoutError(f"Session {session_id} is busy in another worker")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    @asynccontextmanager
+    async def turn(
+        self,
+        session_id: str,
+        orchestrator: Orchestrator | None = None,
+    ) -> AsyncIterator[Orchestrator]:
+        """
+        Run one conversational turn against a session.
+
+        Turns for the same session wait for each other in arrival order. Yields the
+        current orchestrator (rebind to it: with a shared backend it may be a fresher
+        copy than the one passed in). The session is persisted afterwards - written
+        through under the session lease when shared, write-behind otherwise.
+        """
+        lock = self._turn_locks.get(session_id)
+        if lock is None:
+            lock = self._turn_locks[session_id] = asyncio.Lock()
+        depth = self._turn_depth.get(session_id, 0) + 1
+        self._turn_depth[session_id] = depth
+        self._max_turn_depth = max(self._max_turn_depth, depth)
+        metrics.inc("sessions.turns")
+        if depth > 1:
+            metrics.inc("sessions.turns_queued")
+        try:
+            async with lock:
+                async with self._locked_turn(session_id, orchestrator) as current:
+                    yield current
+        finally:
+            remaining = self._turn_depth[session_id] - 1
+            if remaining:
+                self._turn_depth[session_id] = remaining
+            else:
+                del self._turn_depth[session_id]
+                self._turn_locks.pop(session_id, None)
+
+    @asynccontextmanager
+    async def _locked_turn(
+        self,
+        session_id: str,
+        orchestrator: Orchestrator | None,
+    ) -> AsyncIterator[Orchestrator]:
+        """Body of turn() once this session's local lock is held."""
+        owner = new_lock_owner() if self.shared else None
+        if owner:
+            await self._acquire_lease(session_id, owner)
+        try:
+            if orchestrator is not None:
+                self.touch(session_id, orchestrator)
+            current = await self.get_session(session_id)
+            if current is None:
+                raise KeyError(f"Session {session_id} not found")
+            try:
+                yield current
+            finally:
+                if owner and session_id in self.sessions:
+                    self._dirty.discard(session_id)
+                    state = self._snapshot(session_id)
+                    await asyncio.to_thread(self.store.save, session_id, state)
+                else:
+                    self.mark_dirty(session_id)
+        finally:
+            if owner:
+                await asyncio.to_thread(self.store.unlock, session_id, owner)
+
+    def is_busy(self, session_id: str) -> bool:
+        """True while a turn for the session is running or queued."""
+        return session_id in self._turn_depth
+
+    def queue_depth(self, session_id: str) -> int:
+        """Turns for the session running or waiting (0 when idle)."""
+        return self._turn_depth.get(session_id, 0)
+
+    async def _reap_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.reap_idle()
+
+    async def _flush_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception:
+                pass  # counted in flush(); retried next interval
+
+    def start(self) -> None:
+        """Start the background idle reaper (and write-behind flusher) on the running loop."""
+        loop = asyncio.get_running_loop()
+        if not self._reaper_task or self._reaper_task.done():
+            interval = max(1.0, Config.SESSION_REAP_INTERVAL_SECONDS)
+            self._reaper_task = loop.create_task(self._reap_forever(interval))
+        if self.store and (not self._flusher_task or self._flusher_task.done()):
+            interval = max(0.05, Config.SESSION_FLUSH_INTERVAL_SECONDS)
+            self._flusher_task = loop.create_task(self._flush_forever(interval))
+
+    async def stop(self) -> None:
+        """Cancel background tasks and flush outstanding snapshots."""
+        for attr in ("_reaper_task", "_flusher_task"):
+            task = getattr(self, attr)
+            setattr(self, attr, None)
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        await self.flush()
+
+    def stats(self) -> dict[str, float]:
+        """Session counts and eviction counters."""
+        return {
+            "active": len(self.sessions),
+            "max_sessions": self.max_sessions,
+            "created": metrics.get("sessions.created"),
+            "evicted_lru": metrics.get("sessions.evicted.lru"),
+            "evicted_idle": metrics.get("sessions.evicted.idle"),
+            "rehydrated": metrics.get("sessions.rehydrated"),
+            "dirty": len(self._dirty) + len(self._pending),
+            "turns": metrics.get("sessions.turns"),
+            "turns_queued": metrics.get("sessions.turns_queued"),
+            "sessions_with_turns_in_flight": len(self._turn_depth),
+            "turns_in_flight_or_waiting": sum(self._turn_depth.values()),
+            "max_queue_depth": self._max_turn_depth,
+        }
+
+
+session_manager = SessionManager(store=create_session_store())
@@ -14,10 +14,12 @@ from api.schemas import (
     WSError,
     WSModeSwitch,
     WSQuestion,
+    WSQuestionDelta,
     WSResumePrompt,
     WSScenarioQuestion,
     WSSessionStart,
     WSTraversalPaused,
+    WSTurnTrace,
     WSVisualization,
     WSGoalQualification,
 )
@@ -57,10 +59,81 @@ def _serialize_goal_state(goal_state: dict[str, Any]) -> dict[str, list]:
     }
 
 
+async def _send_event(websocket: WebSocket, ev: dict[str, Any]) -> None:
+    """Send one streamed orchestrator event (question delta, calculation or visualization)."""
+    if ev.get("kind") == "question_delta":
+        await websocket.send_json(
+            WSQuestionDelta(delta=ev.get("delta", ""), seq=ev.get("seq", 0)).model_dump()
+        )
+    elif ev.get("kind") == "calculation":
+        await websocket.send_json(
+            WSCalculation(
+                calculation_type=ev.get("calculation_type", ""),
+                result=ev.get("result", {}),
+                can_calculate=bool(ev.get("can_calculate")),
+                missing_data=ev.get("missing_data", []),
+                message=ev.get("message", ""),
+                data_used=ev.get("data_used", []),
+            ).model_dump()
+        )
+    elif ev.get("kind") == "visualization":
+        await websocket.send_json(
+            WSVisualization(
+                calculation_type=ev.get("calculation_type"),
+                inputs=ev.get("inputs", {}),
+                chart_type=ev.get("chart_type", ""),
+                data=ev.get("data", {}),
+                title=ev.get("title", ""),
+                description=ev.get("description", ""),
+                config=ev.get("config", {}),
+                charts=ev.get("charts", []),
+            ).model_dump()
+        )
+
+
+async def _send_trace(websocket: WebSocket, result: dict[str, Any]) -> None:
+    """Send the turn trace ahead of the turn's frames (only present with TURN_TRACE_IN_RESPONSE)."""
+    trace = result.pop("trace", None)
+    if trace:
+        await websocket.send_json(WSTurnTrace(trace=trace).model_dump())
+
+
+async def _discard_question_stream(websocket: WebSocket, result: dict[str, Any]) -> None:
+    """Tell the client to drop streamed question text when the turn ends without a WSQuestion."""
+    if result.get("streamed"):
+        await websocket.send_json(WSQuestionDelta(done=True, discard=True).model_dump())
+
+
+class _TurnEvents:
+    """on_event sink for one turn; remembers whether question text was streamed."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.streamed = False
+
+    async def __call__(self, ev: dict[str, Any]) -> None:
+        if ev.get("kind") == "question_delta":
+            self.streamed = True
+        await _send_event(self.websocket, ev)
+
+    async def discard_stream(self) -> None:
+        """Drop streamed question text after a failed turn (no WSQuestion will follow)."""
+        if self.streamed:
+            await self.websocket.send_json(WSQuestionDelta(done=True, discard=True).model_dump())
+
+
 async def websocket_handler(websocket: WebSocket, session_id: str | None = None):
     """
     Handle WebSocket connection for information gathering session.
     
+    Orchestrator turns are awaited (astart/arespond), so slow LLM round-trips
+    for one session never block other connections on the same worker.
+    Each turn runs inside session_manager.turn(), which serializes turns for the
+    same session (two tabs / a fast double-submit queue up instead of racing on
+    the orchestrator), persists the session (and, with a shared backend, holds
+    the cross-worker session lease);
+    reconnecting to /ws/{session_id} rehydrates it from the store.
+    
     Flow:
     1. Client connects with optional session_id
     2. If no session_id, create new session with optional initial_context
@@ -77,7 +150,7 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
     try:
         # If session_id provided, get existing session
         if session_id:
-            orchestrator = session_manager.get_session(session_id)
+            orchestrator = await session_manager.get_session(session_id)
             if not orchestrator:
                 await websocket.send_json(
                     WSError(message=f"Session {session_id} not found").model_dump()
@@ -95,8 +168,8 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
                 initial_context = message.get("initial_context") or message.get("user_goal")
                 
                 # Create new session (initial_context is optional)
-                session_id = session_manager.create_session(initial_context)
-                orchestrator = session_manager.get_session(session_id)
+                session_id = await session_manager.create_session(initial_context)
+                orchestrator = await session_manager.get_session(session_id)
                 
                 if not orchestrator:
                     await websocket.send_json(
@@ -127,9 +200,14 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
             pass
         else:
             # New session - call start() to send first question
+            events = _TurnEvents(websocket)
             try:
-                result = orchestrator.start()
+                async with session_manager.turn(session_id, orchestrator) as orchestrator:
+                    result = await orchestrator.astart(on_event=events)
+                await _send_trace(websocket, result)
                 mode = result.get("mode", "data_gathering")
+                if mode in ("calculation", "visualization", "goal_qualification", "scenario_framing"):
+                    await _discard_question_stream(websocket, result)
                 
                 # Handle different modes from start()
                 if mode == "calculation":
@@ -259,9 +337,12 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
                             planned_target_node=result.get("planned_target_node"),
                             planned_target_field=result.get("planned_target_field"),
                             goal_state=goal_state,
+                            streamed=result.get("streamed", False),
+                            stream_revised=result.get("stream_revised", False),
                         ).model_dump()
                     )
             except Exception as e:
+                await events.discard_stream()
                 await websocket.send_json(
                     WSError(message=f"Failed to start session: {str(e)}").model_dump()
                 )
@@ -284,10 +365,15 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
                     continue
                 
                 # Process response with error handling
+                events = _TurnEvents(websocket)
                 try:
-                    result = orchestrator.respond(answer_msg.answer)
+                    # Queued behind any in-flight turn for this session; persisted when the turn ends.
+                    async with session_manager.turn(session_id, orchestrator) as orchestrator:
+                        # Question text and visualization events are streamed as they are ready.
+                        result = await orchestrator.arespond(answer_msg.answer, on_event=events)
                 except RuntimeError as e:
                     # Agent parsing failed, ask user to rephrase
+                    await events.discard_stream()
                     await websocket.send_json(
                         WSError(
                             message=f"I had trouble understanding that. Could you please rephrase? ({str(e)})"
@@ -295,13 +381,18 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
                     )
                     continue
                 except Exception as e:
+                    await events.discard_stream()
                     await websocket.send_json(
                         WSError(message=f"Error processing response: {str(e)}").model_dump()
                     )
                     continue
                 
+                await _send_trace(websocket, result)
+                
                 # Handle different modes
                 mode = result.get("mode", "data_gathering")
+                if mode != "data_gathering":
+                    await _discard_question_stream(websocket, result)
                 
                 if mode == "goal_qualification":
                     goal_state = None
@@ -320,31 +411,10 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
                 if mode == "visualization":
                     # New path: orchestrator may return an event list (multiple calcs/viz per user request)
                     if isinstance(result.get("events"), list):
-                        for ev in result["events"]:
-                            if ev.get("kind") == "calculation":
-                                await websocket.send_json(
-                                    WSCalculation(
-                                        calculation_type=ev.get("calculation_type", ""),
-                                        result=ev.get("result", {}),
-                                        can_calculate=bool(ev.get("can_calculate")),
-                                        missing_data=ev.get("missing_data", []),
-                                        message=ev.get("message", ""),
-                                        data_used=ev.get("data_used", []),
-                                    ).model_dump()
-                                )
-                            elif ev.get("kind") == "visualization":
-                                await websocket.send_json(
-                                    WSVisualization(
-                                        calculation_type=ev.get("calculation_type"),
-                                        inputs=ev.get("inputs", {}),
-                                        chart_type=ev.get("chart_type", ""),
-                                        data=ev.get("data", {}),
-                                        title=ev.get("title", ""),
-                                        description=ev.get("description", ""),
-                                        config=ev.get("config", {}),
-                                        charts=ev.get("charts", []),
-                                    ).model_dump()
-                                )
+                        # Events already sent through on_event while charts rendered
+                        if not result.get("events_streamed"):
+                            for ev in result["events"]:
+                                await _send_event(websocket, ev)
                     else:
                         # Legacy single-calculation path
                         await websocket.send_json(
@@ -423,6 +493,8 @@ async def websocket_handler(websocket: WebSocket, session_id: str | None = None)
                             planned_target_node=result.get("planned_target_node"),
                             planned_target_field=result.get("planned_target_field"),
                             goal_state=goal_state,
+                            streamed=result.get("streamed", False),
+                            stream_revised=result.get("stream_revised", False),
                         ).model_dump()
                     )
                     
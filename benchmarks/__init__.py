@@ -0,0 +1,3 @@
+"""
+Offline benchmarks (run against the fake LLM backend, see agents.fake_llm).
+"""
@@ -0,0 +1,238 @@
+"""
+Turn latency benchmark - Scripted sessions against the offline LLM stand-in.
+
+Drives multi-turn sessions either directly through the orchestrator
+(astart/arespond, or with --sync the sync wrappers' background loop) or through
+the /ws endpoint (FastAPI TestClient), with every agent on agents.fake_llm, and
+reports:
+- per-turn wall time (mean / p50 / p95 / max), and per stage from the
+  orchestrator's turn traces (services.tracing)
+- fake LLM calls and injected latency per response model; orchestrator
+  overhead is wall time minus injected latency (exact for sequential calls,
+  a lower bound when calls of one turn overlap)
+- Python allocations per turn (tracemalloc peak / retained), if --allocations
+- throughput (turns/s) with --sessions concurrent sessions
+
+Usage:
+    python -m benchmarks.turn_latency --sessions 20 --latency-ms 300 --chunk-latency-ms 5
+    python -m benchmarks.turn_latency --mode ws --sessions 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+from agents.fake_llm import FAKE_LLM
+from config import Config
+from services.metrics import metrics
+
+# A plain fact-find: short direct answers plus a couple of free-text turns
+DEFAULT_SCRIPT = [
+    "35",
+    "I work full time as a nurse",
+    "married",
+    "She is 33 and works part time",
+    "120k",
+    "about $4,000 a month",
+    "yes",
+    "We have about 40k in savings and a mortgage of 450k",
+]
+
+
+@dataclass
+class TurnSample:
+    """One measured turn."""
+
+    seconds: float
+    injected_seconds: float
+    alloc_peak_bytes: int = 0
+    alloc_retained_bytes: int = 0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class BenchResult:
+    """Samples of one benchmark run."""
+
+    mode: str
+    sessions: int
+    wall_seconds: float = 0.0
+    turns: list[TurnSample] = field(default_factory=list)
+
+    def report(self) -> dict[str, Any]:
+        times = sorted(t.seconds for t in self.turns)
+        overhead = sorted(max(0.0, t.seconds - t.injected_seconds) for t in self.turns)
+        stages: dict[str, list[float]] = {}
+        for t in self.turns:
+            for name, seconds in t.stage_seconds.items():
+                stages.setdefault(name, []).append(seconds)
+        return {
+            "mode": self.mode,
+            "sessions": self.sessions,
+            "turns": len(times),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "throughput_turns_per_s": round(len(times) / self.wall_seconds, 2) if self.wall_seconds else None,
+            "turn_ms": _summary(times),
+            "overhead_ms": _summary(overhead),
+            "stage_ms": {name: _summary(values) for name, values in sorted(stages.items())},
+            "alloc_peak_kib": _summary([t.alloc_peak_bytes / 1024 for t in self.turns], scale=1),
+            "alloc_retained_kib": _summary([t.alloc_retained_bytes / 1024 for t in self.turns], scale=1),
+            "llm": FAKE_LLM.stats(),
+            "metrics": {
+                k: v for k, v in metrics.snapshot().items()
+                if k.startswith(("fake_llm.", "answers.", "compliance.", "speculation.", "stream."))
+            },
+        }
+
+
+def _summary(values: list[float], scale: float = 1000) -> dict[str, float] | None:
+    if not values:
+        return None
+    values = sorted(values)
+    return {
+        "mean": round(statistics.fmean(values) * scale, 3),
+        "p50": round(values[len(values) // 2] * scale, 3),
+        "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))] * scale, 3),
+        "max": round(values[-1] * scale, 3),
+    }
+
+
+async def _noop_event(_: dict[str, Any]) -> None:
+    return None
+
+
+async def _tallied(coro) -> tuple[Any, float]:
+    """Await coro with the latency tally opened inside it, on whichever loop runs it."""
+    with FAKE_LLM.tally() as injected:
+        result = await coro
+    return result, injected.seconds
+
+
+async def _measure(coro_factory, samples: list[TurnSample], allocations: bool, orchestrator: Any) -> Any:
+    # coro_factory returns (result, injected seconds), see _tallied().
+    # Allocation figures are process-wide, so they include concurrent sessions' turns
+    if allocations:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    result, injected = await coro_factory()
+    sample = TurnSample(seconds=time.perf_counter() - start, injected_seconds=injected)
+    if orchestrator.last_turn_trace is not None:
+        for span in orchestrator.last_turn_trace.stages:
+            sample.stage_seconds[span.name] = sample.stage_seconds.get(span.name, 0.0) + (span.seconds or 0.0)
+    if allocations:
+        current, peak = tracemalloc.get_traced_memory()
+        sample.alloc_peak_bytes = max(0, peak - before)
+        sample.alloc_retained_bytes = max(0, current - before)
+    samples.append(sample)
+    return result
+
+
+async def _orchestrator_session(index: int, script: list[str], samples: list[TurnSample], allocations: bool, sync: bool) -> None:
+    from orchestrator.main import Orchestrator, _run_sync
+
+    orchestrator = Orchestrator(initial_context="I want to plan for retirement", session_id=f"bench-{index}")
+    if sync:
+        # What start()/respond() do (_run_sync on the background loop), from a worker
+        # thread, with the tally opened inside the coroutine
+        await _measure(
+            lambda: asyncio.to_thread(_run_sync, _tallied(orchestrator.astart())), samples, allocations, orchestrator
+        )
+        for answer in script:
+            await _measure(
+                lambda: asyncio.to_thread(_run_sync, _tallied(orchestrator.arespond(answer))),
+                samples, allocations, orchestrator,
+            )
+        return
+    await _measure(lambda: _tallied(orchestrator.astart(on_event=_noop_event)), samples, allocations, orchestrator)
+    for answer in script:
+        await _measure(
+            lambda: _tallied(orchestrator.arespond(answer, on_event=_noop_event)), samples, allocations, orchestrator
+        )
+
+
+async def run_orchestrator(sessions: int, script: list[str], allocations: bool = False, sync: bool = False) -> BenchResult:
+    """Run concurrent scripted sessions directly through the orchestrator."""
+    result = BenchResult(mode="orchestrator_sync" if sync else "orchestrator", sessions=sessions)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _orchestrator_session(i, script, result.turns, allocations, sync) for i in range(sessions)
+    ))
+    result.wall_seconds = time.perf_counter() - start
+    return result
+
+
+def _injected_total() -> float:
+    return sum(FAKE_LLM.stats()["injected_seconds"].values())
+
+
+def _receive_until_question(ws) -> dict[str, Any]:
+    """Read frames until the turn's final (non-delta) frame."""
+    while True:
+        frame = ws.receive_json()
+        if frame.get("type") not in ("question_delta", "calculation", "visualization", "session_start", "trace"):
+            return frame
+
+
+def run_websocket(sessions: int, script: list[str]) -> BenchResult:
+    """Run scripted sessions sequentially through /ws (in-process TestClient)."""
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    result = BenchResult(mode="websocket", sessions=sessions)
+    start = time.perf_counter()
+    with TestClient(app) as client:
+        for _ in range(sessions):
+            with client.websocket_connect("/ws") as ws:
+                # The app runs in the TestClient's own thread, so use the process-wide
+                # totals (sessions are sequential here)
+                messages = [{"initial_context": "I want to plan for retirement"}]
+                messages += [{"type": "answer", "answer": answer} for answer in script]
+                for message in messages:
+                    injected_before = _injected_total()
+                    turn_start = time.perf_counter()
+                    ws.send_text(json.dumps(message))
+                    _receive_until_question(ws)
+                    result.turns.append(TurnSample(time.perf_counter() - turn_start, _injected_total() - injected_before))
+    result.wall_seconds = time.perf_counter() - start
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("orchestrator", "ws"), default="orchestrator")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=Config.FAKE_LLM_LATENCY_MS, help="injected latency per LLM call")
+    parser.add_argument("--chunk-latency-ms", type=float, default=Config.FAKE_LLM_CHUNK_LATENCY_MS, help="delay between streamed chunks")
+    parser.add_argument("--script", help="JSON file with a list of user answers")
+    parser.add_argument("--allocations", action="store_true", help="trace allocations per turn (slower)")
+    parser.add_argument("--sync", action="store_true", help="run turns on the sync start()/respond() background loop")
+    args = parser.parse_args()
+
+    Config.LLM_BACKEND = "fake"
+    FAKE_LLM.latency_ms = args.latency_ms
+    FAKE_LLM.chunk_latency_ms = args.chunk_latency_ms
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script) as f:
+            script = list(json.load(f))
+
+    if args.allocations:
+        tracemalloc.start()
+    if args.mode == "ws":
+        result = run_websocket(args.sessions, script)
+    else:
+        result = asyncio.run(run_orchestrator(args.sessions, script, args.allocations, args.sync))
+    if args.latency_ms > 0 and not any(t.injected_seconds for t in result.turns):
+        raise SystemExit("No injected latency was attributed to any turn; overhead figures would be wrong")
+    print(json.dumps(result.report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -89,12 +89,89 @@ class Config:
     # OpenAI API Key (required for agents)
     OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
     
+    # Process-wide pooled HTTP client shared by every OpenAIChat (agents.llm_client):
+    # max open connections, idle keep-alive connections and their expiry; HTTP/2 needs h2
+    OPENAI_HTTP_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_HTTP_MAX_CONNECTIONS", "100"))
+    OPENAI_HTTP_MAX_KEEPALIVE: int = int(os.getenv("OPENAI_HTTP_MAX_KEEPALIVE", "20"))
+    OPENAI_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("OPENAI_HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+    OPENAI_HTTP2: bool = os.getenv("OPENAI_HTTP2", "false").lower() == "true"
+    
+    # LLM backend: "openai", or "fake" for the offline stand-in (agents.fake_llm) with
+    # canned responses and injected latency per call / per streamed chunk (benchmarks, local runs)
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "openai").lower()
+    FAKE_LLM_LATENCY_MS: float = float(os.getenv("FAKE_LLM_LATENCY_MS", "0"))
+    FAKE_LLM_CHUNK_LATENCY_MS: float = float(os.getenv("FAKE_LLM_CHUNK_LATENCY_MS", "0"))
+    
     # Database paths
     DB_DIR: str = os.getenv("DB_DIR", "tmp")
     
     # API configuration
     CORS_ORIGINS: list[str] = os.getenv("CORS_ORIGINS", "*").split(",")
     
+    # Max agent calls in flight per turn (independent calls are fanned out concurrently)
+    TURN_MAX_CONCURRENCY: int = int(os.getenv("TURN_MAX_CONCURRENCY", "4"))
+    
+    # Max concurrent chart renders for one multi-calculation visualization request
+    CHART_RENDER_CONCURRENCY: int = int(os.getenv("CHART_RENDER_CONCURRENCY", "3"))
+    
+    # Auto-approve template text and single plain questions that pass the local rule-based
+    # compliance screen (all other text goes to the LLM review)
+    COMPLIANCE_PRESCREEN_ENABLED: bool = os.getenv("COMPLIANCE_PRESCREEN_ENABLED", "true").lower() == "true"
+    
+    # Compliance verdict cache: in-memory LRU size (0 disables), TTL, optional SQLite file for an on-disk tier
+    COMPLIANCE_CACHE_SIZE: int = int(os.getenv("COMPLIANCE_CACHE_SIZE", "2048"))
+    COMPLIANCE_CACHE_TTL_SECONDS: float = float(os.getenv("COMPLIANCE_CACHE_TTL_SECONDS", "86400"))
+    COMPLIANCE_CACHE_PATH: str = os.getenv("COMPLIANCE_CACHE_PATH", "")
+    
+    # Compact prompt context: minified JSON, stripped schemas, full schemas only for focus nodes
+    PROMPT_COMPACTION_ENABLED: bool = os.getenv("PROMPT_COMPACTION_ENABLED", "true").lower() == "true"
+    
+    # Stream ConversationAgent text over the websocket as question_delta frames.
+    # Compliance policy for streamed text: "prescreen" releases whole sentences only while
+    # the rule-based screen passes (halts otherwise); "post_review" streams raw tokens and
+    # relies on the final frame (authoritative, compliance-reviewed text) to correct them
+    STREAM_RESPONSES: bool = os.getenv("STREAM_RESPONSES", "false").lower() == "true"
+    STREAM_COMPLIANCE_POLICY: str = os.getenv("STREAM_COMPLIANCE_POLICY", "prescreen")
+    
+    # Speculative next question: after asking a field, precompute the deterministic follow-up
+    # (next missing field of the same node + its compliance verdict) in the background and
+    # reuse it, skipping ConversationAgent, when the reply is a short plain answer to that field
+    SPECULATIVE_QUESTIONS: bool = os.getenv("SPECULATIVE_QUESTIONS", "false").lower() == "true"
+    SPECULATIVE_MAX_ANSWER_CHARS: int = int(os.getenv("SPECULATIVE_MAX_ANSWER_CHARS", "120"))
+    
+    # Parse short, unambiguous numeric/yes-no/enum answers to the pending field locally
+    # (services.answer_parser) instead of calling StateResolverAgent; anything else falls back
+    FAST_PATH_ANSWERS_ENABLED: bool = os.getenv("FAST_PATH_ANSWERS_ENABLED", "true").lower() == "true"
+    FAST_PATH_MAX_ANSWER_CHARS: int = int(os.getenv("FAST_PATH_MAX_ANSWER_CHARS", "60"))
+    
+    # Monte Carlo retirement projection (services.retirement_simulation): default path count
+    # (also the cap for the LLM-driven retirement_monte_carlo calculator), max for direct
+    # callers, and worker processes for multi-chunk runs (1 = in-process)
+    MONTE_CARLO_PATHS: int = int(os.getenv("MONTE_CARLO_PATHS", "10000"))
+    MONTE_CARLO_MAX_PATHS: int = int(os.getenv("MONTE_CARLO_MAX_PATHS", "200000"))
+    MONTE_CARLO_WORKERS: int = int(os.getenv("MONTE_CARLO_WORKERS", "1"))
+    
+    # Add each turn's per-stage trace (durations, LLM calls, tokens) to the orchestrator
+    # payload and send it as a "trace" websocket frame (debugging; aggregates are on /metrics)
+    TURN_TRACE_IN_RESPONSE: bool = os.getenv("TURN_TRACE_IN_RESPONSE", "false").lower() == "true"
+    
+    # In-memory session store bounds: max sessions (LRU eviction), idle TTL and reaper interval
+    SESSION_MAX_COUNT: int = int(os.getenv("SESSION_MAX_COUNT", "500"))
+    SESSION_IDLE_TTL_SECONDS: float = float(os.getenv("SESSION_IDLE_TTL_SECONDS", "3600"))
+    SESSION_REAP_INTERVAL_SECONDS: float = float(os.getenv("SESSION_REAP_INTERVAL_SECONDS", "60"))
+    
+    # Session persistence: "sqlite" (default), "file" (one JSON per session) or "none";
+    # store path defaults to DB_DIR/sessions.db or DB_DIR/sessions/; write-behind flush interval
+    SESSION_PERSISTENCE: str = os.getenv("SESSION_PERSISTENCE", "sqlite")
+    SESSION_STORE_PATH: str = os.getenv("SESSION_STORE_PATH", "")
+    SESSION_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("SESSION_FLUSH_INTERVAL_SECONDS", "1.0"))
+    
+    # Session store shared by several worker processes (uvicorn --workers N): per-session
+    # cross-process lease, stale-copy reload and write-through turns; lease TTL / wait timeout
+    SESSION_SHARED_BACKEND: bool = os.getenv("SESSION_SHARED_BACKEND", "false").lower() == "true"
+    SESSION_LOCK_TTL_SECONDS: float = float(os.getenv("SESSION_LOCK_TTL_SECONDS", "120"))
+    SESSION_LOCK_TIMEOUT_SECONDS: float = float(os.getenv("SESSION_LOCK_TIMEOUT_SECONDS", "60"))
+    
     @classmethod
     def get_db_path(cls, filename: str) -> str:
         """Get full database path."""
@@ -104,9 +181,14 @@ class Config:
     @classmethod
     def validate(cls) -> None:
         """Validate required configuration."""
-        if not cls.OPENAI_API_KEY:
+        if not cls.OPENAI_API_KEY and cls.LLM_BACKEND != "fake":
             raise ValueError(
                 "OPENAI_API_KEY not set. Please set it in .env file or environment variable.\n"
                 "Create a .env file in the project root with: OPENAI_API_KEY=your_key_here"
             )
+        if cls.SESSION_SHARED_BACKEND and cls.SESSION_PERSISTENCE.lower() in ("memory", "none"):
+            raise ValueError(
+                f"SESSION_SHARED_BACKEND needs a store other worker processes can see; "
+                f"SESSION_PERSISTENCE={cls.SESSION_PERSISTENCE!r} is not shared between processes. Use 'sqlite' or 'file'."
+            )
 
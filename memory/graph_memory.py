@@ -10,7 +10,7 @@ Stores:
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from memory.field_history import FieldHistory, NodeUpdate
 
@@ -57,6 +57,19 @@ class GraphMemory(BaseModel):
     # node_name -> set of field_names that have been asked
     asked_questions: dict[str, set[str]] = Field(default_factory=dict)
     
+    # Serialized view of field_history (node -> field -> list[dict]), kept in sync by
+    # apply_updates so context building never re-dumps old entries. Copy-on-write:
+    # an append replaces the touched list and the dicts above it instead of
+    # mutating them, so every returned view is a stable snapshot.
+    _field_history_dump: dict[str, dict[str, list[dict[str, Any]]]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the serialized field history view for pre-populated history (e.g. from_dict)."""
+        self._field_history_dump = {
+            node: {field: [h.model_dump() for h in history] for field, history in fields.items()}
+            for node, fields in self.field_history.items()
+        }
+    
     def add_node_snapshot(self, node_name: str, data: dict[str, Any]) -> None:
         """Add or update a node snapshot."""
         self.node_snapshots[node_name] = data
@@ -214,6 +227,20 @@ class GraphMemory(BaseModel):
                 self.field_history[node_name][field_name] = []
             
             self.field_history[node_name][field_name].append(history_entry)
+            node_dump = self._field_history_dump.get(node_name, {})
+            self._field_history_dump = {
+                **self._field_history_dump,
+                node_name: {**node_dump, field_name: [*node_dump.get(field_name, []), history_entry.model_dump()]},
+            }
+    
+    def get_field_history_dict(self) -> dict[str, dict[str, list[dict[str, Any]]]]:
+        """
+        Serialized field history (node -> field -> list of entry dicts).
+
+        Returns the maintained view without copying (O(1)); later turns replace
+        rather than mutate it, so the result is a stable snapshot. Treat it as read-only.
+        """
+        return self._field_history_dump
     
     def get_field_history(self, node_name: str, field_name: str) -> list[FieldHistory]:
         """Get history for a specific field."""
@@ -251,12 +278,11 @@ class GraphMemory(BaseModel):
         result = node_data.copy()
         
         # Add history metadata
-        if node_name in self.field_history:
-            result["_field_history"] = {}
-            for field_name, history in self.field_history[node_name].items():
-                result["_field_history"][field_name] = [
-                    h.model_dump() for h in history
-                ]
+        if node_name in self._field_history_dump:
+            result["_field_history"] = {
+                field_name: list(history)
+                for field_name, history in self._field_history_dump[node_name].items()
+            }
         
         # Add conflict metadata
         if node_name in self.conflicts:
@@ -382,13 +408,7 @@ class GraphMemory(BaseModel):
             "pending_nodes": list(self.pending_nodes),
             "omitted_nodes": list(self.omitted_nodes),
             "rejected_nodes": list(self.rejected_nodes),
-            "field_history": {
-                node: {
-                    field: [h.model_dump() for h in history]
-                    for field, history in fields.items()
-                }
-                for node, fields in self.field_history.items()
-            },
+            "field_history": self.get_field_history_dict(),
             "conflicts": self.conflicts,
             "possible_goals": self.possible_goals,
             "qualified_goals": self.qualified_goals,
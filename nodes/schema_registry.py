@@ -0,0 +1,103 @@
+"""
+Node Schema Registry - Immutable, process-wide cache of node schemas.
+
+Built once at import from nodes.__all__:
+- Node classes by name (every BaseNode subclass, including aliases)
+- JSON schema per node (deep-frozen; read-only mappings and tuples)
+- Pre-serialized JSON text for prompt injection (per node and for all nodes)
+- Data field names (schema properties minus BaseNode bookkeeping fields)
+- CollectionSpec per node (or None)
+
+Pydantic schema generation is comparatively slow; nothing on the per-turn
+hot path should call model_json_schema() directly.
+"""
+
+import inspect
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import nodes
+from nodes.base import BaseNode, CollectionSpec
+
+# BaseNode bookkeeping fields (never collected from the user)
+BASE_FIELDS: frozenset[str] = frozenset({"id", "node_type", "created_at", "updated_at", "metadata"})
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class NodeSchema:
+    """Schema information for a single node class."""
+
+    name: str
+    node_cls: type[BaseNode]
+    schema: Mapping[str, Any]
+    schema_json: str
+    fields: tuple[str, ...]
+    collection_spec: CollectionSpec | None
+
+
+class NodeSchemaRegistry:
+    """Read-only registry of node schemas keyed by node name."""
+
+    def __init__(self, node_classes: dict[str, type[BaseNode]]):
+        """Generate and freeze schemas for the given node classes."""
+        entries: dict[str, NodeSchema] = {}
+        raw_schemas: dict[str, dict[str, Any]] = {}
+        for name, node_cls in node_classes.items():
+            schema = node_cls.model_json_schema()
+            raw_schemas[name] = schema
+            try:
+                spec = node_cls.collection_spec()
+            except Exception:
+                spec = None
+            entries[name] = NodeSchema(
+                name=name,
+                node_cls=node_cls,
+                schema=_freeze(schema),
+                schema_json=json.dumps(schema, indent=2),
+                fields=tuple(f for f in schema.get("properties", {}) if f not in BASE_FIELDS),
+                collection_spec=spec,
+            )
+
+        self._entries: Mapping[str, NodeSchema] = MappingProxyType(entries)
+        self.classes: Mapping[str, type[BaseNode]] = MappingProxyType(dict(node_classes))
+        self.schemas: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+            {name: entry.schema for name, entry in entries.items()}
+        )
+        self.all_schemas_json: str = json.dumps(raw_schemas, indent=2)
+
+    @classmethod
+    def from_package(cls) -> "NodeSchemaRegistry":
+        """Discover all BaseNode subclasses exported by the nodes package."""
+        node_classes: dict[str, type[BaseNode]] = {}
+        for name in nodes.__all__:
+            obj = getattr(nodes, name)
+            if inspect.isclass(obj) and issubclass(obj, BaseNode) and obj is not BaseNode:
+                node_classes[name] = obj
+        return cls(node_classes)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str) -> NodeSchema | None:
+        """Return the schema entry for a node, or None if unknown."""
+        return self._entries.get(name)
+
+
+NODE_SCHEMAS = NodeSchemaRegistry.from_package()
@@ -13,23 +13,82 @@ User Input -> StateResolver -> GraphMemory -> ConversationAgent -> ComplianceAge
                                               VisualizationAgent (if needed)
 """
 
-import inspect
+import asyncio
+import json
 import re
+import threading
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, Awaitable, Callable, Coroutine
 
+from agents.agent_pool import shared_agent
 from agents.compliance_agent import ComplianceAgent
-from agents.conversation_agent import ConversationAgent, GoalCandidate
+from agents.conversation_agent import ConversationAgent, ConversationResponse, GoalCandidate
 from agents.goal_details_agent import GoalDetailsParserAgent
 from agents.goal_inference_agent import GoalInferenceAgent
 from agents.scenario_framer_agent import ScenarioFramerAgent
-from agents.state_resolver_agent import StateResolverAgent
+from agents.state_resolver_agent import StateResolverAgent, StateResolverResponse
 from agents.calculation_agent import CalculationAgent
 from agents.visualization_agent import VisualizationAgent
 from services.calculation_engine import calculate, validate_inputs
 from config import Config
+from services.answer_parser import parse_answer
 from memory.graph_memory import GraphMemory
 from nodes.goals import GoalType
+from nodes.schema_registry import NODE_SCHEMAS
+from orchestrator.scheduler import TurnScheduler
+from orchestrator.speculation import SpeculativeQuestion
+from services.context_compactor import compact_node_schemas, focus_nodes
+from services.metrics import metrics
+from services.response_streaming import StreamGate
+from services.tracing import TurnTrace, stage, traced, turn_trace
+
+
+_sync_loop: asyncio.AbstractEventLoop | None = None
+_sync_loop_lock = threading.Lock()
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run an orchestrator coroutine from synchronous code.
+
+    Uses one long-lived background event loop (instead of asyncio.run per call) so
+    async model clients created by the agents stay bound to a single loop.
+    """
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_sync_loop.run_forever,
+                name="orchestrator-sync-loop",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop).result()
+
+
+EventSink = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class _HeldEvents:
+    """Event sink that holds events until release(), then forwards them as they come."""
+
+    def __init__(self, sink: EventSink):
+        self._sink = sink
+        self._held: list[dict[str, Any]] = []
+        self._released = False
+
+    async def __call__(self, event: dict[str, Any]) -> None:
+        if self._released:
+            await self._sink(event)
+        else:
+            self._held.append(event)
+
+    async def release(self) -> None:
+        # Events pushed while flushing are queued behind the held ones, so order is kept
+        while self._held:
+            await self._sink(self._held.pop(0))
+        self._released = True
 
 
 class OrchestratorMode(str, Enum):
@@ -51,12 +110,16 @@ class Orchestrator:
     - ComplianceAgent filters all outputs
     
     API:
-    - start() -> first response
-    - respond(user_input) -> response dict
+    - astart() -> first response (async, never blocks the event loop)
+    - arespond(user_input) -> response dict (async)
+    - start() / respond(user_input) -> blocking wrappers for scripts
     """
     
     NODE_REGISTRY: dict[str, type] = {}
     
+    # Bump when the to_state() layout changes incompatibly
+    STATE_VERSION = 1
+    
     def __init__(
         self,
         initial_context: str | None = None,
@@ -72,20 +135,14 @@ class Orchestrator:
         # Core memory
         self.graph_memory = GraphMemory()
         
-        # 5 Agents - created once, reused
-        self.state_resolver = StateResolverAgent(model_id=model_id)
-        self.conversation_agent = ConversationAgent(model_id=model_id, session_id=session_id)
-        self.goal_inference_agent = GoalInferenceAgent(model_id=model_id, session_id=session_id)
-        self.goal_details_agent = GoalDetailsParserAgent(model_id=model_id, session_id=session_id)
-        self.scenario_framer_agent = ScenarioFramerAgent(model_id=model_id, session_id=session_id)
-        self.calculation_agent = CalculationAgent(model_id=model_id, graph_memory=self.graph_memory)
-        self.visualization_agent = VisualizationAgent(model_id=model_id, graph_memory=self.graph_memory)
-        self.compliance_agent = ComplianceAgent(model_id=model_id)
+        # Agents are created lazily on first use (see the properties below)
         
         # Mode and state tracking
         self.current_mode = OrchestratorMode.DATA_GATHERING
         self._last_question: str | None = None
         self._last_question_node: str | None = None
+        self._last_question_field: str | None = None
+        self.last_turn_trace: TurnTrace | None = None
         self._goal_intake_complete = False
         self._current_node_being_collected: str | None = None
         
@@ -110,6 +167,9 @@ class Orchestrator:
         self.traversal_paused = False
         self.paused_node: str | None = None
         
+        # Precomputed follow-up for the question just asked (Config.SPECULATIVE_QUESTIONS)
+        self._speculation: SpeculativeQuestion | None = None
+        
         # Register nodes
         self._register_nodes()
         self._seed_frontier()
@@ -131,18 +191,8 @@ class Orchestrator:
         return raw or None
     
     def _register_nodes(self) -> None:
-        """Auto-discover all node classes."""
-        import nodes
-        from nodes.base import BaseNode
-        
-        for name in nodes.__all__:
-            obj = getattr(nodes, name)
-            if (
-                inspect.isclass(obj)
-                and issubclass(obj, BaseNode)
-                and obj is not BaseNode
-            ):
-                self.NODE_REGISTRY[name] = obj
+        """Register all node classes (discovered once at import by the schema registry)."""
+        self.NODE_REGISTRY.update(NODE_SCHEMAS.classes)
     
     def _seed_frontier(self) -> None:
         """Seed pending frontier with all available nodes."""
@@ -152,13 +202,27 @@ class Orchestrator:
             pass
     
     def get_all_node_schemas(self) -> dict[str, dict[str, Any]]:
-        """Get schemas for all registered nodes."""
-        return {
-            node_name: node_class.model_json_schema()
-            for node_name, node_class in self.NODE_REGISTRY.items()
-        }
+        """Get schemas for all registered nodes (a fresh, JSON-serializable copy)."""
+        return json.loads(NODE_SCHEMAS.all_schemas_json)
     
-    def _full_context(self) -> dict[str, Any]:
+    def _node_schemas_for_prompt(self, current_node: str | None, user_message: str | None = None) -> str:
+        """
+        Schema text for agent prompts.
+
+        With PROMPT_COMPACTION_ENABLED: compact schemas for the current node, the node being
+        collected, their branch siblings and nodes hinted at by the user message (all other
+        nodes by field name). Otherwise the full pretty-printed schemas.
+        """
+        if not Config.PROMPT_COMPACTION_ENABLED:
+            return NODE_SCHEMAS.all_schemas_json
+        focus = focus_nodes(
+            current_node,
+            user_message=user_message,
+            extra=[self._current_node_being_collected, self._last_question_node],
+        )
+        return compact_node_schemas(focus)
+
+    def _full_context(self, user_message: str | None = None) -> dict[str, Any]:
         """
         Build full context for agents.
         
@@ -175,14 +239,8 @@ class Orchestrator:
             "omitted_nodes": sorted(list(self.graph_memory.omitted_nodes)),
             "pending_nodes": sorted(list(self.graph_memory.pending_nodes)),
             "goal_intake_complete": self._goal_intake_complete,
-            "all_node_schemas": self.get_all_node_schemas(),
-            "field_history": {
-                node: {
-                    field: [h.model_dump() for h in history]
-                    for field, history in fields.items()
-                }
-                for node, fields in self.graph_memory.field_history.items()
-            },
+            "all_node_schemas": self._node_schemas_for_prompt(self._current_node_being_collected, user_message),
+            "field_history": self.graph_memory.get_field_history_dict(),
             "last_question": self._last_question,
             "last_question_node": self._last_question_node,
             "current_node_being_collected": self._current_node_being_collected,
@@ -253,7 +311,7 @@ class Orchestrator:
                 },
             )
 
-    def _maybe_trigger_goal_inference(self, newly_completed_nodes: set[str]) -> dict[str, Any] | None:
+    async def _maybe_trigger_goal_inference(self, newly_completed_nodes: set[str]) -> dict[str, Any] | None:
         """
         Run goal inference ONLY on node completion events:
         - First time: after baseline nodes are complete (Personal + Income + Expenses + Savings)
@@ -276,11 +334,11 @@ class Orchestrator:
             self._goal_inference_activated = True
 
         payload = self._goal_inference_input()
-        inference = self.goal_inference_agent.infer(
+        inference = await traced("goal_inference", self.goal_inference_agent.ainfer(
             visited_node_snapshots=payload["visited_node_snapshots"],
             goal_state=payload["goal_state"],
             goal_type_enum_values=payload["goal_type_enum_values"],
-        )
+        ))
         self._apply_goal_inference_results(inference)
 
         # Enqueue inferred goals for scenario framing (loop one-by-one).
@@ -288,7 +346,7 @@ class Orchestrator:
 
         # Start the next scenario immediately if we're not already framing one.
         if not self._scenario_framing_active:
-            return self._start_next_scenario_from_queue()
+            return await self._start_next_scenario_from_queue()
 
         return None
 
@@ -346,7 +404,7 @@ class Orchestrator:
                     self._scenario_goal_queue.insert(0, self._scenario_goal_queue.pop(idx))
                     break
 
-    def _start_next_scenario_from_queue(self) -> dict[str, Any] | None:
+    async def _start_next_scenario_from_queue(self) -> dict[str, Any] | None:
         """Start the next scenario goal from the queue, if any."""
         while self._scenario_goal_queue:
             nxt = self._scenario_goal_queue.pop(0)
@@ -357,7 +415,7 @@ class Orchestrator:
             if nxt.goal_id in self.graph_memory.qualified_goals or nxt.goal_id in self.graph_memory.rejected_goals:
                 continue
             self._processed_inferred_goals.add(nxt.goal_id)
-            return self._start_scenario_framing(nxt)
+            return await self._start_scenario_framing(nxt)
         return None
     
     def _apply_goal_updates(self, response) -> None:
@@ -506,12 +564,8 @@ class Orchestrator:
 
         snapshot = self.graph_memory.node_snapshots.get(node_name, {}) or {}
 
-        node_cls = self.NODE_REGISTRY[node_name]
-        spec = None
-        try:
-            spec = node_cls.collection_spec()
-        except Exception:
-            spec = None
+        entry = NODE_SCHEMAS.get(node_name)
+        spec = entry.collection_spec if entry else None
 
         if spec:
             # Mechanical completion only (do not include detail prompting fields).
@@ -523,12 +577,7 @@ class Orchestrator:
             return
 
         # Fallback: schema-based (legacy)
-        schema = node_cls.model_json_schema()
-        properties = schema.get("properties", {})
-        base_fields = {"id", "node_type", "created_at", "updated_at", "metadata"}
-        for field_name in properties.keys():
-            if field_name in base_fields:
-                continue
+        for field_name in (entry.fields if entry else ()):
             if field_name not in snapshot:
                 return  # Node not complete
 
@@ -566,7 +615,7 @@ class Orchestrator:
             return False
         return False
     
-    def _start_scenario_framing(self, scenario_goal: GoalCandidate) -> dict[str, Any]:
+    async def _start_scenario_framing(self, scenario_goal: GoalCandidate) -> dict[str, Any]:
         """Start scenario framing for an inferred goal."""
         self._scenario_framing_active = True
         self._scenario_turn = 1
@@ -580,19 +629,19 @@ class Orchestrator:
         self.current_mode = OrchestratorMode.SCENARIO_FRAMING
         
         # Generate initial scenario question
-        response = self.scenario_framer_agent.start_scenario(
+        response = await traced("scenario_framer", self.scenario_framer_agent.astart_scenario(
             goal_candidate=self._pending_scenario_goal,
             graph_snapshot=self.graph_memory.get_all_nodes_data(),
-        )
+        ))
         if response.response_text:
             self._scenario_history.append({"role": "assistant", "content": response.response_text})
         
         # Compliance check
-        compliant = self.compliance_agent.review(
+        compliant = await traced("compliance", self.compliance_agent.areview(
             response_text=response.response_text,
             response_type="scenario",
             context_summary=f"Scenario framing for {self._pending_scenario_goal['goal_id']}"
-        )
+        ))
         
         # Track history
         
@@ -613,32 +662,35 @@ class Orchestrator:
             },
         }
     
-    def _handle_scenario_framing(self, user_input: str) -> dict[str, Any]:
+    async def _handle_scenario_framing(self, user_input: str) -> dict[str, Any]:
         """Handle user response during scenario framing."""
         self._scenario_turn += 1
         
         self._scenario_history.append({"role": "user", "content": user_input})
         
         # Process with ScenarioFramerAgent
-        response = self.scenario_framer_agent.process(
+        response = await traced("scenario_framer", self.scenario_framer_agent.aprocess(
             user_message=user_input,
             goal_candidate=self._pending_scenario_goal,
             graph_snapshot=self.graph_memory.get_all_nodes_data(),
             current_turn=self._scenario_turn,
             scenario_history=self._scenario_history,
-        )
+        ))
         if response.response_text:
             self._scenario_history.append({"role": "assistant", "content": response.response_text})
         
-        # Compliance check
-        compliant = self.compliance_agent.review(
-            response_text=response.response_text,
-            response_type="scenario",
-            context_summary=f"Scenario framing for {self._pending_scenario_goal['goal_id']}"
-        )
-        
-        # Track history
+        # Compliance check (scheduled below, after the next queued scenario if exiting)
+        context_summary = f"Scenario framing for {self._pending_scenario_goal['goal_id']}"
+        scheduler = TurnScheduler(max_concurrency=Config.TURN_MAX_CONCURRENCY)
         
+        async def _review(deps: dict[str, Any]) -> Any:
+            if deps.get("next_scenario"):
+                return None  # replaced by the next scenario: this text is never sent
+            return await traced("compliance", self.compliance_agent.areview(
+                response_text=response.response_text,
+                response_type="scenario",
+                context_summary=context_summary,
+            ))
         
         # Check if goal was confirmed or rejected
         # Use agent-returned goal_id if present; otherwise fall back to the pending scenario goal id.
@@ -662,11 +714,21 @@ class Orchestrator:
         
         # Check if we should exit scenario framing
         if not response.should_continue or self._scenario_turn >= 2:
-            exit_result = self._exit_scenario_framing(compliant.compliant_response, response)
-            # If there are more inferred goals queued, immediately start the next scenario.
-            next_scenario = self._start_next_scenario_from_queue()
-            return next_scenario or exit_result
+            # Reset scenario state first so the next queued scenario (if any) can start.
+            # The closing message is only reviewed if no scenario replaces it.
+            exit_result = self._exit_scenario_framing(None, response)
+            if self._scenario_goal_queue:
+                scheduler.add("next_scenario", lambda _: self._start_next_scenario_from_queue())
+            scheduler.add("compliance", _review, after=["next_scenario"] if "next_scenario" in scheduler else [])
+            results = await scheduler.run()
+            # If there are more inferred goals queued, go straight into the next scenario.
+            if results.get("next_scenario"):
+                return results["next_scenario"]
+            exit_result["question"] = results["compliance"].compliant_response
+            return exit_result
         
+        scheduler.add("compliance", _review)
+        compliant = (await scheduler.run())["compliance"]
         return {
             "mode": "scenario_framing",
             "question": compliant.compliant_response,
@@ -685,7 +747,7 @@ class Orchestrator:
             },
         }
     
-    def _exit_scenario_framing(self, last_response: str, scenario_response) -> dict[str, Any]:
+    def _exit_scenario_framing(self, last_response: str | None, scenario_response) -> dict[str, Any]:
         """Exit scenario framing and return to normal traversal."""
         self._scenario_framing_active = False
         self.current_mode = OrchestratorMode.DATA_GATHERING
@@ -743,12 +805,8 @@ class Orchestrator:
         if not node_name or node_name not in self.NODE_REGISTRY:
             return None
 
-        node_cls = self.NODE_REGISTRY[node_name]
-        spec = None
-        try:
-            spec = node_cls.collection_spec()
-        except Exception:
-            spec = None
+        entry = NODE_SCHEMAS.get(node_name)
+        spec = entry.collection_spec if entry else None
 
         if spec:
             required = list(getattr(spec, "required_fields", []) or [])
@@ -759,16 +817,8 @@ class Orchestrator:
                 return any_of[0]
 
         # Fallback: schema-based
-        try:
-            schema = node_cls.model_json_schema()
-            properties = schema.get("properties", {}) or {}
-            base_fields = {"id", "node_type", "created_at", "updated_at", "metadata"}
-            for field_name in properties.keys():
-                if field_name in base_fields:
-                    continue
-                return field_name
-        except Exception:
-            return None
+        if entry and entry.fields:
+            return entry.fields[0]
         return None
 
     def _fallback_question_text(self, node_name: str, field_name: str | None) -> str:
@@ -857,7 +907,7 @@ class Orchestrator:
             for node_name in state_resolution.priority_shift:
                 self.graph_memory.clear_asked_questions_for_node(node_name)
     
-    def _handle_inferred_goals(self, response) -> dict[str, Any] | None:
+    async def _handle_inferred_goals(self, response) -> dict[str, Any] | None:
         """Check for inferred goals and trigger scenario framing if needed."""
         # Check inferred_goals field (new) or scenario_goal (existing)
         if response.inferred_goals and response.trigger_scenario_framing:
@@ -865,47 +915,61 @@ class Orchestrator:
             for goal in response.inferred_goals:
                 if goal.goal_id and goal.goal_id not in self._processed_inferred_goals:
                     self._processed_inferred_goals.add(goal.goal_id)
-                    return self._start_scenario_framing(goal)
+                    return await self._start_scenario_framing(goal)
         
         # Fallback to existing scenario_goal handling
         if response.trigger_scenario_framing and response.scenario_goal:
             goal_id = response.scenario_goal.goal_id
             if goal_id and goal_id not in self._processed_inferred_goals:
                 self._processed_inferred_goals.add(goal_id)
-                return self._start_scenario_framing(response.scenario_goal)
+                return await self._start_scenario_framing(response.scenario_goal)
         
         return None
     
     def start(self) -> dict[str, Any]:
+        """Blocking wrapper around astart() for scripts and non-async callers."""
+        return _run_sync(self.astart())
+    
+    def respond(self, user_input: str) -> dict[str, Any]:
+        """Blocking wrapper around arespond() for scripts and non-async callers."""
+        return _run_sync(self.arespond(user_input))
+    
+    async def astart(self, on_event: EventSink | None = None) -> dict[str, Any]:
         """
         Start the conversation.
         
         If initial_context is provided, process it. Otherwise, generate a greeting.
+        on_event receives streamed events as in arespond(). The turn is traced
+        (see _attach_trace()).
         """
+        with turn_trace("start") as trace:
+            result = await self._astart(on_event)
+        return self._attach_trace(result, trace)
+    
+    async def _astart(self, on_event: EventSink | None) -> dict[str, Any]:
+        """Body of astart()."""
         if self.initial_context:
             # Process initial context as first message
-            return self.respond(self.initial_context)
+            return await self.arespond(self.initial_context, on_event=on_event)
         
         # No initial context - have ConversationAgent generate opening
         context = self._full_context()
         
-        response = self.conversation_agent.process(
-            user_message="",  # No user message yet
-            **context
-        )
+        response, stream = await self._converse("", context, on_event)  # No user message yet
         
         # Compliance check
-        compliant = self.compliance_agent.review(
+        compliant = await traced("compliance", self.compliance_agent.areview(
             response_text=response.response_text,
             response_type="greeting",
             context_summary="Session start"
-        )
+        ))
         
         self._last_question = response.response_text
         self._last_question_node = response.question_target_node
+        self._last_question_field = response.question_target_field
+        self._speculate(response.question_target_node, response.question_target_field)
         
-        
-        return {
+        return self._finish_stream({
             "mode": "data_gathering",
             "question": compliant.compliant_response,
             "node_name": response.question_target_node,
@@ -915,12 +979,23 @@ class Orchestrator:
             "all_collected_data": self.graph_memory.get_all_nodes_data(),
             "extracted_data": {},  # Empty at start
             "upcoming_nodes": sorted(list(self.graph_memory.pending_nodes))[:5],
-        }
+        }, stream)
     
-    def respond(self, user_input: str) -> dict[str, Any]:
+    async def arespond(self, user_input: str, on_event: EventSink | None = None) -> dict[str, Any]:
         """
         Process user input and generate response.
         
+        If on_event is provided, visualization events (calculation/visualization)
+        are pushed to it in their original order as soon as each is ready (and the
+        compliance review has passed), and the returned payload is marked with
+        events_streamed=True. With
+        Config.STREAM_RESPONSES, ConversationAgent text is also pushed as
+        question_delta events (see _converse()) and the payload is marked with
+        streamed/stream_revised.
+        
+        The turn is traced per stage (see _attach_trace()); its kind is the mode
+        handling it: respond, scenario_framing or goal_details.
+        
         Flow:
         1. Check if in scenario framing mode
         2. Extract facts (StateResolver)
@@ -931,13 +1006,29 @@ class Orchestrator:
         7. Filter through ComplianceAgent
         8. Return response
         """
+        if self._scenario_framing_active:
+            kind = "scenario_framing"
+        elif self._goal_details_active:
+            kind = "goal_details"
+        else:
+            kind = "respond"
+        with turn_trace(kind) as trace:
+            result = await self._arespond(user_input, on_event)
+        return self._attach_trace(result, trace)
+    
+    async def _arespond(self, user_input: str, on_event: EventSink | None) -> dict[str, Any]:
+        """Body of arespond()."""
+        speculation, self._speculation = self._speculation, None
+        
         # Check if we're in scenario framing mode
         if self._scenario_framing_active:
-            return self._handle_scenario_framing(user_input)
+            self._discard_speculation(speculation, "mode")
+            return await self._handle_scenario_framing(user_input)
 
         # Goal details mode (after fact-find)
         if self._goal_details_active:
-            return self._handle_goal_details(user_input)
+            self._discard_speculation(speculation, "mode")
+            return await self._handle_goal_details(user_input)
         
         # Add user message to history
         
@@ -947,13 +1038,16 @@ class Orchestrator:
 
         prev_visited = set(self.graph_memory.visited_nodes)
         
-        state_resolution = self.state_resolver.resolve_state(
-            user_reply=user_input,
-            current_node=self._last_question_node or "Personal",
-            current_question=self._last_question,
-            graph_memory=self.graph_memory,
-            all_node_schemas=self.get_all_node_schemas(),
-        )
+        # Plain answers to the pending field are parsed locally; everything else goes to the LLM
+        state_resolution = self._fast_path_resolution(user_input)
+        if state_resolution is None:
+            state_resolution = await traced("state_resolver", self.state_resolver.aresolve_state(
+                user_reply=user_input,
+                current_node=self._last_question_node or "Personal",
+                current_question=self._last_question,
+                graph_memory=self.graph_memory,
+                all_node_schemas=self._node_schemas_for_prompt(self._last_question_node or "Personal", user_input),
+            ))
         
         # Step 2: Apply extracted facts to graph memory
         if state_resolution.updates:
@@ -975,25 +1069,32 @@ class Orchestrator:
 
         # Step 2.75: If any nodes just became complete, run goal inference (Option B)
         newly_completed = set(self.graph_memory.visited_nodes) - prev_visited
-        scenario_from_inference = self._maybe_trigger_goal_inference(newly_completed)
+        scenario_from_inference = await self._maybe_trigger_goal_inference(newly_completed)
         if scenario_from_inference:
+            self._discard_speculation(speculation, "goal_inference")
             # Ensure goal_state payload is updated for frontend
             scenario_from_inference["goal_state"] = self._goal_state_payload_arrays()
             scenario_from_inference["all_collected_data"] = self.graph_memory.get_all_nodes_data()
             return scenario_from_inference
         
+        # Step 2.9: Plain answer to the pending question -> reuse the precomputed follow-up
+        if speculation:
+            speculative_result = await self._use_speculation(speculation, user_input, state_resolution)
+            if speculative_result:
+                return speculative_result
+        
         # Step 3: Process with ConversationAgent (gets full updated context)
-        context = self._full_context()  # Refresh after updates
+        context = self._full_context(user_input)  # Refresh after updates
 
-        response = self.conversation_agent.process(
-            user_message=user_input,
-            **context
-        )
+        response, stream = await self._converse(user_input, context, on_event)
 
         # Defensive: ensure the agent always provides a target field when it provides a target node.
         if response.question_target_node and not response.question_target_field:
             response.question_target_field = self._default_question_field_for_node(response.question_target_node)
 
+        # Whether response_text was replaced by our own template question (see compliance below)
+        server_generated = False
+
         # Step 3.5: Override node selection if we have an active incomplete node
         if self._current_node_being_collected and response.question_target_node != self._current_node_being_collected:
             # Check if current node is still incomplete
@@ -1009,6 +1110,7 @@ class Orchestrator:
                         response.question_target_node,
                         response.question_target_field,
                     )
+                    server_generated = True
             else:
                 # Current node is complete, clear it and allow new node
                 self._current_node_being_collected = None
@@ -1034,117 +1136,60 @@ class Orchestrator:
         if self._current_node_being_collected:
             self._mark_node_complete_if_needed(self._current_node_being_collected)
         
-        # Step 5: Handle visualization if requested
-        visualization_data = None
-        if response.needs_visualization and response.visualization_request:
+        # Track question to prevent repetition. This only needs the raw agent
+        # response, so it happens before the fan-out below.
+        self._track_question(response)
+        
+        # Track for next turn
+        self._last_question = response.response_text
+        self._last_question_node = response.question_target_node
+        self._last_question_field = response.question_target_field
+        
+        # Step 5-6: Fan out the independent agent calls of this turn.
+        # Compliance review and visualization (calculation -> charts) only depend on
+        # the ConversationAgent response, not on each other.
+        # After traversal is done (preferred) or phase1 fallback, goal details
+        # collection starts; with a goal queued its payload replaces the turn, so
+        # there is no visualization, and the draft is only reviewed if goal details
+        # turn out not to replace it.
+        start_goal_details = self._should_start_goal_details(response)
+        replaced = start_goal_details and bool(self._get_goal_details_queue())
+        visualize = bool(response.needs_visualization and response.visualization_request) and not replaced
+        # Visualization events wait for the compliance review: if it fails, the turn
+        # fails and none of them may have been sent.
+        held = _HeldEvents(on_event) if visualize and on_event else None
+        
+        async def _review(deps: dict[str, Any]) -> Any:
+            if deps.get("goal_details"):
+                return None  # replaced by the goal details payload: this text is never sent
+            verdict = await traced("compliance", self.compliance_agent.areview(
+                response_text=response.response_text,
+                response_type="conversation" if not response.phase1_complete else "summary",
+                context_summary=f"Goals: {list(self.graph_memory.qualified_goals.keys())}",
+                server_generated=server_generated,
+            ))
+            if held is not None:
+                await held.release()
+            return verdict
+        
+        scheduler = TurnScheduler(max_concurrency=Config.TURN_MAX_CONCURRENCY)
+        if start_goal_details:
+            scheduler.add("goal_details", lambda _: self._start_goal_details())
+        scheduler.add("compliance", _review, after=["goal_details"] if replaced else [])
+        if visualize:
             self.current_mode = OrchestratorMode.VISUALIZATION
-            try:
-                # CalculationAgent decides which calculator(s) to run and extracts inputs from graph.
-                self.calculation_agent.update_graph_memory(self.graph_memory)
-                calc_resp = self.calculation_agent.calculate(response.visualization_request)
-
-                events: list[dict[str, Any]] = []
-                any_missing = False
-
-                for item in (calc_resp.calculations or []):
-                    # Deterministic recompute in orchestrator for robustness (agent may omit result).
-                    result = item.result or {}
-                    missing = item.missing_data or []
-
-                    if item.deterministic and item.calculation_type != "custom":
-                        missing = validate_inputs(item.calculation_type, item.inputs or {})
-                        if not missing:
-                            result = calculate(item.calculation_type, item.inputs or {})
-
-                    can_calc = (item.calculation_type == "custom" and bool(item.can_calculate)) or (not bool(missing))
-                    if missing:
-                        any_missing = True
-
-                    events.append(
-                        {
-                            "kind": "calculation",
-                            "calculation_type": item.calculation_type,
-                            "result": result,
-                            "can_calculate": can_calc,
-                            "missing_data": missing,
-                            "message": item.formula_summary or (calc_resp.summary or "Calculation result"),
-                            "data_used": item.data_used or [],
-                            "inputs": item.inputs or {},
-                            "deterministic": bool(item.deterministic),
-                        }
-                    )
-
-                    if can_calc and result:
-                        chart_bundle = self.visualization_agent.generate_charts(
-                            item.calculation_type,
-                            item.inputs or {},
-                            result,
-                            item.data_used or [],
-                        )
-                        charts = chart_bundle.charts or []
-                        first_chart = charts[0] if charts else None
-                        events.append(
-                            {
-                                "kind": "visualization",
-                                "calculation_type": item.calculation_type,
-                                "inputs": item.inputs or {},
-                            "charts": [
-                                {
-                                    "chart_type": c.chart_type,
-                                    "data": c.data,
-                                    "title": c.title,
-                                    "description": c.description,
-                                    "config": c.config,
-                                }
-                                for c in charts
-                            ],
-                            "chart_type": first_chart.chart_type if first_chart else "",
-                            "data": first_chart.data if first_chart else {},
-                            "title": first_chart.title if first_chart else "",
-                            "description": first_chart.description if first_chart else "",
-                            "config": first_chart.config if first_chart else {},
-                        }
-                        )
-
-                    visualization_data = {
-                        "type": "visualization",
-                    "events": events,
-                    "can_calculate": not any_missing,
-                    "resume_prompt": None,
-                }
-
-                if any_missing:
-                    self.traversal_paused = True
-                    self.paused_node = response.question_target_node
-            except Exception as e:
-                visualization_data = {
-                    "type": "visualization",
-                    "calculation_type": "error",
-                    "can_calculate": False,
-                    "result": {},
-                    "message": f"Could not generate visualization: {str(e)}",
-                    "missing_data": [],
-                    "data_used": [],
-                }
+            scheduler.add("visualization", lambda _: self._run_visualization(response, held))
         else:
             self.current_mode = OrchestratorMode.DATA_GATHERING
             self.traversal_paused = False
             self.paused_node = None
         
-        # Step 6: Compliance check
-        compliant = self.compliance_agent.review(
-            response_text=response.response_text,
-            response_type="conversation" if not response.phase1_complete else "summary",
-            context_summary=f"Goals: {list(self.graph_memory.qualified_goals.keys())}"
-        )
-        
-        # Track question to prevent repetition
-        self._track_question(response)
-        
-        # Track for next turn
-        self._last_question = response.response_text
-        self._last_question_node = response.question_target_node
+        results = await scheduler.run()
+        if results.get("goal_details"):
+            return self._finish_stream(results["goal_details"], stream)
         
+        compliant = results["compliance"]
+        visualization_data = results.get("visualization")
         
         # Build response
         # Ensure extracted_data is always a dict (get_node_data can return None)
@@ -1172,6 +1217,7 @@ class Orchestrator:
             # Pass events list for multi-calc/viz support
             if "events" in visualization_data:
                 result["events"] = visualization_data["events"]
+                result["events_streamed"] = visualization_data.get("events_streamed", False)
             # Add top-level fields for websocket handler (legacy/fallback)
             result["calculation_type"] = visualization_data.get("calculation_type", "")
             result["inputs"] = visualization_data.get("inputs", {})
@@ -1193,15 +1239,348 @@ class Orchestrator:
         if response.phase1_complete and response.phase1_summary:
             result["phase1_summary"] = response.phase1_summary
             result["reason"] = "All necessary information has been gathered for your goals."
-
-        # After traversal is done (preferred) or phase1 fallback, start goal details collection.
-        if self._should_start_goal_details(response):
-            goal_details = self._start_goal_details()
-            if goal_details:
-                return goal_details
         
+        if self.current_mode == OrchestratorMode.DATA_GATHERING and not response.phase1_complete:
+            self._speculate(response.question_target_node, response.question_target_field)
+        
+        return self._finish_stream(result, stream)
+    
+    # ------------------------------------------------------------------
+    # Speculative next question
+    # ------------------------------------------------------------------
+    
+    def _speculate(self, node_name: str | None, field_name: str | None) -> None:
+        """
+        Precompute the follow-up to the question just asked about (node_name, field_name).
+        
+        Only when the node would still be incomplete after a plain answer, so the next
+        question is deterministic: its next missing field, phrased by
+        _fallback_question_text(). The compliance review runs in the background.
+        """
+        if not Config.SPECULATIVE_QUESTIONS or not node_name or not field_name:
+            return
+        entry = NODE_SCHEMAS.get(node_name)
+        spec = entry.collection_spec if entry else None
+        any_of = set(spec.require_any_of or []) if spec else set()
+        answered = any_of | {field_name} if field_name in any_of else {field_name}
+        remaining = [f for f in self._get_missing_fields_for_node(node_name) if f not in answered]
+        if not remaining:
+            return
+        question = self._fallback_question_text(node_name, remaining[0])
+        review = asyncio.create_task(
+            self.compliance_agent.areview(
+                response_text=question,
+                response_type="conversation",
+                context_summary=f"Goals: {list(self.graph_memory.qualified_goals.keys())}",
+                server_generated=True,
+            )
+        )
+        self._speculation = SpeculativeQuestion(
+            node_name=node_name,
+            answered_field=field_name,
+            next_field=remaining[0],
+            question=question,
+            review=review,
+        )
+        metrics.inc("speculation.launched")
+    
+    def _discard_speculation(self, speculation: SpeculativeQuestion | None, reason: str) -> None:
+        """Drop an unused speculation."""
+        if speculation:
+            speculation.discard(reason)
+    
+    def discard_speculation(self, reason: str) -> None:
+        """Drop the pending speculation, if any (e.g. the session is evicted from memory)."""
+        speculation, self._speculation = self._speculation, None
+        self._discard_speculation(speculation, reason)
+    
+    def _fast_path_resolution(self, user_input: str) -> StateResolverResponse | None:
+        """
+        Resolve a plain answer to the pending field without StateResolverAgent.
+        
+        Returns None (use the LLM) when disabled, when no single field is pending, or when
+        services.answer_parser cannot parse the reply unambiguously.
+        """
+        node_name, field_name = self._last_question_node, self._last_question_field
+        if not Config.FAST_PATH_ANSWERS_ENABLED or not node_name or not field_name:
+            return None
+        current = (self.graph_memory.get_node_data(node_name) or {}).get(field_name)
+        parsed = parse_answer(
+            node_name,
+            field_name,
+            user_input,
+            current_value=current,
+            max_chars=Config.FAST_PATH_MAX_ANSWER_CHARS,
+        )
+        if parsed is None:
+            return None
+        return StateResolverResponse(
+            updates=[parsed.update],
+            answer_consumed_for_current_node=True,
+            priority_shift=[],
+            conflicts_detected=False,
+            reasoning=parsed.update.reasoning,
+        )
+    
+    async def _use_speculation(
+        self,
+        speculation: SpeculativeQuestion,
+        user_input: str,
+        state_resolution: Any,
+    ) -> dict[str, Any] | None:
+        """
+        Return the speculative turn result if this reply was a plain answer to the pending question.
+        
+        Requires a short reply that only filled the expected field's node (no conflicts or
+        priority shifts), with the node's next missing field unchanged from the prediction.
+        The ConversationAgent is skipped for the turn, so its Agno history lacks this
+        exchange; the next prompt still carries the last question and the graph snapshot.
+        """
+        node_name = speculation.node_name
+        updated = [u for u in (state_resolution.updates or []) if u.node_name and u.field_name is not None]
+        reason = None
+        if len(user_input) > Config.SPECULATIVE_MAX_ANSWER_CHARS:
+            reason = "long_answer"
+        elif not state_resolution.answer_consumed_for_current_node:
+            reason = "not_answered"
+        elif state_resolution.conflicts_detected or state_resolution.priority_shift:
+            reason = "topology"
+        elif any(u.node_name != node_name for u in updated):
+            reason = "cross_node"
+        elif speculation.answered_field.split(".")[0] not in {u.field_name for u in updated}:
+            reason = "field_not_answered"
+        elif self._get_next_missing_field(node_name) != speculation.next_field:
+            reason = "next_field_changed"
+        if reason:
+            speculation.discard(reason)
+            return None
+        try:
+            compliant = await speculation.review
+        except Exception:
+            metrics.inc("speculation.miss")
+            metrics.inc("speculation.miss.review_failed")
+            return None
+        metrics.inc("speculation.hit")
+        
+        self.current_mode = OrchestratorMode.DATA_GATHERING
+        self.traversal_paused = False
+        self.paused_node = None
+        self._current_node_being_collected = node_name
+        self.graph_memory.mark_question_asked(node_name, speculation.next_field)
+        self._last_question = speculation.question
+        self._last_question_node = node_name
+        self._last_question_field = speculation.next_field
+        self._speculate(node_name, speculation.next_field)
+        
+        return {
+            "mode": self.current_mode.value,
+            "question": compliant.compliant_response,
+            "node_name": node_name,
+            "complete": False,
+            "visited_all": False,
+            "goal_state": self._goal_state_payload_arrays(),
+            "all_collected_data": self.graph_memory.get_all_nodes_data(),
+            "extracted_data": self.graph_memory.get_node_data(node_name) or {},
+            "upcoming_nodes": sorted(list(self.graph_memory.pending_nodes))[:5],
+            "speculative": True,
+        }
+    
+    async def _converse(
+        self,
+        user_message: str,
+        context: dict[str, Any],
+        on_event: EventSink | None,
+    ) -> tuple[ConversationResponse, StreamGate | None]:
+        """
+        Run ConversationAgent, streaming its text when enabled.
+        
+        With Config.STREAM_RESPONSES and an event sink, response_text is pushed as
+        {"kind": "question_delta", "delta", "seq"} events once the stream gate
+        (Config.STREAM_COMPLIANCE_POLICY) releases it. Returns the response and the
+        gate (None when not streamed).
+        """
+        if not (Config.STREAM_RESPONSES and on_event):
+            response = await traced("conversation", self.conversation_agent.aprocess(user_message=user_message, **context))
+            return response, None
+        
+        gate = StreamGate(Config.STREAM_COMPLIANCE_POLICY)
+        seq = 0
+        
+        async def _emit(text: str) -> None:
+            nonlocal seq
+            if text:
+                await on_event({"kind": "question_delta", "delta": text, "seq": seq})
+                seq += 1
+                metrics.inc("stream.deltas")
+        
+        async def _on_text(text: str) -> None:
+            await _emit(gate.push(text))
+        
+        with stage("conversation"):
+            response = await self.conversation_agent.astream(user_message, _on_text, **context)
+        await _emit(gate.flush())
+        metrics.inc("stream.turns")
+        return response, gate
+    
+    def _attach_trace(self, result: dict[str, Any], trace: TurnTrace) -> dict[str, Any]:
+        """
+        Keep the finished turn trace as last_turn_trace and, with Config.TURN_TRACE_IN_RESPONSE,
+        add it to the payload as "trace".
+        
+        A nested turn (astart() -> arespond()) joins the outer, still open trace;
+        only the outermost call attaches it.
+        """
+        if trace.seconds is None:
+            return result
+        self.last_turn_trace = trace
+        if Config.TURN_TRACE_IN_RESPONSE and isinstance(result, dict):
+            result["trace"] = trace.to_dict()
         return result
     
+    def _finish_stream(self, result: dict[str, Any], stream: StreamGate | None) -> dict[str, Any]:
+        """
+        Mark a turn payload whose text was (partly) streamed.
+        
+        The payload question is always authoritative; stream_revised tells the client the
+        streamed text differs from it (halted, rewritten by compliance or replaced).
+        """
+        if stream is None or not stream.released:
+            return result
+        result["streamed"] = True
+        result["stream_revised"] = (result.get("question") or "") != stream.released
+        if result["stream_revised"]:
+            metrics.inc("stream.revised")
+        return result
+    
+    async def _run_visualization(self, response, on_event: EventSink | None = None) -> dict[str, Any]:
+        """
+        Run CalculationAgent for a visualization request and render charts per calculation.
+        
+        Chart rendering for all calculations is dispatched concurrently (capped by
+        Config.CHART_RENDER_CONCURRENCY); events keep the calculation order.
+        Returns the visualization payload (event list) consumed by the websocket handler.
+        """
+        chart_tasks: list[asyncio.Future | None] = []
+        try:
+            # CalculationAgent decides which calculator(s) to run and extracts inputs from graph.
+            self.calculation_agent.update_graph_memory(self.graph_memory)
+            calc_resp = await traced("calculation", self.calculation_agent.acalculate(response.visualization_request))
+
+            calc_events: list[dict[str, Any]] = []
+            any_missing = False
+            semaphore = asyncio.Semaphore(max(1, Config.CHART_RENDER_CONCURRENCY))
+
+            async def _render(calculation_type: str, inputs: dict[str, Any], result: dict[str, Any], data_used: list[str]):
+                async with semaphore:
+                    chart_bundle = await traced("chart_rendering", self.visualization_agent.agenerate_charts(
+                        calculation_type,
+                        inputs,
+                        result,
+                        data_used,
+                    ))
+                return self._visualization_event(calculation_type, inputs, chart_bundle)
+
+            for item in (calc_resp.calculations or []):
+                # Deterministic recompute in orchestrator for robustness (agent may omit result).
+                result = item.result or {}
+                missing = item.missing_data or []
+
+                if item.deterministic and item.calculation_type != "custom":
+                    missing = validate_inputs(item.calculation_type, item.inputs or {})
+                    if not missing:
+                        # Off the event loop: some calculators (Monte Carlo) take tens of ms
+                        result = await asyncio.to_thread(calculate, item.calculation_type, item.inputs or {})
+
+                can_calc = (item.calculation_type == "custom" and bool(item.can_calculate)) or (not bool(missing))
+                if missing:
+                    any_missing = True
+
+                calc_events.append(
+                    {
+                        "kind": "calculation",
+                        "calculation_type": item.calculation_type,
+                        "result": result,
+                        "can_calculate": can_calc,
+                        "missing_data": missing,
+                        "message": item.formula_summary or (calc_resp.summary or "Calculation result"),
+                        "data_used": item.data_used or [],
+                        "inputs": item.inputs or {},
+                        "deterministic": bool(item.deterministic),
+                    }
+                )
+
+                # Start chart rendering right away; results are joined in order below.
+                if can_calc and result:
+                    chart_tasks.append(
+                        asyncio.ensure_future(
+                            _render(item.calculation_type, item.inputs or {}, result, item.data_used or [])
+                        )
+                    )
+                else:
+                    chart_tasks.append(None)
+
+            events: list[dict[str, Any]] = []
+            for calc_event, chart_task in zip(calc_events, chart_tasks):
+                events.append(calc_event)
+                if on_event:
+                    await on_event(calc_event)
+                if chart_task is not None:
+                    viz_event = await chart_task
+                    events.append(viz_event)
+                    if on_event:
+                        await on_event(viz_event)
+
+            if any_missing:
+                self.traversal_paused = True
+                self.paused_node = response.question_target_node
+
+            return {
+                "type": "visualization",
+                "events": events,
+                "events_streamed": on_event is not None,
+                "can_calculate": not any_missing,
+                "resume_prompt": None,
+            }
+        except Exception as e:
+            return {
+                "type": "visualization",
+                "calculation_type": "error",
+                "can_calculate": False,
+                "result": {},
+                "message": f"Could not generate visualization: {str(e)}",
+                "missing_data": [],
+                "data_used": [],
+            }
+        finally:
+            for task in chart_tasks:
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    def _visualization_event(self, calculation_type: str, inputs: dict[str, Any], chart_bundle) -> dict[str, Any]:
+        """Convert a VisualizationCharts bundle into a websocket visualization event."""
+        charts = chart_bundle.charts or []
+        first_chart = charts[0] if charts else None
+        return {
+            "kind": "visualization",
+            "calculation_type": calculation_type,
+            "inputs": inputs,
+            "charts": [
+                {
+                    "chart_type": c.chart_type,
+                    "data": c.data,
+                    "title": c.title,
+                    "description": c.description,
+                    "config": c.config,
+                }
+                for c in charts
+            ],
+            "chart_type": first_chart.chart_type if first_chart else "",
+            "data": first_chart.data if first_chart else {},
+            "title": first_chart.title if first_chart else "",
+            "description": first_chart.description if first_chart else "",
+            "config": first_chart.config if first_chart else {},
+        }
+    
     def _should_start_goal_details(self, response) -> bool:
         """
         Start goal details collection only when:
@@ -1271,7 +1650,7 @@ class Orchestrator:
         items.sort(key=lambda x: x[0])
         return [gid for _, gid in items]
 
-    def _start_goal_details(self) -> dict[str, Any] | None:
+    async def _start_goal_details(self) -> dict[str, Any] | None:
         """Enter goal details collection for the next goal in queue."""
         queue = self._get_goal_details_queue()
         if not queue:
@@ -1284,22 +1663,24 @@ class Orchestrator:
         self._goal_details_goal_id = goal_id
 
         # Ask agent to generate the question + placeholders
-        agent_resp = self.goal_details_agent.run(
+        agent_resp = await traced("goal_details", self.goal_details_agent.arun(
             goal={"goal_id": goal_id, **meta},
             goal_state=self._goal_state_payload_arrays(),
             graph_snapshot=self.graph_memory.get_all_nodes_data(),
             user_message="",
-        )
+        ))
         self._goal_details_missing_fields = agent_resp.missing_fields or []
 
         question = agent_resp.question or f"For your goal '{goal_id}', what target amount and timeframe are you aiming for?"
-        compliant = self.compliance_agent.review(
+        compliant = await traced("compliance", self.compliance_agent.areview(
             response_text=question,
             response_type="conversation",
             context_summary=f"Goal details for {goal_id}",
-        )
+            server_generated=not agent_resp.question,
+        ))
         self._last_question = question
         self._last_question_node = None
+        self._last_question_field = None
         return {
             "mode": "data_gathering",
             "question": compliant.compliant_response,
@@ -1316,7 +1697,7 @@ class Orchestrator:
             },
         }
 
-    def _handle_goal_details(self, user_input: str) -> dict[str, Any]:
+    async def _handle_goal_details(self, user_input: str) -> dict[str, Any]:
         """Handle a user reply during goal details collection."""
         goal_id = self._goal_details_goal_id
         if not goal_id:
@@ -1327,12 +1708,12 @@ class Orchestrator:
         if not isinstance(meta, dict):
             meta = {}
 
-        agent_resp = self.goal_details_agent.run(
+        agent_resp = await traced("goal_details", self.goal_details_agent.arun(
             goal={"goal_id": goal_id, **meta},
             goal_state=self._goal_state_payload_arrays(),
             graph_snapshot=self.graph_memory.get_all_nodes_data(),
             user_message=user_input,
-        )
+        ))
 
         # Apply extracted details to goal metadata
         details = agent_resp.extracted_details or {}
@@ -1344,11 +1725,12 @@ class Orchestrator:
         # If not done, ask follow-up
         if not agent_resp.done:
             question = agent_resp.question or "Got it. What’s the target amount and by when?"
-            compliant = self.compliance_agent.review(
+            compliant = await traced("compliance", self.compliance_agent.areview(
                 response_text=question,
                 response_type="conversation",
                 context_summary=f"Goal details for {goal_id}",
-            )
+                server_generated=not agent_resp.question,
+            ))
             return {
                 "mode": "data_gathering",
                 "question": compliant.compliant_response,
@@ -1370,17 +1752,18 @@ class Orchestrator:
         self._goal_details_goal_id = None
         self._goal_details_missing_fields = []
 
-        nxt = self._start_goal_details()
+        nxt = await self._start_goal_details()
         if nxt:
             return nxt
 
         # No more goals to detail; return a short wrap-up
         done_msg = "Thanks — that covers the key details for your goals. What would you like to do next?"
-        compliant = self.compliance_agent.review(
+        compliant = await traced("compliance", self.compliance_agent.areview(
             response_text=done_msg,
             response_type="conversation",
             context_summary="Goal details complete",
-        )
+            server_generated=True,
+        ))
         return {
             "mode": "data_gathering",
             "question": compliant.compliant_response,
@@ -1407,14 +1790,9 @@ class Orchestrator:
         if not node_name or node_name not in self.NODE_REGISTRY:
             return []
 
-        node_cls = self.NODE_REGISTRY[node_name]
+        entry = NODE_SCHEMAS.get(node_name)
         snapshot = self.graph_memory.node_snapshots.get(node_name, {}) or {}
-
-        spec = None
-        try:
-            spec = node_cls.collection_spec()
-        except Exception:
-            spec = None
+        spec = entry.collection_spec if entry else None
 
         if spec:
             missing: list[str] = []
@@ -1445,16 +1823,7 @@ class Orchestrator:
             return missing
 
         # Fallback: schema-based (legacy)
-        schema = node_cls.model_json_schema()
-        properties = schema.get("properties", {})
-        base_fields = {"id", "node_type", "created_at", "updated_at", "metadata"}
-        missing_fields: list[str] = []
-        for field_name in properties.keys():
-            if field_name in base_fields:
-                continue
-            if field_name not in snapshot:
-                missing_fields.append(field_name)
-        return missing_fields
+        return [f for f in (entry.fields if entry else ()) if f not in snapshot]
 
     def _get_detail_missing_fields_for_node(self, node_name: str) -> list[str]:
         """
@@ -1549,3 +1918,123 @@ class Orchestrator:
             ],
             "data": self.graph_memory.get_all_nodes_data(),
         }
+
+    # =========================================================================
+    # STATE SNAPSHOTS (session persistence)
+    # =========================================================================
+
+    def to_state(self) -> dict[str, Any]:
+        """
+        Snapshot the full conversational state (graph memory + orchestrator flags).
+
+        Agents are not included; they are stateless apart from Agno's own SQLite
+        history, which is keyed by session_id and survives restarts on its own.
+        The snapshot shares dicts with the live graph memory; serialize it before
+        the next turn runs (api.sessions encodes it on the event loop).
+        """
+        return {
+            "state_version": self.STATE_VERSION,
+            "session_id": self.session_id,
+            "model_id": self.model_id,
+            "initial_context": self.initial_context,
+            "user_goal": self.user_goal,
+            "graph_memory": self.graph_memory.to_dict(),
+            "current_mode": self.current_mode.value,
+            "last_question": self._last_question,
+            "last_question_node": self._last_question_node,
+            "last_question_field": self._last_question_field,
+            "goal_intake_complete": self._goal_intake_complete,
+            "current_node_being_collected": self._current_node_being_collected,
+            "scenario_framing_active": self._scenario_framing_active,
+            "scenario_turn": self._scenario_turn,
+            "pending_scenario_goal": self._pending_scenario_goal,
+            "scenario_history": list(self._scenario_history),
+            "priority_planning_done": self._priority_planning_done,
+            "processed_inferred_goals": sorted(self._processed_inferred_goals),
+            "goal_inference_activated": self._goal_inference_activated,
+            "scenario_goal_queue": [goal.model_dump() for goal in self._scenario_goal_queue],
+            "goal_details_active": self._goal_details_active,
+            "goal_details_goal_id": self._goal_details_goal_id,
+            "goal_details_missing_fields": list(self._goal_details_missing_fields),
+            "traversal_paused": self.traversal_paused,
+            "paused_node": self.paused_node,
+        }
+
+    # ------------------------------------------------------------------
+    # Agents (lazy; session-independent ones come from the process-wide pool)
+    # ------------------------------------------------------------------
+
+    @property
+    def state_resolver(self) -> StateResolverAgent:
+        """Shared fact extractor for this model."""
+        return shared_agent(StateResolverAgent, self.model_id)
+
+    @property
+    def compliance_agent(self) -> ComplianceAgent:
+        """Shared compliance filter for this model."""
+        return shared_agent(ComplianceAgent, self.model_id)
+
+    @cached_property
+    def conversation_agent(self) -> ConversationAgent:
+        """Per-session conversation agent (history keyed by session_id)."""
+        return ConversationAgent(model_id=self.model_id, session_id=self.session_id)
+
+    @cached_property
+    def goal_inference_agent(self) -> GoalInferenceAgent:
+        """Per-session goal inference agent."""
+        return GoalInferenceAgent(model_id=self.model_id, session_id=self.session_id)
+
+    @cached_property
+    def goal_details_agent(self) -> GoalDetailsParserAgent:
+        """Per-session goal details parser."""
+        return GoalDetailsParserAgent(model_id=self.model_id, session_id=self.session_id)
+
+    @cached_property
+    def scenario_framer_agent(self) -> ScenarioFramerAgent:
+        """Per-session scenario framer."""
+        return ScenarioFramerAgent(model_id=self.model_id, session_id=self.session_id)
+
+    @cached_property
+    def calculation_agent(self) -> CalculationAgent:
+        """Calculation agent bound to this session's graph memory."""
+        return CalculationAgent(model_id=self.model_id, graph_memory=self.graph_memory)
+
+    @cached_property
+    def visualization_agent(self) -> VisualizationAgent:
+        """Visualization agent bound to this session's graph memory (renderer is shared)."""
+        return VisualizationAgent(model_id=self.model_id, graph_memory=self.graph_memory)
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "Orchestrator":
+        """Rebuild an orchestrator from a to_state() snapshot."""
+        orchestrator = cls(
+            initial_context=state.get("initial_context"),
+            model_id=state.get("model_id"),
+            session_id=state.get("session_id"),
+        )
+        orchestrator.user_goal = state.get("user_goal", orchestrator.initial_context)
+        # Agents are not built yet, so they bind to the restored memory on first use
+        orchestrator.graph_memory = GraphMemory.from_dict(state.get("graph_memory") or {})
+
+        orchestrator.current_mode = OrchestratorMode(state.get("current_mode", OrchestratorMode.DATA_GATHERING.value))
+        orchestrator._last_question = state.get("last_question")
+        orchestrator._last_question_node = state.get("last_question_node")
+        orchestrator._last_question_field = state.get("last_question_field")
+        orchestrator._goal_intake_complete = bool(state.get("goal_intake_complete"))
+        orchestrator._current_node_being_collected = state.get("current_node_being_collected")
+        orchestrator._scenario_framing_active = bool(state.get("scenario_framing_active"))
+        orchestrator._scenario_turn = int(state.get("scenario_turn") or 0)
+        orchestrator._pending_scenario_goal = state.get("pending_scenario_goal")
+        orchestrator._scenario_history = list(state.get("scenario_history") or [])
+        orchestrator._priority_planning_done = bool(state.get("priority_planning_done"))
+        orchestrator._processed_inferred_goals = set(state.get("processed_inferred_goals") or [])
+        orchestrator._goal_inference_activated = bool(state.get("goal_inference_activated"))
+        orchestrator._scenario_goal_queue = [
+            GoalCandidate.model_validate(goal) for goal in state.get("scenario_goal_queue") or []
+        ]
+        orchestrator._goal_details_active = bool(state.get("goal_details_active"))
+        orchestrator._goal_details_goal_id = state.get("goal_details_goal_id")
+        orchestrator._goal_details_missing_fields = list(state.get("goal_details_missing_fields") or [])
+        orchestrator.traversal_paused = bool(state.get("traversal_paused"))
+        orchestrator.paused_node = state.get("paused_node")
+        return orchestrator
@@ -0,0 +1,82 @@
+"""
+TurnScheduler - Dependency-aware fan-out for the agent calls of a single turn.
+
+The orchestrator registers each agent call as a named step with the steps it
+depends on. Steps whose dependencies are satisfied run concurrently, so the
+latency of a turn follows the critical path instead of the sum of all calls.
+
+Example:
+    scheduler = TurnScheduler(max_concurrency=4)
+    scheduler.add("compliance", lambda deps: compliance_agent.areview(...))
+    scheduler.add("calculation", lambda deps: calculation_agent.acalculate(...))
+    scheduler.add("charts", lambda deps: render(deps["calculation"]), after=["calculation"])
+    results = await scheduler.run()
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+StepFn = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class TurnScheduler:
+    """Runs named async steps as a DAG, bounded by a concurrency limit."""
+
+    def __init__(self, max_concurrency: int | None = None):
+        """Initialize an empty plan. max_concurrency <= 0 or None means unbounded."""
+        self._steps: dict[str, tuple[StepFn, tuple[str, ...]]] = {}
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency and max_concurrency > 0 else None
+        )
+
+    def add(self, name: str, fn: StepFn, after: list[str] | tuple[str, ...] = ()) -> None:
+        """
+        Register a step.
+
+        Args:
+            name: Unique step name (also the key in run() results)
+            fn: Coroutine factory receiving the results of its dependencies
+            after: Names of steps that must finish before this one starts
+        """
+        if name in self._steps:
+            raise ValueError(f"Duplicate step: {name}")
+        for dep in after:
+            if dep not in self._steps:
+                raise ValueError(f"Step '{name}' depends on unknown step '{dep}'")
+        self._steps[name] = (fn, tuple(after))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._steps
+
+    async def run(self) -> dict[str, Any]:
+        """
+        Execute all steps and return {step_name: result}.
+
+        Steps only wait on their own dependencies. If any step raises, the
+        remaining steps are cancelled and the exception propagates.
+        """
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def _run_step(name: str) -> Any:
+            fn, after = self._steps[name]
+            dep_results = {}
+            for dep in after:
+                dep_results[dep] = await tasks[dep]
+            if self._semaphore is None:
+                return await fn(dep_results)
+            async with self._semaphore:
+                return await fn(dep_results)
+
+        # Steps can only depend on earlier registrations, so insertion order is topological.
+        for name in self._steps:
+            tasks[name] = asyncio.ensure_future(_run_step(name))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return {name: task.result() for name, task in tasks.items()}
@@ -0,0 +1,36 @@
+"""
+Speculative next question - Precomputed follow-up for the field just asked.
+
+While the user is typing an answer to (node, field), the orchestrator already
+knows the deterministic follow-up if that answer is a plain one: the node's
+next missing field, phrased by _fallback_question_text(). The question text is
+built immediately and its compliance verdict is fetched in the background; the
+next turn reuses both (skipping ConversationAgent) only if StateResolver
+confirms the expected field was answered and nothing else changed.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from services.metrics import metrics
+
+
+@dataclass
+class SpeculativeQuestion:
+    """A precomputed follow-up question for one expected answer."""
+
+    node_name: str
+    answered_field: str  # field the pending question asks for
+    next_field: str  # field the speculative question asks for
+    question: str
+    review: "asyncio.Task[Any]"  # ComplianceAgent.areview() of question
+
+    def discard(self, reason: str) -> None:
+        """Drop the speculation (cancel or reap the background review)."""
+        metrics.inc("speculation.miss")
+        metrics.inc(f"speculation.miss.{reason}")
+        if not self.review.done():
+            self.review.cancel()
+        elif not self.review.cancelled():
+            self.review.exception()  # mark retrieved
@@ -1,9 +1,17 @@
 """
 Script to run the FastAPI server.
+
+Set WEB_CONCURRENCY > 1 to run several worker processes (requires a shared
+session backend: SESSION_SHARED_BACKEND=true with SQLite/file persistence).
 """
 
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
-
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1:
+        uvicorn.run("api.main:app", host="0.0.0.0", port=8000, workers=workers)
+    else:
+        uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,268 @@
+"""
+Deterministic fast-path answer parser (LLM-free).
+
+Short, unambiguous replies to a question about one field ("35", "120k",
+"about $3,500 a month", "yes", "self-employed") are parsed locally into a
+NodeUpdate using the field's type from the node schema:
+- int / float: exactly one number (k/m suffixes, currency, thousands
+  separators, %, per-week/month/year conversions for *_monthly / *_annual
+  fields, years into *_months / *_weeks fields), range-checked; a duration
+  or period the field can't hold falls back
+- bool: a bare yes/no
+- Enum: the reply names exactly one enum value
+
+Hedged replies ("about 120k") are accepted with a lower confidence; bounded
+ones ("over 40", "under 5k") are not exact answers and fall back.
+
+Anything else (extra facts, several numbers, free text, a change to an already
+recorded value) returns None and the caller falls back to StateResolverAgent.
+Counters in services.metrics track the hit rate.
+"""
+
+import re
+import types
+import typing
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from memory.field_history import NodeUpdate
+from nodes.schema_registry import NODE_SCHEMAS
+from services.metrics import metrics
+
+# Hedges: allowed around the answer, but the update gets HEDGED_CONFIDENCE.
+# Bounds ("over 40", "under 5k", "up to", "at least") are not allowed and fall back.
+_HEDGES = {"about", "around", "roughly", "approximately", "approx", "maybe", "probably"}
+# Words allowed around the answer without changing its meaning
+_FILLER = _HEDGES | {
+    "just",
+    "i", "im", "i'm", "am", "we", "we're", "were", "are", "is", "it's", "its", "have", "has", "got", "currently",
+    "my", "our", "in", "at", "of", "a", "an", "the", "total", "all", "to", "so", "well", "um", "uh",
+    "dollars", "dollar", "bucks", "aud", "old", "yo", "age", "aged",
+    "savings", "saved", "balance", "thanks", "thank", "you",
+}
+# Same register as StateResolver's own confidence for "About 50k per month"
+HEDGED_CONFIDENCE = 0.85
+_YES = {"yes", "yep", "yeah", "yup", "y", "sure", "correct", "true", "i do", "we do", "i have", "we have", "absolutely", "definitely"}
+_NO = {"no", "nope", "nah", "n", "false", "i don't", "i dont", "we don't", "we dont", "not really", "none", "i do not", "we do not"}
+_NONE_WORDS = {"none", "nothing", "zero", "nil", "no savings", "nothing at all"}
+
+_NUMBER = re.compile(
+    r"(?<![\w.])(-?\$?\s?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?)\s*(k|m|mil|million|thousand|grand|%)?(?![\w])",
+    re.IGNORECASE,
+)
+_PERIODS = [
+    ("week", re.compile(r"\b(a|per|each|every)\s+week\b|\bweekly\b|\bp/?w\b|/\s*w(ee)?k\b", re.IGNORECASE)),
+    ("month", re.compile(r"\b(a|per|each|every)\s+month\b|\bmonthly\b|\bp/?m\b|/\s*mo(nth)?\b", re.IGNORECASE)),
+    ("year", re.compile(r"\b(a|per|each|every)\s+year\b|\b(annually|yearly|annual)\b|\bp\.?a\.?(?!\w)|/\s*(yr|year)\b", re.IGNORECASE)),
+]
+_PER_MONTH = {"week": 52 / 12, "month": 1.0, "year": 1 / 12}
+# Durations ("2 years", "6 weeks"); only converted into the field's own unit when exact
+_DURATION = re.compile(r"\b(?:(years?|yrs?)|(months?|mos?)|(weeks?|wks?))\b", re.IGNORECASE)
+_DURATION_UNITS = ("year", "month", "week")
+_IN_FIELD_UNIT = {
+    "year": {"year": 1},
+    "month": {"month": 1, "year": 12},
+    "week": {"week": 1, "year": 52},
+}
+_MULTIPLIERS = {"k": 1_000, "thousand": 1_000, "grand": 1_000, "m": 1_000_000, "mil": 1_000_000, "million": 1_000_000}
+
+
+@dataclass(frozen=True)
+class FastPathResult:
+    """A locally parsed answer."""
+
+    update: NodeUpdate
+    kind: str  # "number" | "bool" | "enum"
+
+
+def _field_type(node_name: str, field_name: str) -> Any:
+    """Field annotation with Optional[...] unwrapped (None if unknown or a union)."""
+    entry = NODE_SCHEMAS.get(node_name)
+    if entry is None or field_name not in entry.fields:
+        return None
+    annotation = entry.node_cls.model_fields[field_name].annotation
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return args[0] if len(args) == 1 else None
+    return annotation
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text.strip().lower()).strip(" .!?,")
+
+
+def _only_filler(text: str) -> bool:
+    words = re.findall(r"[a-z.'/$]+", text)
+    return all(w.strip(".'/$") in _FILLER or not w.strip(".'/$") for w in words)
+
+
+def _field_period(field_name: str) -> str | None:
+    if "monthly" in field_name:
+        return "month"
+    if "annual" in field_name:
+        return "year"
+    return None
+
+
+def _field_unit(field_name: str) -> str | None:
+    if field_name.endswith("_months"):
+        return "month"
+    if field_name.endswith("_weeks"):
+        return "week"
+    if field_name == "age" or field_name.endswith("_age"):
+        return "year"
+    return None
+
+
+def _in_range(field_name: str, value: float) -> bool:
+    if value < 0:
+        return False
+    if field_name.endswith("age") or field_name.endswith("_age"):
+        return 0 < value <= 120
+    if field_name.endswith("_months") or field_name.endswith("_weeks"):
+        return value <= 1200
+    if field_name.startswith("number_of"):
+        return value <= 30
+    if "rate" in field_name:
+        return value <= 1
+    return value < 1e10
+
+
+def _parse_number(field_name: str, text: str, as_int: bool) -> float | int | None:
+    if text in _NONE_WORDS and not as_int:
+        return 0.0
+    matches = list(_NUMBER.finditer(text))
+    if len(matches) != 1:
+        return None
+    match = matches[0]
+    raw, suffix = match.group(1), (match.group(2) or "").lower()
+    try:
+        value = float(raw.replace("$", "").replace(",", "").replace(" ", ""))
+    except ValueError:
+        return None
+    rest = text[:match.start()] + " " + text[match.end():]
+
+    if suffix == "%":
+        if "rate" not in field_name:
+            return None
+        value /= 100
+    elif suffix:
+        value *= _MULTIPLIERS[suffix]
+
+    periods = [name for name, pattern in _PERIODS if pattern.search(rest)]
+    target = _field_period(field_name)
+    if len(periods) > 1 or (periods and not target):
+        return None  # conflicting or unexpected period
+    if periods and target:
+        monthly = value * _PER_MONTH[periods[0]]
+        value = monthly if target == "month" else monthly * 12
+        value = round(value, 2)
+    for _, pattern in _PERIODS:
+        rest = pattern.sub(" ", rest)
+
+    units = {
+        unit for match in _DURATION.finditer(rest)
+        for unit, word in zip(_DURATION_UNITS, match.groups()) if word
+    }
+    if units:
+        field_unit = _field_unit(field_name)
+        factor = _IN_FIELD_UNIT.get(field_unit, {}).get(units.pop()) if len(units) == 1 else None
+        if factor is None:
+            return None  # duration in a unit the field doesn't use
+        value *= factor
+        rest = _DURATION.sub(" ", rest)
+    if not _only_filler(rest):
+        return None
+    if not _in_range(field_name, value):
+        return None
+    if as_int:
+        if value != int(value):
+            return None
+        return int(value)
+    return value
+
+
+def _parse_bool(text: str) -> bool | None:
+    if text in _YES:
+        return True
+    if text in _NO:
+        return False
+    return None
+
+
+def _parse_enum(enum_cls: type[Enum], text: str) -> Enum | None:
+    words = [w for w in re.findall(r"[a-z0-9]+", text.replace("'", "")) if w not in _FILLER]
+    candidate = "_".join(words)
+    matches = [
+        member for member in enum_cls
+        if candidate in (str(member.value).lower(), member.name.lower(), str(member.value).lower().replace("_", ""))
+    ]
+    return matches[0] if len(matches) == 1 else None
+
+
+def parse_answer(
+    node_name: str | None,
+    field_name: str | None,
+    text: str,
+    current_value: Any = None,
+    max_chars: int = 60,
+) -> FastPathResult | None:
+    """
+    Parse a reply to the question about node_name.field_name.
+
+    Returns None (fall back to the LLM) unless the reply unambiguously answers
+    that field. A reply that would change an already recorded value also falls
+    back, so corrections keep the resolver's conflict handling.
+    """
+    if not node_name or not field_name or "." in field_name:
+        return None
+    metrics.inc("answers.fast_path.attempted")
+    result = _parse(node_name, field_name, text, max_chars)
+    if result is not None and current_value is not None and current_value != result.update.value:
+        result = None
+    if result is None:
+        metrics.inc("answers.fast_path.fallback")
+        return None
+    metrics.inc("answers.fast_path.hit")
+    metrics.inc(f"answers.fast_path.hit.{result.kind}")
+    return result
+
+
+def _parse(node_name: str, field_name: str, text: str, max_chars: int) -> FastPathResult | None:
+    if not text or len(text) > max_chars:
+        return None
+    field_type = _field_type(node_name, field_name)
+    if field_type is None:
+        return None
+    normalized = _normalize(text)
+
+    value: Any = None
+    kind = ""
+    if field_type is bool:
+        value, kind = _parse_bool(normalized), "bool"
+    elif field_type in (int, float):
+        value, kind = _parse_number(field_name, normalized, as_int=field_type is int), "number"
+    elif isinstance(field_type, type) and issubclass(field_type, Enum):
+        member = _parse_enum(field_type, normalized)
+        value, kind = (member.value if member is not None else None), "enum"
+    if value is None:
+        return None
+    hedged = not _HEDGES.isdisjoint(re.findall(r"[a-z]+", normalized))
+    return FastPathResult(
+        update=NodeUpdate(
+            node_name=node_name,
+            field_name=field_name,
+            value=value,
+            confidence=HEDGED_CONFIDENCE if hedged else 1.0,
+            temporal_context="present",
+            is_correction=False,
+            reasoning=f"Deterministic fast-path parse of a direct answer: {text.strip()!r}",
+        ),
+        kind=kind,
+    )
+
+
+def hit_rate() -> float | None:
+    """Share of fast-path attempts answered locally (None before any attempt)."""
+    return metrics.ratio("answers.fast_path.hit", "answers.fast_path.attempted")
@@ -3,19 +3,32 @@ Calculation engine for deterministic financial computations (AU context).
 
 This module is LLM-free and provides validation + calculation for a set of
 non-super calculators. It is intended for internal use by the orchestrator.
+
+calculate() evaluates one scalar input dict. calculate_batch() evaluates a
+calculator over input columns with NumPy broadcasting (scenario sweeps, e.g.
+loan payments over a rate x term grid).
+amortization_schedule() returns a loan's per-period schedule as NumPy columns.
+retirement_monte_carlo runs services.retirement_simulation (no batch kernel).
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from config import Config
+from services.retirement_simulation import simulate_retirement
 
 
 CalculationInputs = dict[str, Any]
 CalculationResult = dict[str, Any]
 Validator = Callable[[CalculationInputs], list[str]]
 Calculator = Callable[[CalculationInputs], CalculationResult]
+BatchColumns = dict[str, np.ndarray]
+BatchCalculator = Callable[[BatchColumns], dict[str, Any]]
 
 
 @dataclass(frozen=True)
@@ -23,6 +36,7 @@ class CalculatorSpec:
     name: str
     validator: Validator
     calculator: Calculator
+    batch: BatchCalculator | None = None  # vectorized equivalent of calculator (None -> no calculate_batch)
 
 
 def _missing(inputs: CalculationInputs, fields: list[str]) -> list[str]:
@@ -44,6 +58,10 @@ def _budget(inputs: CalculationInputs) -> CalculationResult:
     }
 
 
+def _budget_batch(c: BatchColumns) -> dict[str, Any]:
+    return {"surplus": c["income"] - c["expenses"], "income": c["income"], "expenses": c["expenses"]}
+
+
 def _validate_net_worth(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["assets", "liabilities"])
 
@@ -58,6 +76,10 @@ def _net_worth(inputs: CalculationInputs) -> CalculationResult:
     }
 
 
+def _net_worth_batch(c: BatchColumns) -> dict[str, Any]:
+    return {"net_worth": c["assets"] - c["liabilities"], "assets": c["assets"], "liabilities": c["liabilities"]}
+
+
 def _validate_savings_goal(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["target_amount", "monthly_contribution", "annual_rate"])
 
@@ -79,6 +101,15 @@ def _savings_goal(inputs: CalculationInputs) -> CalculationResult:
     return {"target_amount": target, "monthly_contribution": contrib, "monthly_rate": rate, "months": months}
 
 
+def _savings_goal_batch(c: BatchColumns) -> dict[str, Any]:
+    target, contrib = c["target_amount"], c["monthly_contribution"]
+    rate = c["annual_rate"] / 12.0
+    ratio = target * rate / contrib + 1.0
+    months = np.where(rate == 0, target / contrib, np.log(ratio) / np.log1p(rate))
+    months = np.where((contrib <= 0) | ((rate != 0) & (ratio <= 0)), np.nan, months)
+    return {"target_amount": target, "monthly_contribution": contrib, "monthly_rate": rate, "months": months}
+
+
 def _validate_compound_interest(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["principal", "annual_rate", "years"])
 
@@ -92,20 +123,70 @@ def _compound_interest(inputs: CalculationInputs) -> CalculationResult:
     return {"future_value": amount, "principal": principal, "interest_earned": amount - principal}
 
 
+def _compound_interest_batch(c: BatchColumns) -> dict[str, Any]:
+    principal = c["principal"]
+    n = c.get("compounds_per_year", 12.0)
+    amount = principal * (1 + c["annual_rate"] / n) ** (n * c["years"])
+    return {"future_value": amount, "principal": principal, "interest_earned": amount - principal}
+
+
 def _validate_debt_repayment(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["balance", "annual_rate", "monthly_payment"])
 
 
+def _remaining_balance(balance: float, rate: float, payment: float, months: int) -> float:
+    """Balance after `months` payments, unclamped (negative = final payment overshoot)."""
+    if rate == 0:
+        return balance - payment * months
+    factor = math.expm1(months * math.log1p(rate))
+    return balance * (factor + 1) - payment * factor / rate
+
+
 def _debt_repayment(inputs: CalculationInputs) -> CalculationResult:
+    """
+    Months to repay a balance with a fixed monthly payment, in closed form.
+
+    months is the first whole month whose payment clears the balance
+    (ceil of the annuity log formula); total_interest is everything paid minus
+    the balance, net of the final payment's overshoot. A payment that does not
+    cover the first month's interest never repays the debt (months None).
+    """
     balance = float(inputs["balance"])
     rate = float(inputs["annual_rate"]) / 12.0
     payment = float(inputs["monthly_payment"])
     if payment <= 0:
         return {"months": None, "total_interest": None}
+    if balance <= 0:
+        return {"months": 0, "total_interest": 0.0, "starting_balance": balance}
+    if payment <= balance * rate:
+        return {"months": None, "total_interest": None, "starting_balance": balance}
+    if rate == 0:
+        exact = balance / payment
+    else:
+        exact = -math.log1p(-rate * balance / payment) / math.log1p(rate)
+    months = max(1, math.ceil(exact - 1e-9))
+    remaining = _remaining_balance(balance, rate, payment, months)
+    if remaining > 1e-9 * balance:  # the tolerance above rounded down one month too far
+        months += 1
+        remaining = _remaining_balance(balance, rate, payment, months)
+    return {"months": months, "total_interest": payment * months - balance + remaining, "starting_balance": balance}
+
+
+def _debt_repayment_reference(inputs: CalculationInputs) -> CalculationResult:
+    """
+    Month-by-month simulation of _debt_repayment (reference for checking the closed form).
+    """
+    balance = float(inputs["balance"])
+    rate = float(inputs["annual_rate"]) / 12.0
+    payment = float(inputs["monthly_payment"])
+    if payment <= 0:
+        return {"months": None, "total_interest": None}
+    if balance > 0 and payment <= balance * rate:
+        return {"months": None, "total_interest": None, "starting_balance": balance}
     months = 0
     total_interest = 0.0
     remaining = balance
-    while remaining > 0 and months < 1000:
+    while remaining > 0:
         interest = remaining * rate
         total_interest += interest
         remaining = remaining + interest - payment
@@ -115,6 +196,28 @@ def _debt_repayment(inputs: CalculationInputs) -> CalculationResult:
     return {"months": months, "total_interest": total_interest, "starting_balance": balance}
 
 
+def _debt_repayment_batch(c: BatchColumns) -> dict[str, Any]:
+    # Vectorized _debt_repayment, including its one-month tolerance correction
+    balance, payment = c["balance"], c["monthly_payment"]
+    rate = c["annual_rate"] / 12.0
+    growth = np.log1p(rate)
+
+    def remaining_after(months: np.ndarray) -> np.ndarray:
+        factor = np.expm1(months * growth)
+        return np.where(rate == 0, balance - payment * months, balance * (factor + 1) - payment * factor / rate)
+
+    exact = np.where(rate == 0, balance / payment, -np.log1p(-rate * balance / payment) / growth)
+    months = np.maximum(1.0, np.ceil(exact - 1e-9))
+    months = np.where(remaining_after(months) > 1e-9 * balance, months + 1, months)
+    months = np.where(payment <= balance * rate, np.nan, months)  # never repaid
+    months = np.where(balance > 0, months, 0.0)
+    remaining = remaining_after(months)
+    total_interest = np.where(balance > 0, payment * months - balance + remaining, 0.0)
+    return {
+        "months": np.where(payment <= 0, np.nan, months),
+        "total_interest": np.where(payment <= 0, np.nan, total_interest),
+        "starting_balance": np.where(payment <= 0, np.nan, balance),
+    }
 
 
 def _validate_loan(inputs: CalculationInputs) -> list[str]:
@@ -133,6 +236,166 @@ def _loan(inputs: CalculationInputs) -> CalculationResult:
     return {"monthly_payment": payment, "total_paid": total_paid, "total_interest": total_paid - principal}
 
 
+def _loan_batch(c: BatchColumns) -> dict[str, Any]:
+    principal = c["principal"]
+    rate = c["annual_rate"] / 12.0
+    months = np.trunc(c["years"] * 12)
+    growth = (1 + rate) ** months
+    payment = np.where(rate == 0, principal / months, principal * rate * growth / (growth - 1))
+    total_paid = payment * months
+    return {"monthly_payment": payment, "total_paid": total_paid, "total_interest": total_paid - principal}
+
+
+def _validate_amortization(inputs: CalculationInputs) -> list[str]:
+    return _missing(inputs, ["principal", "annual_rate", "years"])
+
+
+def _amortize(
+    principal: Any,
+    rate: Any,
+    payment: Any,
+    offset: Any,
+    term: Any,
+    periods: int,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized amortization over a trailing period axis (periods 1..periods).
+
+    Interest is charged on the balance above the offset. While the balance exceeds
+    the offset it follows the annuity closed form with an effective payment of
+    payment + rate * offset; once it is at or below the offset it falls by the
+    payment each period. Inputs broadcast together; periods after payoff or past
+    the term are zero.
+    """
+    b0, r, pay, off, last = (np.asarray(x, dtype=float)[..., None] for x in (principal, rate, payment, offset, term))
+    n = np.arange(periods + 1, dtype=float)
+    growth = np.expm1(n * np.log1p(r))
+    above = np.where(r == 0, b0 - pay * n, b0 * (growth + 1) - (pay + r * off) * growth / r)
+    # First balance at or below the offset; interest-free straight-line repayment after it
+    crossed = above <= off
+    k = np.where(crossed.any(axis=-1), crossed.argmax(axis=-1), periods)[..., None]
+    balance = np.where(n <= k, above, np.take_along_axis(above, k, axis=-1) - pay * (n - k))
+    balance = np.where(balance > 1e-9 * np.maximum(b0, 1.0), balance, 0.0)
+    opening, closing = balance[..., :-1], balance[..., 1:]
+    live = n[1:] <= last
+    interest = np.where(live, r * np.maximum(opening - off, 0.0), 0.0)
+    principal_paid = np.where(live, opening - closing, 0.0)
+    return {
+        "payment": principal_paid + interest,
+        "principal": principal_paid,
+        "interest": interest,
+        "balance": np.where(live, closing, 0.0),
+    }
+
+
+def _amortization_terms(principal: Any, annual_rate: Any, years: Any, per_year: Any, payment: Any) -> tuple[Any, Any, Any]:
+    # Per-period rate, periods in the term and the scheduled payment (amortizing unless given)
+    rate = annual_rate / per_year
+    term = np.trunc(years * per_year)
+    if payment is None:
+        growth = np.expm1(term * np.log1p(rate))
+        payment = np.where(rate == 0, principal / term, principal * rate * (growth + 1) / growth)
+    return rate, term, payment
+
+
+def amortization_schedule(inputs: CalculationInputs) -> dict[str, np.ndarray]:
+    """
+    Per-period amortization schedule as NumPy columns.
+
+    inputs: principal, annual_rate, years; optional payments_per_year (12),
+    payment (per period, defaults to the amortizing payment over the term),
+    extra_repayment (per period) and offset_balance. The offset does not change
+    the scheduled payment, so it (like extra repayments) shortens the loan.
+    The schedule ends at payoff or at the end of the term, whichever is first.
+    """
+    principal = float(inputs["principal"])
+    per_year = float(inputs.get("payments_per_year") or 12)
+    payment = inputs.get("payment")
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        rate, term, scheduled = _amortization_terms(
+            principal,
+            float(inputs["annual_rate"]),
+            float(inputs["years"]),
+            per_year,
+            None if payment in (None, "") else float(payment),
+        )
+        periods = max(0, int(term))
+        extra = float(inputs.get("extra_repayment") or 0.0)
+        offset = float(inputs.get("offset_balance") or 0.0)
+        rows = _amortize(principal, rate, float(scheduled) + extra, offset, term, periods)
+    outstanding = np.flatnonzero(rows["balance"] > 0)
+    length = min(periods, int(outstanding[-1]) + 2) if outstanding.size else min(periods, 1)
+    schedule = {"period": np.arange(1, length + 1)}
+    schedule.update({name: column[:length] for name, column in rows.items()})
+    return schedule
+
+
+def _yearly_schedule(schedule: dict[str, np.ndarray], per_year: int) -> dict[str, np.ndarray]:
+    # Flows summed per year, balance at year end (the last year may be partial)
+    length = len(schedule["period"])
+    if not length:
+        return {name: np.zeros(0) for name in ("year", "payment", "principal", "interest", "balance")}
+    starts = np.arange(0, length, per_year)
+    yearly = {"year": np.arange(1, len(starts) + 1)}
+    for name in ("payment", "principal", "interest"):
+        yearly[name] = np.add.reduceat(schedule[name], starts)
+    yearly["balance"] = schedule["balance"][np.minimum(starts + per_year, length) - 1]
+    return yearly
+
+
+def _columns(table: dict[str, np.ndarray]) -> dict[str, list[float]]:
+    return {name: np.round(column, 2).tolist() for name, column in table.items()}
+
+
+def _amortization(inputs: CalculationInputs) -> CalculationResult:
+    per_year = max(1, int(float(inputs.get("payments_per_year") or 12)))
+    schedule = amortization_schedule(inputs)
+    baseline = schedule
+    if inputs.get("extra_repayment") or inputs.get("offset_balance"):
+        baseline = amortization_schedule({**inputs, "extra_repayment": 0, "offset_balance": 0})
+    periods = int(np.count_nonzero(schedule["payment"]))
+    total_interest = float(schedule["interest"].sum())
+    result: CalculationResult = {
+        "periodic_payment": float(schedule["payment"][0]) if periods else 0.0,
+        "payments_per_year": per_year,
+        "periods": periods,
+        "total_paid": float(schedule["payment"].sum()),
+        "total_interest": total_interest,
+        "remaining_balance": float(schedule["balance"][-1]) if periods else float(inputs["principal"]),
+        "interest_saved": float(baseline["interest"].sum()) - total_interest,
+        "periods_saved": int(np.count_nonzero(baseline["payment"])) - periods,
+        "yearly": _columns(_yearly_schedule(schedule, per_year)),
+    }
+    # Per-period rows unless only the yearly aggregation was asked for
+    if not inputs.get("yearly"):
+        result["schedule"] = _columns(schedule)
+    return result
+
+
+def _amortization_batch(c: BatchColumns) -> dict[str, Any]:
+    principal = c["principal"]
+    per_year = c.get("payments_per_year", 12.0)
+    rate, term, scheduled = _amortization_terms(principal, c["annual_rate"], c["years"], per_year, c.get("payment"))
+    payment = scheduled + c.get("extra_repayment", 0.0)
+    periods = int(np.nanmax(term, initial=0)) if np.size(term) else 0
+    rows = _amortize(principal, rate, payment, c.get("offset_balance", 0.0), term, periods)
+    base = _amortize(principal, rate, scheduled, 0.0, term, periods)
+    total_interest = rows["interest"].sum(axis=-1)
+    count = np.count_nonzero(rows["payment"], axis=-1)
+    # Balance at the end of the term (the schedule is zero-padded past each term)
+    remaining = np.take_along_axis(rows["balance"], np.clip(term - 1, 0, max(periods - 1, 0)).astype(int)[..., None], axis=-1)[..., 0] if periods else principal
+    return {
+        "periodic_payment": payment,
+        "payments_per_year": per_year,
+        "periods": count,
+        "total_paid": rows["payment"].sum(axis=-1),
+        "total_interest": total_interest,
+        "remaining_balance": np.where(term > 0, remaining, principal),
+        "interest_saved": base["interest"].sum(axis=-1) - total_interest,
+        "periods_saved": np.count_nonzero(base["payment"], axis=-1) - count,
+    }
+
+
 def _validate_affordability(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["income", "expenses", "annual_rate", "years"])
 
@@ -151,6 +414,15 @@ def _loan_affordability(inputs: CalculationInputs) -> CalculationResult:
     return {"max_borrowing": max_borrow}
 
 
+def _loan_affordability_batch(c: BatchColumns) -> dict[str, Any]:
+    surplus = c["income"] - c["expenses"]
+    rate = c["annual_rate"] / 12.0
+    months = np.trunc(c["years"] * 12)
+    growth = (1 + rate) ** months
+    max_borrow = np.where(rate == 0, surplus * months, surplus * (growth - 1) / (rate * growth))
+    return {"max_borrowing": np.where(surplus <= 0, 0.0, max_borrow)}
+
+
 def _validate_credit_card(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["balance", "annual_rate", "monthly_payment"])
 
@@ -159,6 +431,10 @@ def _credit_card_payoff(inputs: CalculationInputs) -> CalculationResult:
     return _debt_repayment(inputs)
 
 
+def _credit_card_payoff_batch(c: BatchColumns) -> dict[str, Any]:
+    return _debt_repayment_batch(c)
+
+
 def _validate_retirement(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["current_savings", "annual_contribution", "annual_return", "years_to_retire", "annual_spending"])
 
@@ -184,6 +460,31 @@ def _retirement(inputs: CalculationInputs) -> CalculationResult:
     }
 
 
+def _retirement_batch(c: BatchColumns) -> dict[str, Any]:
+    current, contrib = c["current_savings"], c["annual_contribution"]
+    rate, years = c["annual_return"], c["years_to_retire"]
+    withdrawal_rate = c.get("withdrawal_rate", 0.04)
+    required = np.where(withdrawal_rate > 0, c["annual_spending"] / withdrawal_rate, np.nan)
+    growth = (1 + rate) ** years
+    projected = np.where(rate == 0, current + contrib * years, current * growth + contrib * ((growth - 1) / rate))
+    return {
+        "required_corpus": required,
+        "projected_corpus": projected,
+        "gap": required - projected,
+        "years_to_retire": years,
+    }
+
+
+def _validate_retirement_monte_carlo(inputs: CalculationInputs) -> list[str]:
+    return _missing(inputs, ["current_savings", "annual_contribution", "annual_return", "years_to_retire", "annual_spending"])
+
+
+def _retirement_monte_carlo(inputs: CalculationInputs) -> CalculationResult:
+    # Inputs come from the LLM: never more than the default path count here
+    requested = int(float(inputs.get("paths") or Config.MONTE_CARLO_PATHS))
+    return simulate_retirement(inputs, paths=min(requested, Config.MONTE_CARLO_PATHS))
+
+
 def _validate_rent_vs_buy(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["rent_monthly", "home_price", "deposit", "annual_rate", "years", "annual_maintenance"])
 
@@ -207,6 +508,18 @@ def _rent_vs_buy(inputs: CalculationInputs) -> CalculationResult:
     }
 
 
+def _rent_vs_buy_batch(c: BatchColumns) -> dict[str, Any]:
+    years = c["years"]
+    loan_principal = np.maximum(0.0, c["home_price"] - c["deposit"])
+    loan = _loan_batch({"principal": loan_principal, "annual_rate": c["annual_rate"], "years": years})
+    return {
+        "total_rent_cost": c["rent_monthly"] * 12.0 * years,
+        "total_buy_interest": loan["total_interest"],
+        "total_buy_cost": loan["total_interest"] + c["annual_maintenance"] * years,
+        "monthly_mortgage": loan["monthly_payment"],
+    }
+
+
 def _validate_investment_return(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["initial_value", "final_value", "years"])
 
@@ -222,6 +535,12 @@ def _investment_return(inputs: CalculationInputs) -> CalculationResult:
     return {"cagr": cagr, "total_return": final - initial, "final_value": final}
 
 
+def _investment_return_batch(c: BatchColumns) -> dict[str, Any]:
+    initial, final, years = c["initial_value"], c["final_value"], c["years"]
+    cagr = np.where((initial <= 0) | (years <= 0), np.nan, (final / initial) ** (1 / years) - 1)
+    return {"cagr": cagr, "total_return": final - initial, "final_value": final}
+
+
 def _validate_rental_yield(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["annual_rent", "property_value"])
 
@@ -232,6 +551,11 @@ def _rental_yield(inputs: CalculationInputs) -> CalculationResult:
     return {"rental_yield": annual_rent / value if value else None}
 
 
+def _rental_yield_batch(c: BatchColumns) -> dict[str, Any]:
+    value = c["property_value"]
+    return {"rental_yield": np.where(value != 0, c["annual_rent"] / value, np.nan)}
+
+
 def _validate_property_loan_compare(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["principal", "owner_rate", "investor_rate", "years"])
 
@@ -244,6 +568,14 @@ def _property_loan_compare(inputs: CalculationInputs) -> CalculationResult:
     return {"owner": owner, "investor": investor}
 
 
+def _property_loan_compare_batch(c: BatchColumns) -> dict[str, Any]:
+    principal, years = c["principal"], c["years"]
+    return {
+        "owner": _loan_batch({"principal": principal, "annual_rate": c["owner_rate"], "years": years}),
+        "investor": _loan_batch({"principal": principal, "annual_rate": c["investor_rate"], "years": years}),
+    }
+
+
 def _validate_insurance_needs(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["annual_income", "years_support", "debt"])
 
@@ -256,6 +588,10 @@ def _insurance_needs(inputs: CalculationInputs) -> CalculationResult:
     return {"coverage_needed": need}
 
 
+def _insurance_needs_batch(c: BatchColumns) -> dict[str, Any]:
+    return {"coverage_needed": c["annual_income"] * c["years_support"] + c["debt"]}
+
+
 def _validate_inflation(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["amount_today", "annual_inflation", "years"])
 
@@ -268,6 +604,11 @@ def _inflation(inputs: CalculationInputs) -> CalculationResult:
     return {"future_value": future, "amount_today": amount}
 
 
+def _inflation_batch(c: BatchColumns) -> dict[str, Any]:
+    amount = c["amount_today"]
+    return {"future_value": amount * (1 + c["annual_inflation"]) ** c["years"], "amount_today": amount}
+
+
 def _validate_emergency_fund(inputs: CalculationInputs) -> list[str]:
     return _missing(inputs, ["monthly_expenses", "months"])
 
@@ -278,24 +619,31 @@ def _emergency_fund(inputs: CalculationInputs) -> CalculationResult:
     return {"target_amount": monthly * months, "months": months}
 
 
+def _emergency_fund_batch(c: BatchColumns) -> dict[str, Any]:
+    months = c["months"]
+    return {"target_amount": c["monthly_expenses"] * months, "months": months}
+
+
 CALCULATORS: dict[str, CalculatorSpec] = {
-    "budget": CalculatorSpec("budget", _validate_budget, _budget),
-    "net_worth": CalculatorSpec("net_worth", _validate_net_worth, _net_worth),
-    "savings_goal": CalculatorSpec("savings_goal", _validate_savings_goal, _savings_goal),
-    "compound_interest": CalculatorSpec("compound_interest", _validate_compound_interest, _compound_interest),
-    "debt_repayment": CalculatorSpec("debt_repayment", _validate_debt_repayment, _debt_repayment),
-    "mortgage": CalculatorSpec("mortgage", _validate_loan, _loan),
-    "loan": CalculatorSpec("loan", _validate_loan, _loan),
-    "loan_affordability": CalculatorSpec("loan_affordability", _validate_affordability, _loan_affordability),
-    "credit_card_payoff": CalculatorSpec("credit_card_payoff", _validate_credit_card, _credit_card_payoff),
-    "retirement": CalculatorSpec("retirement", _validate_retirement, _retirement),
-    "rent_vs_buy": CalculatorSpec("rent_vs_buy", _validate_rent_vs_buy, _rent_vs_buy),
-    "investment_return": CalculatorSpec("investment_return", _validate_investment_return, _investment_return),
-    "rental_yield": CalculatorSpec("rental_yield", _validate_rental_yield, _rental_yield),
-    "property_loan_compare": CalculatorSpec("property_loan_compare", _validate_property_loan_compare, _property_loan_compare),
-    "insurance_needs": CalculatorSpec("insurance_needs", _validate_insurance_needs, _insurance_needs),
-    "inflation": CalculatorSpec("inflation", _validate_inflation, _inflation),
-    "emergency_fund": CalculatorSpec("emergency_fund", _validate_emergency_fund, _emergency_fund),
+    "budget": CalculatorSpec("budget", _validate_budget, _budget, _budget_batch),
+    "net_worth": CalculatorSpec("net_worth", _validate_net_worth, _net_worth, _net_worth_batch),
+    "savings_goal": CalculatorSpec("savings_goal", _validate_savings_goal, _savings_goal, _savings_goal_batch),
+    "compound_interest": CalculatorSpec("compound_interest", _validate_compound_interest, _compound_interest, _compound_interest_batch),
+    "debt_repayment": CalculatorSpec("debt_repayment", _validate_debt_repayment, _debt_repayment, _debt_repayment_batch),
+    "mortgage": CalculatorSpec("mortgage", _validate_loan, _loan, _loan_batch),
+    "loan": CalculatorSpec("loan", _validate_loan, _loan, _loan_batch),
+    "amortization_schedule": CalculatorSpec("amortization_schedule", _validate_amortization, _amortization, _amortization_batch),
+    "loan_affordability": CalculatorSpec("loan_affordability", _validate_affordability, _loan_affordability, _loan_affordability_batch),
+    "credit_card_payoff": CalculatorSpec("credit_card_payoff", _validate_credit_card, _credit_card_payoff, _credit_card_payoff_batch),
+    "retirement": CalculatorSpec("retirement", _validate_retirement, _retirement, _retirement_batch),
+    "retirement_monte_carlo": CalculatorSpec("retirement_monte_carlo", _validate_retirement_monte_carlo, _retirement_monte_carlo),
+    "rent_vs_buy": CalculatorSpec("rent_vs_buy", _validate_rent_vs_buy, _rent_vs_buy, _rent_vs_buy_batch),
+    "investment_return": CalculatorSpec("investment_return", _validate_investment_return, _investment_return, _investment_return_batch),
+    "rental_yield": CalculatorSpec("rental_yield", _validate_rental_yield, _rental_yield, _rental_yield_batch),
+    "property_loan_compare": CalculatorSpec("property_loan_compare", _validate_property_loan_compare, _property_loan_compare, _property_loan_compare_batch),
+    "insurance_needs": CalculatorSpec("insurance_needs", _validate_insurance_needs, _insurance_needs, _insurance_needs_batch),
+    "inflation": CalculatorSpec("inflation", _validate_inflation, _inflation, _inflation_batch),
+    "emergency_fund": CalculatorSpec("emergency_fund", _validate_emergency_fund, _emergency_fund, _emergency_fund_batch),
 }
 
 
@@ -310,3 +658,35 @@ def calculate(calc_type: str, inputs: CalculationInputs) -> CalculationResult:
         raise ValueError(f"Unknown calculation type: {calc_type}")
     return CALCULATORS[calc_type].calculator(inputs)
 
+
+def calculate_batch(calc_type: str, columns: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Evaluate a calculator over columns of inputs with NumPy broadcasting.
+
+    Each column is a scalar or array-like; all columns are broadcast together, so
+    `{"annual_rate": rates[:, None], "years": terms[None, :], "principal": 600_000}`
+    evaluates a rate x term grid. Returns result columns with the broadcast shape
+    (nested dicts for calculators with nested results); values the scalar
+    calculator reports as None are NaN.
+    """
+    if calc_type not in CALCULATORS:
+        raise ValueError(f"Unknown calculation type: {calc_type}")
+    present = {name: value for name, value in columns.items() if value is not None}
+    # Validators only check presence, so placeholders stand in for the arrays
+    missing = CALCULATORS[calc_type].validator({name: 0.0 for name in present})
+    if missing:
+        raise ValueError(f"Missing inputs for {calc_type}: {missing}")
+    names = list(present)
+    arrays = np.broadcast_arrays(*(np.asarray(present[name], dtype=float) for name in names))
+    batch = CALCULATORS[calc_type].batch
+    if batch is None:
+        raise ValueError(f"No batch calculator for {calc_type}")
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return _shape_results(batch(dict(zip(names, arrays))), arrays[0].shape if arrays else ())
+
+
+def _shape_results(results: dict[str, Any], shape: tuple[int, ...]) -> dict[str, Any]:
+    return {
+        key: _shape_results(value, shape) if isinstance(value, dict) else np.broadcast_to(np.asarray(value, dtype=float), shape)
+        for key, value in results.items()
+    }
@@ -0,0 +1,421 @@
+"""
+Deterministic chart builders for known calculators (Chart.js compatible).
+
+This module is LLM-free. Each builder turns the inputs/result of a calculator in
+services.calculation_engine.CALCULATORS into chart specs with the same shape the
+VisualizationAgent renderer returns (chart_type, data, title, description, config).
+Only 'custom' calculations need the LLM renderer.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+ChartPayload = dict[str, Any]
+ChartBuilder = Callable[[dict[str, Any], dict[str, Any]], list[ChartPayload]]
+
+PALETTE = ["#2563eb", "#f97316", "#16a34a", "#dc2626", "#9333ea", "#0891b2"]
+
+
+def _num(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _r(value: float) -> float:
+    return round(value, 2)
+
+
+def _chart(
+    chart_type: str,
+    labels: list[Any],
+    datasets: list[dict[str, Any]],
+    title: str,
+    description: str,
+    config: dict[str, Any] | None = None,
+) -> ChartPayload:
+    return {
+        "chart_type": chart_type,
+        "data": {"labels": labels, "datasets": datasets},
+        "title": title,
+        "description": description,
+        "config": config or {"responsive": True},
+    }
+
+
+def _bar(labels: list[str], values: list[float], title: str, description: str, label: str = "Amount") -> ChartPayload:
+    return _chart(
+        "bar",
+        labels,
+        [{"label": label, "data": [_r(v) for v in values], "backgroundColor": PALETTE[: len(values)]}],
+        title,
+        description,
+    )
+
+
+def _donut(labels: list[str], values: list[float], title: str, description: str) -> ChartPayload:
+    return _chart(
+        "donut",
+        labels,
+        [{"data": [_r(v) for v in values], "backgroundColor": PALETTE[: len(values)]}],
+        title,
+        description,
+    )
+
+
+def _line(labels: list[Any], series: dict[str, list[float]], title: str, description: str) -> ChartPayload:
+    datasets = [
+        {
+            "label": name,
+            "data": [_r(v) for v in values],
+            "borderColor": PALETTE[i % len(PALETTE)],
+            "backgroundColor": PALETTE[i % len(PALETTE)],
+            "fill": False,
+        }
+        for i, (name, values) in enumerate(series.items())
+    ]
+    return _chart("line", labels, datasets, title, description)
+
+
+def _balance_after(balance: float, monthly_rate: float, payment: float, months: int) -> float:
+    """Closed-form remaining balance of an amortizing debt after `months` payments."""
+    if monthly_rate == 0:
+        return max(0.0, balance - payment * months)
+    growth = (1 + monthly_rate) ** months
+    return max(0.0, balance * growth - payment * (growth - 1) / monthly_rate)
+
+
+def _yearly_balances(balance: float, monthly_rate: float, payment: float, total_months: int) -> tuple[list[int], list[float]]:
+    years = max(1, -(-total_months // 12))
+    labels = list(range(0, years + 1))
+    values = [_balance_after(balance, monthly_rate, payment, min(12 * y, total_months)) for y in labels]
+    return labels, values
+
+
+# === Builders ===
+def _budget_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Income", "Expenses", "Surplus"],
+            [_num(result.get("income")), _num(result.get("expenses")), _num(result.get("surplus"))],
+            "Income vs expenses",
+            "Income, expenses and the resulting surplus for the period.",
+        )
+    ]
+
+
+def _net_worth_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Assets", "Liabilities", "Net worth"],
+            [_num(result.get("assets")), _num(result.get("liabilities")), _num(result.get("net_worth"))],
+            "Net worth breakdown",
+            "Total assets less total liabilities.",
+        )
+    ]
+
+
+def _savings_goal_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    months = result.get("months")
+    if months is None:
+        return []
+    contrib = _num(result.get("monthly_contribution"))
+    rate = _num(result.get("monthly_rate"))
+    total_months = max(1, int(-(-_num(months) // 1)))
+    labels, balances = _yearly_balances(0.0, rate, -contrib, total_months)
+    target = _num(result.get("target_amount"))
+    return [
+        _line(
+            labels,
+            {"Projected balance": balances, "Target": [target] * len(labels)},
+            "Savings goal projection",
+            f"Balance by year with regular contributions; target reached in about {total_months} months.",
+        )
+    ]
+
+
+def _compound_interest_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    principal = _num(result.get("principal"))
+    rate = _num(inputs.get("annual_rate"))
+    years = max(1, int(_num(inputs.get("years"))))
+    n = _num(inputs.get("compounds_per_year"), 12) or 12
+    labels = list(range(0, years + 1))
+    values = [principal * (1 + rate / n) ** (n * y) for y in labels]
+    return [
+        _line(labels, {"Value": values}, "Growth over time", "Value of the principal with compound interest by year."),
+        _donut(
+            ["Principal", "Interest earned"],
+            [principal, _num(result.get("interest_earned"))],
+            "Principal vs interest",
+            "Share of the final value that comes from interest.",
+        ),
+    ]
+
+
+def _debt_repayment_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    months = result.get("months")
+    balance = _num(result.get("starting_balance", inputs.get("balance")))
+    rate = _num(inputs.get("annual_rate")) / 12.0
+    payment = _num(inputs.get("monthly_payment"))
+    if months is None:
+        if payment <= 0:
+            return []
+        # The engine reports no payoff when the payment does not cover the interest
+        return [
+            _bar(
+                ["Monthly payment", "Monthly interest"],
+                [payment, balance * rate],
+                "Payment vs interest",
+                "The monthly payment does not cover the interest charged, so the balance never goes down.",
+            )
+        ]
+    labels, balances = _yearly_balances(balance, rate, payment, int(months))
+    return [
+        _line(labels, {"Remaining balance": balances}, "Debt payoff timeline", f"Balance by year; paid off in {int(months)} months."),
+        _donut(
+            ["Principal", "Interest"],
+            [balance, _num(result.get("total_interest"))],
+            "Principal vs interest",
+            "Total interest paid relative to the starting balance.",
+        ),
+    ]
+
+
+def _loan_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    principal = _num(inputs.get("principal"))
+    rate = _num(inputs.get("annual_rate")) / 12.0
+    total_months = int(_num(inputs.get("years")) * 12)
+    payment = _num(result.get("monthly_payment"))
+    labels, balances = _yearly_balances(principal, rate, payment, total_months)
+    return [
+        _line(labels, {"Remaining balance": balances}, "Amortization", "Loan balance at the end of each year."),
+        _donut(
+            ["Principal", "Interest"],
+            [principal, _num(result.get("total_interest"))],
+            "Principal vs interest",
+            "Total repayments split between principal and interest.",
+        ),
+    ]
+
+
+def _amortization_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    yearly = result.get("yearly") or {}
+    years = yearly.get("year") or []
+    if not years:
+        return []
+    principal = [_num(v) for v in yearly.get("principal", [])]
+    interest = [_num(v) for v in yearly.get("interest", [])]
+    charts = [
+        _chart(
+            "bar",
+            years,
+            [
+                {"label": "Principal", "data": [_r(v) for v in principal], "backgroundColor": PALETTE[0]},
+                {"label": "Interest", "data": [_r(v) for v in interest], "backgroundColor": PALETTE[1]},
+            ],
+            "Repayments by year",
+            "Principal and interest paid in each year of the loan.",
+            {"responsive": True, "scales": {"x": {"stacked": True}, "y": {"stacked": True}}},
+        ),
+        _line(
+            [0] + list(years),
+            {"Remaining balance": [_num(inputs.get("principal"))] + [_num(v) for v in yearly.get("balance", [])]},
+            "Amortization",
+            "Loan balance at the end of each year.",
+        ),
+    ]
+    saved = _num(result.get("interest_saved"))
+    if saved > 0:
+        charts.append(
+            _bar(
+                ["Interest", "Interest saved"],
+                [_num(result.get("total_interest")), saved],
+                "Interest saved",
+                f"Interest avoided with extra repayments and the offset; the loan finishes {int(_num(result.get('periods_saved')))} repayments early.",
+            )
+        )
+    return charts
+
+
+def _loan_affordability_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Estimated borrowing capacity"],
+            [_num(result.get("max_borrowing"))],
+            "Borrowing capacity",
+            "Loan amount the current surplus could service over the term.",
+        )
+    ]
+
+
+def _retirement_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    required = _num(result.get("required_corpus"))
+    projected = _num(result.get("projected_corpus"))
+    return [
+        _bar(
+            ["Required corpus", "Projected corpus", "Gap"],
+            [required, projected, max(0.0, required - projected)],
+            "Retirement corpus gap",
+            "Projected savings at retirement compared with the amount needed to fund spending.",
+        )
+    ]
+
+
+def _retirement_monte_carlo_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    bands = result.get("bands") or {}
+    years = bands.get("year") or []
+    if not years:
+        return []
+    series = {
+        label: [_num(v) for v in bands.get(key, [])]
+        for key, label in (("p90", "Optimistic (90th pct)"), ("p50", "Median"), ("p10", "Pessimistic (10th pct)"))
+    }
+    success = _num(result.get("probability_of_success")) * 100.0
+    risk = result.get("sequence_risk") or {}
+    return [
+        _line(
+            years,
+            series,
+            "Projected savings range",
+            f"Savings in today's dollars by year across {int(_num(result.get('paths')))} simulated markets; retirement in year {int(_num(result.get('years_to_retire')))}.",
+        ),
+        _bar(
+            ["All paths", "Weak early returns", "Strong early returns"],
+            [success, _num(risk.get("success_weak_early_returns")) * 100.0, _num(risk.get("success_strong_early_returns")) * 100.0],
+            "Chance savings last",
+            "Share of simulations where savings cover spending for the whole retirement, split by returns in the first years of retirement.",
+            label="Percent",
+        ),
+    ]
+
+
+def _rent_vs_buy_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Total rent", "Mortgage interest", "Total buying cost"],
+            [_num(result.get("total_rent_cost")), _num(result.get("total_buy_interest")), _num(result.get("total_buy_cost"))],
+            "Renting vs buying",
+            "Cumulative cost of renting compared with interest and maintenance when buying.",
+        )
+    ]
+
+
+def _investment_return_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Initial value", "Final value"],
+            [_num(inputs.get("initial_value")), _num(result.get("final_value"))],
+            "Investment growth",
+            "Starting and ending value of the investment.",
+        )
+    ]
+
+
+def _rental_yield_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Gross rental yield (%)"],
+            [_num(result.get("rental_yield")) * 100.0],
+            "Rental yield",
+            "Annual rent as a percentage of property value.",
+            label="Percent",
+        )
+    ]
+
+
+def _property_loan_compare_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    owner = result.get("owner") or {}
+    investor = result.get("investor") or {}
+    return [
+        _chart(
+            "bar",
+            ["Monthly payment", "Total interest"],
+            [
+                {
+                    "label": "Owner-occupier",
+                    "data": [_r(_num(owner.get("monthly_payment"))), _r(_num(owner.get("total_interest")))],
+                    "backgroundColor": PALETTE[0],
+                },
+                {
+                    "label": "Investor",
+                    "data": [_r(_num(investor.get("monthly_payment"))), _r(_num(investor.get("total_interest")))],
+                    "backgroundColor": PALETTE[1],
+                },
+            ],
+            "Owner-occupier vs investor loan",
+            "Repayments and total interest at each rate.",
+        )
+    ]
+
+
+def _insurance_needs_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    income_component = _num(inputs.get("annual_income")) * _num(inputs.get("years_support"))
+    return [
+        _donut(
+            ["Income replacement", "Debt"],
+            [income_component, _num(inputs.get("debt"))],
+            "Cover components",
+            "Estimated cover split between income replacement and debt.",
+        )
+    ]
+
+
+def _inflation_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    amount = _num(result.get("amount_today"))
+    rate = _num(inputs.get("annual_inflation"))
+    years = max(1, int(_num(inputs.get("years"))))
+    labels = list(range(0, years + 1))
+    return [
+        _line(
+            labels,
+            {"Equivalent cost": [amount * (1 + rate) ** y for y in labels]},
+            "Impact of inflation",
+            "What today's amount would cost in future years.",
+        )
+    ]
+
+
+def _emergency_fund_charts(inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    return [
+        _bar(
+            ["Monthly expenses", "Emergency fund target"],
+            [_num(inputs.get("monthly_expenses")), _num(result.get("target_amount"))],
+            "Emergency fund target",
+            f"Target covering {_num(result.get('months')):g} months of expenses.",
+        )
+    ]
+
+
+CHART_BUILDERS: dict[str, ChartBuilder] = {
+    "budget": _budget_charts,
+    "net_worth": _net_worth_charts,
+    "savings_goal": _savings_goal_charts,
+    "compound_interest": _compound_interest_charts,
+    "debt_repayment": _debt_repayment_charts,
+    "mortgage": _loan_charts,
+    "loan": _loan_charts,
+    "amortization_schedule": _amortization_charts,
+    "loan_affordability": _loan_affordability_charts,
+    "credit_card_payoff": _debt_repayment_charts,
+    "retirement": _retirement_charts,
+    "retirement_monte_carlo": _retirement_monte_carlo_charts,
+    "rent_vs_buy": _rent_vs_buy_charts,
+    "investment_return": _investment_return_charts,
+    "rental_yield": _rental_yield_charts,
+    "property_loan_compare": _property_loan_compare_charts,
+    "insurance_needs": _insurance_needs_charts,
+    "inflation": _inflation_charts,
+    "emergency_fund": _emergency_fund_charts,
+}
+
+
+def has_chart_builder(calc_type: str) -> bool:
+    return calc_type in CHART_BUILDERS
+
+
+def build_charts(calc_type: str, inputs: dict[str, Any], result: dict[str, Any]) -> list[ChartPayload]:
+    if calc_type not in CHART_BUILDERS:
+        raise ValueError(f"No chart builder for calculation type: {calc_type}")
+    return CHART_BUILDERS[calc_type](inputs or {}, result or {})
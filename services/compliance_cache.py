@@ -0,0 +1,182 @@
+"""
+Content-addressed cache for compliance verdicts.
+
+Sits in front of the ComplianceAgent LLM call:
+- Key = sha256(normalized response_text, response_type, prompt template version)
+- Bounded in-memory LRU with TTL
+- Optional on-disk SQLite tier so verdicts survive restarts and are shared by workers;
+  aget()/aset() keep the memory tier inline and run the disk tier in a thread
+
+Normalization only collapses whitespace, so a cached rewrite is always a rewrite
+of the same text.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from config import Config
+from services.metrics import metrics
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace and trim."""
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def make_key(response_text: str, response_type: str, template_version: str) -> str:
+    """Build the content-addressed cache key."""
+    material = "\x1f".join([normalize_text(response_text), response_type or "", template_version])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ComplianceCache:
+    """Thread-safe LRU + TTL cache of verdict dicts, with an optional SQLite tier."""
+
+    def __init__(self, max_size: int = 2048, ttl_seconds: float = 86400, path: str | None = None):
+        """
+        Args:
+            max_size: Max in-memory entries (<= 0 disables the memory tier)
+            ttl_seconds: Entry lifetime in seconds (<= 0 means no expiry)
+            path: SQLite file for the on-disk tier (None/empty disables it)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS compliance_verdicts "
+                "(key TEXT PRIMARY KEY, verdict TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, verdict: dict[str, Any]) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (created_at, verdict)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _get_memory(self, key: str, now: float) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry[0], now):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def _get_disk(self, key: str, now: float) -> dict[str, Any] | None:
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT verdict, created_at FROM compliance_verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[1], now):
+                self._db.execute("DELETE FROM compliance_verdicts WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+        verdict = json.loads(row[0])
+        with self._lock:
+            self._remember(key, row[1], verdict)
+        return dict(verdict)
+
+    def _set_disk(self, key: str, verdict: dict[str, Any], now: float) -> None:
+        if self._db is None:
+            return
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO compliance_verdicts (key, verdict, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(verdict), now),
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _count(verdict: dict[str, Any] | None) -> dict[str, Any] | None:
+        metrics.inc("compliance.cache_hit" if verdict is not None else "compliance.cache_miss")
+        return verdict
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a cached verdict or None (expired entries are dropped)."""
+        now = time.time()
+        verdict = self._get_memory(key, now)
+        if verdict is None:
+            verdict = self._get_disk(key, now)
+        return self._count(verdict)
+
+    async def aget(self, key: str) -> dict[str, Any] | None:
+        """Async get(): the memory tier is checked inline, the disk tier in a worker thread."""
+        now = time.time()
+        verdict = self._get_memory(key, now)
+        if verdict is None and self._db is not None:
+            verdict = await asyncio.to_thread(self._get_disk, key, now)
+        return self._count(verdict)
+
+    def set(self, key: str, verdict: dict[str, Any]) -> None:
+        """Store a verdict under key."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, dict(verdict))
+        self._set_disk(key, verdict, now)
+
+    async def aset(self, key: str, verdict: dict[str, Any]) -> None:
+        """Async set(): the disk write runs in a worker thread."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, dict(verdict))
+        if self._db is not None:
+            await asyncio.to_thread(self._set_disk, key, dict(verdict), now)
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM compliance_verdicts")
+                self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache: ComplianceCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_compliance_cache() -> ComplianceCache:
+    """Return the process-wide cache configured from Config."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ComplianceCache(
+                    max_size=Config.COMPLIANCE_CACHE_SIZE,
+                    ttl_seconds=Config.COMPLIANCE_CACHE_TTL_SECONDS,
+                    path=Config.COMPLIANCE_CACHE_PATH or None,
+                )
+    return _cache
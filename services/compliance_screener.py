@@ -0,0 +1,148 @@
+"""
+Rule-based compliance pre-screener (LLM-free).
+
+Runs before the ComplianceAgent LLM call. Only two kinds of text are
+auto-approved locally, and only when the lexicon (advice language, judgement
+of the user's choices, product names, imperative phrasing) finds nothing:
+- Server-generated template text (fallback questions, goal-details prompts)
+- Free-form text that is a single plain question with no recommendation verbs
+
+Everything else is escalated to the LLM reviewer: a denylist can't prove that
+arbitrary LLM output is free of advice. A false positive only costs an LLM
+call, a false negative would let advice through. Counters in services.metrics
+track the escalation rate.
+"""
+
+import re
+from dataclasses import dataclass
+
+from services.metrics import metrics
+
+# Direct advice / prescriptive phrasing (mirrors prompts/compliance_agent_prompt.txt)
+_ADVICE_PATTERNS = [
+    r"\byou\s+(should|must|ought\s+to|need\s+to|have\s+to)\b",
+    r"\byou(?:'ll|\s+will)\s+want\s+to\b",
+    r"\byou\s+(really\s+)?(shouldn'?t|should\s+not|must\s+not|mustn'?t)\b",
+    r"\bi\s+(would\s+)?(recommend|advise|suggest)\b",
+    r"\b(recommend(ed|ation|s)?|advis(e|able|ing))\b",
+    r"\bmy\s+advice\b",
+    r"\b(the\s+)?(best|optimal|right|smartest|wisest)\s+(option|choice|strategy|move|approach|thing\s+to\s+do)\b",
+    r"\bwhat\s+(you\s+should|to)\s+do\b",
+    r"\bhere'?s\s+what\s+to\s+do\b",
+    r"\bit\s+(would|might|could|may)\s+be\s+(wise|smart|best|prudent|sensible|worth\s+it|worthwhile|a\s+good\s+idea)\b",
+    r"\bit'?s\s+(wise|best|smart|prudent|sensible|a\s+good\s+idea)\s+to\b",
+]
+
+# Praise or judgement of the user's choices ("great savings rate", "bad idea")
+_JUDGEMENT_PATTERNS = [
+    r"\b(great|excellent|good|bad|poor|wise|smart|terrible|fantastic|amazing|impressive|brilliant|healthy|solid)\s+"
+    r"(\w+\s+)?(decision|choice|idea|move|rate|plan|strategy|approach|habit|position|start)\b",
+    r"\bthat'?s\s+(a\s+|an\s+|really\s+|very\s+|so\s+)?(great|excellent|good|bad|terrible|fantastic|amazing|"
+    r"impressive|brilliant|wise|smart|unwise|risky|the\s+wrong|a\s+mistake|wrong)\b",
+    r"\bguarantee(d|s)?\b",
+    r"\b(risk[-\s]?free|can'?t\s+lose|sure\s+thing)\b",
+]
+
+# Imperative product actions ("buy shares", "switch to ...", "open a ...")
+_ACTION_PATTERNS = [
+    r"\b(buy|sell|short|purchase|dump|offload)\s+(some\s+|more\s+|the\s+|a\s+|an\s+|your\s+)?"
+    r"(shares?|stocks?|etfs?|bonds?|crypto|bitcoin|property|properties|units?|funds?|gold)\b",
+    r"\b(invest|put|park)\s+(your\s+|the\s+|it\s+|\$?\d[\d,]*\s+)?(money\s+|savings\s+)?(in|into)\b",
+    r"\bswitch\s+(to|your|super|funds?|lenders?|banks?)\b",
+    r"\b(open|take\s+out|sign\s+up\s+for|choose|pick|go\s+with)\s+an?\s+"
+    r"[\w\s-]{0,30}(account|fund|policy|loan|etf|card|product)\b",
+    r"\b(salary\s+sacrifice|refinance|consolidate)\s+(now|today|immediately)\b",
+    # Sentences opening with an imperative verb ("Consider paying off...", "Increase your super...")
+    r"(?:^|[.!?:;]\s+|\n\s*|[-*•]\s+)(consider|increase|decrease|reduce|boost|max(imi[sz]e)?|pay\s+(off|down)|"
+    r"put|move|switch|transfer|invest|contribute|buy|sell|open|choose|pick|prioriti[sz]e|focus\s+on|"
+    r"build|cut|avoid|make\s+sure|set\s+up|salary\s+sacrifice|refinance|consolidate|sign\s+up)\b",
+]
+
+# Named products, providers and tickers
+_PRODUCT_PATTERNS = [
+    r"\b(vanguard|betashares|ishares|blackrock|commsec|selfwealth|stake|raiz|spaceship|pearler|superhero)\b",
+    r"\b(australiansuper|australian\s+super|hostplus|rest\s+super|aware\s+super|unisuper|cbus|hesta|art\s+super)\b",
+    r"\b(commbank|commonwealth\s+bank|westpac|anz|nab|macquarie|ing|ubank|bankwest|amp)\b",
+    r"\b(asx|nyse|nasdaq)\s*:\s*[a-z]{2,5}\b",
+    r"\b(vas|vgs|vdhg|a200|ndq|ivv|iob)\b",
+]
+
+_LEXICON: list[tuple[str, re.Pattern[str]]] = [
+    (category, re.compile(pattern, re.IGNORECASE))
+    for category, patterns in (
+        ("advice", _ADVICE_PATTERNS),
+        ("judgement", _JUDGEMENT_PATTERNS),
+        ("action", _ACTION_PATTERNS),
+        ("product", _PRODUCT_PATTERNS),
+    )
+    for pattern in patterns
+]
+
+
+# Allowlist for free-form text: one short question...
+_MAX_QUESTION_CHARS = 200
+_SENTENCE_END = re.compile(r"[.!?](?=\s|$)")
+# ...that doesn't steer the user towards an action
+_RECOMMENDATION_WORDS = re.compile(
+    r"\b(should|shouldn'?t|could|might|must|ought|better|best|bet|recommend\w*|suggest\w*|advis\w*|"
+    r"consider\w*|want\s+to|need\s+to|have\s+to|pay(ing)?\s+(it\s+|the\s+\w+\s+)?(off|down)|sell\w*|buy\w*|"
+    r"switch\w*|refinanc\w*|invest\w*|go\s+for|get|try|put|move|start|stop|increas\w*|reduc\w*|cut|"
+    r"time\s+to|definitely|if\s+i\s+were|i'?d)\b"
+    r"|\bwould\b(?!\s+you\s+like\b)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class ScreenResult:
+    """Outcome of the local pre-screen."""
+
+    clean: bool
+    matches: tuple[str, ...] = ()
+
+
+def find_matches(text: str | None) -> tuple[str, ...]:
+    """Lexicon hits in text, each prefixed with its category (empty when nothing matches)."""
+    if not text:
+        return ()
+    normalized = text.replace("’", "'")
+    return tuple(
+        f"{category}: {match.group(0)}"
+        for category, pattern in _LEXICON
+        if (match := pattern.search(normalized))
+    )
+
+
+def is_plain_question(text: str | None) -> bool:
+    """True for a single short question without recommendation verbs."""
+    stripped = (text or "").strip().replace("’", "'")
+    if not stripped.endswith("?") or len(stripped) > _MAX_QUESTION_CHARS:
+        return False
+    if len(_SENTENCE_END.findall(stripped)) != 1:
+        return False
+    return not _RECOMMENDATION_WORDS.search(stripped)
+
+
+def screen(text: str | None, server_generated: bool = False) -> ScreenResult:
+    """
+    Decide whether text may skip the LLM compliance review.
+
+    Clean only for server-generated template text, or a single plain question,
+    with no lexicon hits; otherwise the reasons (lexicon snippets prefixed with
+    their category) so the escalation can be logged.
+    """
+    metrics.inc("compliance.screened")
+    matches = list(find_matches(text))
+    if not server_generated and not is_plain_question(text):
+        matches.append("free_form: not a single plain question")
+
+    if matches:
+        metrics.inc("compliance.escalated")
+        return ScreenResult(clean=False, matches=tuple(matches))
+    metrics.inc("compliance.auto_approved")
+    return ScreenResult(clean=True)
+
+
+def escalation_rate() -> float | None:
+    """Share of screened texts escalated to the LLM (None before any screening)."""
+    return metrics.ratio("compliance.escalated", "compliance.screened")
@@ -0,0 +1,211 @@
+"""
+Context compactor - Shrinks the dynamic context injected into agent prompts.
+
+Used by the orchestrator for StateResolverAgent and ConversationAgent:
+- Compact JSON (no indentation / spaces) for snapshots and schemas
+- Schema boilerplate stripped: titles, BaseNode fields (id, created_at, metadata, ...),
+  null defaults, $ref indirection and Optional[...] anyOf wrappers
+- Full schemas only for focus nodes (current node, its branch siblings and nodes
+  the user message hints at); every other node is listed by field name only
+- Token estimates per prompt section for reporting
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+from config import BRANCHES, Config, get_branch_for_node
+from nodes.schema_registry import BASE_FIELDS, NODE_SCHEMAS
+from services.metrics import metrics
+
+# Rough chars-per-token ratio for English/JSON prompts (OpenAI tokenizers average ~4)
+CHARS_PER_TOKEN = 4
+
+# Words in a user message that suggest facts for a node (cross-node extraction targets)
+NODE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "Personal": ("age", "old", "born", "job", "work", "occupation", "employ", "self-employed", "health", "single"),
+    "Marriage": ("married", "wife", "husband", "partner", "spouse", "de facto", "divorced", "separated"),
+    "Dependents": ("kid", "child", "son", "daughter", "baby", "dependent", "dependant", "parents"),
+    "Income": ("salary", "earn", "income", "wage", "paid", "rental income", "dividend", "bonus", "pension"),
+    "Expenses": ("spend", "expense", "rent", "bills", "groceries", "cost", "budget"),
+    "Savings": ("saving", "saved", "emergency", "cash", "bank account", "buffer"),
+    "Assets": ("property", "house", "home", "apartment", "shares", "etf", "stock", "crypto", "car", "asset", "invest"),
+    "Loan": ("loan", "mortgage", "debt", "owe", "credit card", "hecs", "help debt", "repayment", "finance"),
+    "Insurance": ("insurance", "insured", "cover", "policy", "tpd", "income protection", "life cover", "private health"),
+    "Retirement": ("super", "retire", "retirement", "pension", "smsf", "preservation"),
+}
+
+_WORD_BOUNDARY_CACHE: dict[str, re.Pattern[str]] = {}
+
+
+def compact_json(value: Any) -> str:
+    """Serialize without whitespace (dates and other objects fall back to str)."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Cheap token estimate (ceil(chars / CHARS_PER_TOKEN))."""
+    if not text:
+        return 0
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _thaw(value: Any) -> Any:
+    """Convert registry mappings/tuples back to plain dicts/lists."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _strip(node: Any, defs: dict[str, Any], resolving: frozenset[str] = frozenset()) -> Any:
+    """Recursively drop schema boilerplate and inline $refs."""
+    if isinstance(node, list):
+        return [_strip(v, defs, resolving) for v in node]
+    if not isinstance(node, dict):
+        return node
+
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith("#/$defs/"):
+        name = ref.rsplit("/", 1)[-1]
+        if name in defs and name not in resolving:
+            inlined = _strip(defs[name], defs, resolving | {name})
+            # Enum/model class docstrings are noise once inlined under a described field
+            inlined.pop("description", None)
+            return inlined
+
+    out: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("title", "$defs"):
+            continue
+        if key == "default" and value is None:
+            continue
+        if key == "properties" and isinstance(value, dict):
+            out[key] = {name: _strip(prop, defs, resolving) for name, prop in value.items()}
+            continue
+        out[key] = _strip(value, defs, resolving)
+
+    # Optional[X] -> X plus "null" in type
+    any_of = out.get("anyOf")
+    if isinstance(any_of, list) and len(any_of) == 2 and {"type": "null"} in any_of:
+        inner = next(v for v in any_of if v != {"type": "null"})
+        if isinstance(inner, dict):
+            del out["anyOf"]
+            merged = dict(inner)
+            merged.update(out)
+            inner_type = inner.get("type")
+            if isinstance(inner_type, str):
+                merged["type"] = [inner_type, "null"]
+            out = merged
+    return out
+
+
+@lru_cache(maxsize=None)
+def compact_node_schema(node_name: str) -> str:
+    """Compact JSON schema text for one node (memoized; the registry is immutable)."""
+    entry = NODE_SCHEMAS.get(node_name)
+    if entry is None:
+        return "{}"
+    schema = _thaw(entry.schema)
+    defs = schema.get("$defs", {}) or {}
+    properties = {
+        name: prop
+        for name, prop in (schema.get("properties", {}) or {}).items()
+        if name not in BASE_FIELDS
+    }
+    compact: dict[str, Any] = {}
+    if schema.get("description"):
+        compact["description"] = schema["description"]
+    compact["properties"] = _strip(properties, defs)
+    required = [f for f in schema.get("required", []) or [] if f not in BASE_FIELDS]
+    if required:
+        compact["required"] = required
+    return compact_json(compact)
+
+
+def _mentions(text: str, keyword: str) -> bool:
+    pattern = _WORD_BOUNDARY_CACHE.get(keyword)
+    if pattern is None:
+        pattern = re.compile(r"\b" + re.escape(keyword), re.IGNORECASE)
+        _WORD_BOUNDARY_CACHE[keyword] = pattern
+    return bool(pattern.search(text))
+
+
+def focus_nodes(
+    current_node: str | None,
+    user_message: str | None = None,
+    extra: Iterable[str | None] = (),
+) -> list[str]:
+    """
+    Pick the nodes whose full schemas go into the prompt.
+
+    Order: current node, extra nodes (e.g. node being collected), branch siblings
+    of those, then nodes hinted at by keywords in the user message.
+    """
+    ordered: list[str] = []
+
+    def _add(name: str | None) -> None:
+        if name and name in NODE_SCHEMAS and name not in ordered:
+            ordered.append(name)
+
+    anchors = [current_node, *extra]
+    for name in anchors:
+        _add(name)
+    for name in anchors:
+        branch = get_branch_for_node(name) if name else None
+        for sibling in BRANCHES.get(branch, {}).get("nodes", []) if branch else []:
+            _add(sibling)
+    if user_message:
+        for node_name, keywords in NODE_KEYWORDS.items():
+            if any(_mentions(user_message, kw) for kw in keywords):
+                _add(node_name)
+    return ordered
+
+
+def compact_node_schemas(focus: Iterable[str]) -> str:
+    """
+    Compact schema text: full schemas for focus nodes, field names for the rest.
+
+    Format: {"schemas":{Node:{...}},"other_nodes":{Node:[field,...]}}
+    """
+    focus_list = [name for name in focus if name in NODE_SCHEMAS]
+    schemas = ",".join(f"{json.dumps(name)}:{compact_node_schema(name)}" for name in focus_list)
+    others = {
+        name: list(NODE_SCHEMAS.get(name).fields)
+        for name in NODE_SCHEMAS
+        if name not in focus_list
+    }
+    return f'{{"schemas":{{{schemas}}},"other_nodes":{compact_json(others)}}}'
+
+
+def schema_format_note() -> str:
+    """Prompt note explaining the compact_node_schemas() layout ("" when compaction is off)."""
+    if not Config.PROMPT_COMPACTION_ENABLED:
+        return ""
+    return (
+        ' (full schemas under "schemas"; nodes under "other_nodes" are listed by field name '
+        "and are still valid targets - refer to those fields by name)"
+    )
+
+
+def prompt_report(agent_name: str, prompt: str, sections: Mapping[str, str | None]) -> dict[str, Any]:
+    """
+    Build a token report for a rendered prompt and record it in metrics
+    (prompt.<agent>.tokens and prompt.<agent>.<section>.tokens).
+
+    Returns {"agent", "chars", "tokens", "sections": {name: tokens}}.
+    """
+    tokens = estimate_tokens(prompt)
+    report = {
+        "agent": agent_name,
+        "chars": len(prompt),
+        "tokens": tokens,
+        "sections": {name: estimate_tokens(text) for name, text in sections.items()},
+    }
+    metrics.inc(f"prompt.{agent_name}.calls")
+    metrics.inc(f"prompt.{agent_name}.tokens", tokens)
+    for name, section_tokens in report["sections"].items():
+        metrics.inc(f"prompt.{agent_name}.{name}.tokens", section_tokens)
+    return report
@@ -0,0 +1,157 @@
+"""
+Process-wide metrics registry.
+
+Lightweight, dependency-free counters and histograms shared by services and agents:
+- inc() increments a named counter
+- get() reads a single counter
+- snapshot() returns a copy of all counters (for logging / health endpoints)
+- observe() records a value in a labelled histogram (cumulative buckets)
+- to_prometheus() renders everything in the Prometheus text exposition format
+"""
+
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+
+# Default histogram buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_NAME_INVALID = re.compile(r"[^a-zA-Z0-9_:]")
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram of one labelled series."""
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": {str(bound): n for bound, n in zip(self.buckets, self.counts)},
+        }
+
+
+def _prom_name(prefix: str, name: str) -> str:
+    return _NAME_INVALID.sub("_", f"{prefix}_{name}" if prefix else name)
+
+
+def _prom_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_prom_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _prom_escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """Thread-safe named counters."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+        self._buckets: dict[str, tuple[float, ...]] = {}
+
+    def inc(self, name: str, amount: float = 1) -> None:
+        """Increment counter `name` by `amount`."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def get(self, name: str) -> float:
+        """Return the current value of counter `name` (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def ratio(self, numerator: str, denominator: str) -> float | None:
+        """Return numerator / denominator, or None when the denominator is zero."""
+        with self._lock:
+            total = self._counters.get(denominator, 0)
+            return self._counters.get(numerator, 0) / total if total else None
+
+    def snapshot(self) -> dict[str, float]:
+        """Return a copy of all counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Record `value` in histogram `name` (buckets are fixed by the first observation)."""
+        key: Labels = tuple(sorted((labels or {}).items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            bounds = self._buckets.setdefault(name, tuple(sorted(buckets)))
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(bounds)
+            histogram.observe(value)
+
+    def histograms(self) -> dict[str, list[dict[str, object]]]:
+        """Return a copy of all histograms: name -> [{labels, count, sum, buckets}]."""
+        with self._lock:
+            return {
+                name: [{"labels": dict(key), **h.to_dict()} for key, h in series.items()]
+                for name, series in self._histograms.items()
+            }
+
+    def to_prometheus(self, prefix: str = "vecta") -> str:
+        """Render counters and histograms in the Prometheus text format (names sanitized)."""
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                metric = _prom_name(prefix, name)
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {_prom_value(self._counters[name])}")
+            for name in sorted(self._histograms):
+                metric = _prom_name(prefix, name)
+                lines.append(f"# TYPE {metric} histogram")
+                for key, h in sorted(self._histograms[name].items()):
+                    for bound, n in zip(h.buckets, h.counts):
+                        lines.append(f"{metric}_bucket{_prom_labels(key, ('le', _prom_value(bound)))} {n}")
+                    lines.append(f"{metric}_bucket{_prom_labels(key, ('le', '+Inf'))} {h.count}")
+                    lines.append(f"{metric}_sum{_prom_labels(key)} {_prom_value(h.total)}")
+                    lines.append(f"{metric}_count{_prom_labels(key)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all counters and histograms."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._buckets.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,92 @@
+"""
+Prompt registry - Every template in prompts/ loaded once per process.
+
+Templates keep their large static instruction block first and the dynamic
+context ({placeholders}) last, so consecutive renders share a long identical
+prefix that the provider can serve from its prompt cache. The registry
+records how much of each template is static so regressions are visible.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+# A single-brace {name} placeholder (doubled {{ }} braces are literal)
+_PLACEHOLDER = re.compile(r"(?<!\{)\{([a-z_][a-z0-9_]*)\}(?!\})")
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """One prompt file."""
+
+    name: str
+    text: str
+    version: str
+    placeholders: tuple[str, ...] = field(default=())
+    static_prefix_chars: int = 0
+
+    @classmethod
+    def from_text(cls, name: str, text: str) -> "PromptTemplate":
+        """Build a template, locating its placeholders and static prefix."""
+        matches = list(_PLACEHOLDER.finditer(text))
+        return cls(
+            name=name,
+            text=text,
+            version=hashlib.sha256(text.encode("utf-8")).hexdigest()[:16],
+            placeholders=tuple(dict.fromkeys(m.group(1) for m in matches)),
+            static_prefix_chars=matches[0].start() if matches else len(text),
+        )
+
+    @property
+    def static_ratio(self) -> float:
+        """Share of the template before the first placeholder."""
+        return self.static_prefix_chars / len(self.text) if self.text else 1.0
+
+    def render(self, **values: Any) -> str:
+        """Fill the placeholders (str.format semantics)."""
+        return self.text.format(**values)
+
+
+class PromptRegistry(Mapping[str, PromptTemplate]):
+    """Read-only name -> PromptTemplate mapping (name is the file stem)."""
+
+    def __init__(self, templates: Mapping[str, PromptTemplate]):
+        """Wrap already-loaded templates."""
+        self._templates = dict(templates)
+
+    @classmethod
+    def from_directory(cls, directory: Path = PROMPTS_DIR) -> "PromptRegistry":
+        """Load every *.txt template in directory."""
+        return cls({
+            path.stem: PromptTemplate.from_text(path.stem, path.read_text())
+            for path in sorted(directory.glob("*.txt"))
+        })
+
+    def __getitem__(self, name: str) -> PromptTemplate:
+        return self._templates[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._templates)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Per-template size, static prefix and version (for health/debugging)."""
+        return {
+            name: {
+                "chars": len(t.text),
+                "static_prefix_chars": t.static_prefix_chars,
+                "static_ratio": round(t.static_ratio, 3),
+                "placeholders": list(t.placeholders),
+                "version": t.version,
+            }
+            for name, t in self._templates.items()
+        }
+
+
+PROMPTS = PromptRegistry.from_directory()
@@ -0,0 +1,153 @@
+"""
+Response streaming - Incremental text extraction and compliance gating.
+
+Agents return structured JSON, so token streams are JSON fragments:
+- JsonStringFieldStream pulls the value of one string field (e.g.
+  "response_text") out of a partial JSON stream, decoding escapes as they
+  complete
+- StreamGate applies the streaming compliance policy before text reaches the
+  user:
+  - "prescreen": release whole sentences only while the accumulated text passes
+    the rule-based lexicon (services.compliance_screener); the first flagged
+    sentence halts the stream and the final reviewed text replaces it
+  - "post_review": release tokens immediately; the final frame carries the
+    compliance-reviewed text
+- parse_json_model validates the complete raw output into a response model
+"""
+
+import json
+import re
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from services.compliance_screener import find_matches
+from services.metrics import metrics
+
+STREAM_POLICIES = ("prescreen", "post_review")
+
+M = TypeVar("M", bound=BaseModel)
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+# End of a sentence (terminal punctuation followed by whitespace) or a line break
+_SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+class JsonStringFieldStream:
+    """Decode one top-level string field from a JSON document fed in chunks."""
+
+    def __init__(self, field: str):
+        """Watch for `"field": "..."`."""
+        self._start = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer = ""
+        self._pos: int | None = None  # next undecoded index inside the value
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add raw output; return newly decoded field text (may be empty)."""
+        if self.done or not chunk:
+            return ""
+        self._buffer += chunk
+        if self._pos is None:
+            match = self._start.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        out: list[str] = []
+        buf, i = self._buffer, self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self.done = True
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(buf):
+                break  # escape split across chunks
+            code = buf[i + 1]
+            if code == "u":
+                if i + 6 > len(buf):
+                    break
+                try:
+                    point = int(buf[i + 2:i + 6], 16)
+                except ValueError:
+                    point = None
+                if point is not None and 0xD800 <= point < 0xDC00:
+                    # Surrogate pair: wait for the low half
+                    if i + 12 > len(buf):
+                        break
+                    try:
+                        low = int(buf[i + 8:i + 12], 16) if buf[i + 6:i + 8] == "\\u" else None
+                    except ValueError:
+                        low = None
+                    if low is not None and 0xDC00 <= low < 0xE000:
+                        out.append(chr(0x10000 + ((point - 0xD800) << 10) + (low - 0xDC00)))
+                        i += 12
+                        continue
+                    point = None
+                if point is not None:
+                    out.append(chr(point))
+                i += 6
+            else:
+                out.append(_ESCAPES.get(code, code))
+                i += 2
+        self._pos = i
+        return "".join(out)
+
+
+class StreamGate:
+    """Decide which streamed text may be shown before the final compliance review."""
+
+    def __init__(self, policy: str = "prescreen"):
+        """Use one of STREAM_POLICIES."""
+        if policy not in STREAM_POLICIES:
+            raise ValueError(f"Unknown stream compliance policy: {policy}")
+        self.policy = policy
+        self.released = ""
+        self._pending = ""
+        self.halted = False
+
+    def push(self, text: str) -> str:
+        """Offer newly generated text; return the part that may be sent now."""
+        if self.halted or not text:
+            return ""
+        if self.policy == "post_review":
+            self.released += text
+            return text
+        self._pending += text
+        boundary = None
+        for match in _SENTENCE_END.finditer(self._pending):
+            boundary = match.end()
+        if boundary is None:
+            return ""
+        candidate, self._pending = self._pending[:boundary], self._pending[boundary:]
+        return self._release(candidate)
+
+    def flush(self) -> str:
+        """Stream ended: screen and release whatever is still pending."""
+        if self.halted or not self._pending:
+            return ""
+        candidate, self._pending = self._pending, ""
+        return self._release(candidate)
+
+    def _release(self, candidate: str) -> str:
+        if find_matches(self.released + candidate):
+            self.halted = True
+            metrics.inc("stream.halted")
+            return ""
+        self.released += candidate
+        return candidate
+
+
+def parse_json_model(model: type[M], raw: str) -> M:
+    """Validate a complete JSON output (optionally wrapped in a code fence) into model."""
+    text = _CODE_FENCE.sub("", (raw or "").strip())
+    try:
+        return model.model_validate(json.loads(text))
+    except ValueError as e:
+        raise RuntimeError(f"{model.__name__} output was not valid JSON: {e}") from e
@@ -0,0 +1,205 @@
+"""
+Monte Carlo retirement projection (LLM-free, NumPy).
+
+Simulates savings paths year by year: contributions until retirement, then
+inflation-indexed withdrawals, with random annual returns (lognormal with the
+given arithmetic mean and volatility) and inflation (normal) on every path.
+Withdrawing through poor early returns sells more units at low prices, so
+sequence-of-returns risk shows up in the drawdown without extra modelling.
+
+Paths are simulated in fixed-size chunks, each with its own child seed of
+SeedSequence(seed), so results depend only on the seed and path count: running
+the chunks in a process pool (workers > 1) gives the same numbers as running
+them in-process.
+
+Balances are reported in today's dollars.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from config import Config
+
+CHUNK_PATHS = 10_000
+PERCENTILES = (10, 25, 50, 75, 90)
+# Years into retirement whose average return splits paths for the sequence-risk figures
+EARLY_YEARS = 5
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RetirementAssumptions:
+    """Inputs of one projection (all amounts in today's dollars)."""
+
+    current_savings: float
+    annual_contribution: float
+    annual_spending: float
+    years_to_retire: int
+    years_in_retirement: int = 30
+    annual_return: float = 0.07
+    return_volatility: float = 0.15
+    inflation: float = 0.025
+    inflation_volatility: float = 0.01
+
+    @classmethod
+    def from_inputs(cls, inputs: dict[str, Any]) -> "RetirementAssumptions":
+        def _opt(name: str) -> dict[str, float]:
+            value = inputs.get(name)
+            return {} if value in (None, "") else {name: float(value)}
+
+        retirement_years = inputs.get("years_in_retirement")
+        return cls(
+            current_savings=float(inputs["current_savings"]),
+            annual_contribution=float(inputs["annual_contribution"]),
+            annual_spending=float(inputs["annual_spending"]),
+            years_to_retire=max(0, int(round(float(inputs["years_to_retire"])))),
+            **({} if retirement_years in (None, "") else {"years_in_retirement": max(1, int(round(float(retirement_years))))}),
+            **_opt("annual_return"),
+            **_opt("return_volatility"),
+            **_opt("inflation"),
+            **_opt("inflation_volatility"),
+        )
+
+
+def _simulate_chunk(a: RetirementAssumptions, seed: np.random.SeedSequence, paths: int) -> dict[str, np.ndarray]:
+    """Simulate `paths` paths; returns real balances per year and drawdown outcomes."""
+    rng = np.random.default_rng(seed)
+    years = a.years_to_retire + a.years_in_retirement
+    # Lognormal gross returns matching the arithmetic mean and volatility
+    s2 = np.log1p((a.return_volatility / (1.0 + a.annual_return)) ** 2)
+    log_returns = rng.normal(np.log1p(a.annual_return) - s2 / 2, np.sqrt(s2), (years, paths))
+    growth = np.exp(log_returns)
+    inflation = np.maximum(rng.normal(a.inflation, a.inflation_volatility, (years, paths)), -0.99)
+
+    balance = np.full(paths, a.current_savings)
+    prices = np.ones(paths)
+    real = np.empty((years + 1, paths))
+    real[0] = balance
+    depleted_year = np.zeros(paths)
+    for t in range(years):
+        if t < a.years_to_retire:
+            # Contributions (indexed to inflation) at the end of the year
+            balance = balance * growth[t] + a.annual_contribution * prices
+        else:
+            # Spending is withdrawn at the start of the year, then the rest is invested
+            withdrawal = a.annual_spending * prices
+            short = (balance < withdrawal) & (depleted_year == 0)
+            depleted_year[short] = t - a.years_to_retire + 1
+            balance = np.maximum(balance - withdrawal, 0.0) * growth[t]
+        prices = prices * (1.0 + inflation[t])
+        real[t + 1] = balance / prices
+
+    early = slice(a.years_to_retire, a.years_to_retire + min(EARLY_YEARS, a.years_in_retirement))
+    return {
+        "real": real,
+        "depleted_year": depleted_year,
+        "early_return": np.expm1(log_returns[early].mean(axis=0)),
+    }
+
+
+def _chunk_sizes(paths: int) -> list[int]:
+    full, rest = divmod(paths, CHUNK_PATHS)
+    return [CHUNK_PATHS] * full + ([rest] if rest else [])
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    # One long-lived pool (spawned workers: the server process runs threads and an event loop)
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the worker pool, if one was started (app shutdown)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_chunks(a: RetirementAssumptions, paths: int, seed: int, workers: int) -> dict[str, np.ndarray]:
+    sizes = _chunk_sizes(paths)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers > 1 and len(sizes) > 1:
+        pool = _get_pool(workers)
+        chunks = list(pool.map(_simulate_chunk, [a] * len(sizes), seeds, sizes))
+    else:
+        chunks = [_simulate_chunk(a, s, n) for s, n in zip(seeds, sizes)]
+    return {
+        "real": np.concatenate([c["real"] for c in chunks], axis=1),
+        "depleted_year": np.concatenate([c["depleted_year"] for c in chunks]),
+        "early_return": np.concatenate([c["early_return"] for c in chunks]),
+    }
+
+
+def _rate(mask: np.ndarray) -> float | None:
+    return float(mask.mean()) if mask.size else None
+
+
+def simulate_retirement(
+    inputs: dict[str, Any],
+    paths: int | None = None,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Run the Monte Carlo projection and summarize it (JSON-friendly).
+
+    inputs: current_savings, annual_contribution, annual_spending, years_to_retire;
+    optional years_in_retirement (30), annual_return (0.07), return_volatility (0.15),
+    inflation (0.025), inflation_volatility (0.01), paths and seed. Arguments
+    override the inputs; path count is capped by Config.MONTE_CARLO_MAX_PATHS
+    (the retirement_monte_carlo calculator caps it at MONTE_CARLO_PATHS). CPU-bound:
+    call it from a worker thread when on the event loop.
+
+    Returns probability_of_success (money lasts the whole retirement), percentile
+    bands of the real balance per year, balance percentiles at retirement, median
+    depletion year of failed paths and success rates after weak vs strong early
+    retirement returns (sequence-of-returns risk).
+    """
+    a = RetirementAssumptions.from_inputs(inputs)
+    paths = int(paths or inputs.get("paths") or Config.MONTE_CARLO_PATHS)
+    paths = max(1, min(paths, Config.MONTE_CARLO_MAX_PATHS))
+    seed = int(seed if seed is not None else inputs.get("seed") or 0)
+    workers = int(workers if workers is not None else Config.MONTE_CARLO_WORKERS)
+
+    sim = _run_chunks(a, paths, seed, workers)
+    real, depleted_year = sim["real"], sim["depleted_year"]
+    success = depleted_year == 0
+    bands = np.percentile(real, PERCENTILES, axis=1)
+    at_retirement = np.percentile(real[a.years_to_retire], PERCENTILES)
+    weak = sim["early_return"] < np.median(sim["early_return"])
+
+    return {
+        "probability_of_success": float(success.mean()),
+        "paths": paths,
+        "seed": seed,
+        "years_to_retire": a.years_to_retire,
+        "years_in_retirement": a.years_in_retirement,
+        "balance_at_retirement": {f"p{p}": float(v) for p, v in zip(PERCENTILES, at_retirement)},
+        "median_depletion_year": float(np.median(depleted_year[~success])) if (~success).any() else None,
+        "sequence_risk": {
+            "success_weak_early_returns": _rate(success[weak]),
+            "success_strong_early_returns": _rate(success[~weak]),
+        },
+        "bands": {
+            "year": list(range(real.shape[0])),
+            **{f"p{p}": np.round(band, 2).tolist() for p, band in zip(PERCENTILES, bands)},
+        },
+    }
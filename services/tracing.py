@@ -0,0 +1,153 @@
+"""
+Turn tracing - Per-stage latency, LLM calls and tokens of one orchestrator turn.
+
+The orchestrator opens a TurnTrace per turn (turn_trace()) and wraps each agent
+call in a stage (stage() / traced()). agents.llm_client reports every LLM call
+and its token usage with record_llm_call() / record_llm_usage(), which are
+attributed to the innermost active stage and to the turn. State lives in
+context variables, so concurrent sessions and stages fanned out with
+TurnScheduler (asyncio tasks copy the context) are kept apart.
+
+Finished turns and stages are recorded as histograms in services.metrics
+(exposed on /metrics):
+- turn.seconds{kind}, turn.llm_calls{kind}, turn.tokens{kind}
+- stage.seconds{stage}
+
+Work still running after its turn finished (e.g. a background speculative
+compliance review) only feeds the global metrics, not that turn's trace.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Iterator, TypeVar
+
+from services.metrics import metrics
+
+T = TypeVar("T")
+
+COUNT_BUCKETS = (0, 1, 2, 3, 4, 6, 8, 12, 16, 24)
+TOKEN_BUCKETS = (500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)
+
+_current_turn: ContextVar["TurnTrace | None"] = ContextVar("current_turn", default=None)
+_current_stage: ContextVar["StageSpan | None"] = ContextVar("current_stage", default=None)
+
+
+@dataclass
+class StageSpan:
+    """One timed stage (usually one agent call)."""
+
+    name: str
+    started: float = field(default_factory=time.perf_counter)
+    seconds: float | None = None
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self, turn_started: float) -> dict[str, Any]:
+        return {
+            "stage": self.name,
+            "offset_ms": round((self.started - turn_started) * 1000, 2),
+            "ms": round((self.seconds or 0.0) * 1000, 2),
+            "llm_calls": self.llm_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+@dataclass
+class TurnTrace:
+    """Stages and LLM usage of one orchestrator turn."""
+
+    kind: str
+    started: float = field(default_factory=time.perf_counter)
+    seconds: float | None = None
+    stages: list[StageSpan] = field(default_factory=list)
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view (stages in start order)."""
+        return {
+            "kind": self.kind,
+            "ms": round((self.seconds or 0.0) * 1000, 2),
+            "llm_calls": self.llm_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "stages": [s.to_dict(self.started) for s in sorted(self.stages, key=lambda s: s.started)],
+        }
+
+
+def current_turn() -> TurnTrace | None:
+    """The trace of the turn running in this context, if any."""
+    return _current_turn.get()
+
+
+@contextmanager
+def turn_trace(kind: str) -> Iterator[TurnTrace]:
+    """
+    Trace a turn. Nested calls (e.g. astart() -> arespond()) join the outer trace.
+    """
+    existing = _current_turn.get()
+    if existing is not None:
+        yield existing
+        return
+    trace = TurnTrace(kind=kind)
+    token = _current_turn.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_turn.reset(token)
+        trace.seconds = time.perf_counter() - trace.started
+        labels = {"kind": trace.kind}
+        metrics.observe("turn.seconds", trace.seconds, labels)
+        metrics.observe("turn.llm_calls", trace.llm_calls, labels, buckets=COUNT_BUCKETS)
+        metrics.observe("turn.tokens", trace.input_tokens + trace.output_tokens, labels, buckets=TOKEN_BUCKETS)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[StageSpan]:
+    """Time a stage of the current turn (also recorded when no turn is traced)."""
+    span = StageSpan(name=name)
+    token = _current_stage.set(span)
+    try:
+        yield span
+    finally:
+        _current_stage.reset(token)
+        span.seconds = time.perf_counter() - span.started
+        trace = _current_turn.get()
+        if trace is not None and trace.seconds is None:
+            trace.stages.append(span)
+        metrics.observe("stage.seconds", span.seconds, {"stage": name})
+
+
+async def traced(name: str, awaitable: Awaitable[T]) -> T:
+    """Await inside stage(name) (for scheduler tasks and one-line call sites)."""
+    with stage(name):
+        return await awaitable
+
+
+def _targets() -> list[StageSpan | TurnTrace]:
+    trace = _current_turn.get()
+    if trace is None or trace.seconds is not None:
+        return []
+    span = _current_stage.get()
+    return [span, trace] if span is not None else [trace]
+
+
+def record_llm_call() -> None:
+    """Count one LLM request against the current stage and turn."""
+    metrics.inc("llm.calls")
+    for target in _targets():
+        target.llm_calls += 1
+
+
+def record_llm_usage(input_tokens: int, output_tokens: int) -> None:
+    """Add provider-reported token usage to the current stage and turn."""
+    metrics.inc("llm.input_tokens", input_tokens)
+    metrics.inc("llm.output_tokens", output_tokens)
+    for target in _targets():
+        target.input_tokens += input_tokens
+        target.output_tokens += output_tokens
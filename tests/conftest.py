@@ -0,0 +1,6 @@
+"""Test configuration: offline LLM stand-in and no on-disk session store at import."""
+
+import os
+
+os.environ.setdefault("LLM_BACKEND", "fake")
+os.environ.setdefault("SESSION_PERSISTENCE", "none")
@@ -0,0 +1,39 @@
+"""Deterministic fast-path answer parser: parse what is unambiguous, fall back otherwise."""
+
+import pytest
+
+from services.answer_parser import parse_answer
+
+
+@pytest.mark.parametrize(
+    ("node", "field", "text", "expected"),
+    [
+        ("Savings", "emergency_fund_months", "3", 3),
+        ("Savings", "emergency_fund_months", "3 months", 3),
+        ("Savings", "emergency_fund_months", "2 years", 24),
+        ("Savings", "emergency_fund_months", "1 year", 12),
+        ("Savings", "total_savings", "12,000", 12000.0),
+        ("Savings", "total_savings", "$1,200,000", 1200000.0),
+        ("Personal", "age", "35 years old", 35),
+    ],
+)
+def test_parses_unambiguous_answers(node, field, text, expected):
+    result = parse_answer(node, field, text)
+    assert result is not None
+    assert result.update.value == expected
+    assert result.update.confidence == 1.0
+
+
+@pytest.mark.parametrize(
+    ("node", "field", "text"),
+    [
+        ("Savings", "emergency_fund_months", "6 weeks"),
+        ("Savings", "total_savings", "50k each"),
+        ("Savings", "total_savings", "1,2000"),
+        ("Savings", "total_savings", "5k per year"),
+        ("Savings", "total_savings", "10 years"),
+        ("Personal", "age", "35 months"),
+    ],
+)
+def test_falls_back_when_unsure(node, field, text):
+    assert parse_answer(node, field, text) is None
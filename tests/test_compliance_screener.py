@@ -0,0 +1,107 @@
+"""Rule-based compliance pre-screen: only template text and plain questions skip the LLM."""
+
+import pytest
+
+from services.compliance_screener import find_matches, screen
+
+# Prohibited phrasing from prompts/compliance_agent_prompt.txt (plus common variants)
+PROHIBITED = [
+    "You should pay off that credit card first.",
+    "I recommend increasing your super contributions.",
+    "I advise waiting until rates drop.",
+    "You need to build an emergency fund.",
+    "You must act before June.",
+    "The best option is to invest in ETFs.",
+    "You ought to save more.",
+    "My advice would be to wait.",
+    "Switch to a lower-fee fund.",
+    "Open a high-interest savings account.",
+    "Buy Vanguard ETFs.",
+    "Choose AustralianSuper.",
+    "The optimal strategy is to wait.",
+    "You'll want to pay off the card first.",
+    "You’ll want to pay off the card first.",
+    "What you should do is save.",
+    "Here's what to do.",
+    "Great decision!",
+    "That's a bad idea",
+    "Excellent choice!",
+    "That's risky",
+    "That's the wrong approach",
+    "That's a great savings rate!",
+    "Consider paying off your credit card first.",
+    "Increase your super contributions now.",
+    "It would be wise to build an emergency fund.",
+    "Okay. Put more into super.",
+]
+
+# Free-form advice the lexicon doesn't catch: must still reach the LLM reviewer
+UNLISTED_ADVICE = [
+    "You could pay off the card first.",
+    "If I were you, I'd pay off the card.",
+    "You're better off renting.",
+    "Your best bet is an offset account.",
+    "Definitely pay off the card first.",
+    "You might want to pay the card off first.",
+    "Go for the fixed rate.",
+    "Get income protection.",
+    "Okay, so sell the investment property.",
+    "Try salary sacrificing.",
+    "Renting is the better choice for you.",
+    "Just sell the car.",
+    "Time to refinance.",
+    "Should you sell the car?",
+    "Have you considered paying off the card first?",
+]
+
+# Allowed phrasing from the same prompt
+ALLOWED = [
+    "Your savings are $20,000.",
+    "The numbers show your card is at 20%.",
+    "Many people in similar situations consider extra super contributions.",
+    "One approach some people take is salary sacrificing.",
+    "Have you considered what happens if rates rise?",
+    "How do you feel about your current safety net?",
+    "I notice that your expenses are high.",
+    "What's your income situation?",
+    "Let me show you the numbers",
+    "Would you like to explore retirement options?",
+    "That savings rate puts you ahead of the typical Australian household.",
+]
+
+
+PLAIN_QUESTIONS = [
+    "How old are you?",
+    "What's your income situation?",
+    "How do you feel about your current safety net?",
+    "Would you like to explore retirement options?",
+    "Roughly how much do you have in liquid savings?",
+]
+
+
+@pytest.mark.parametrize("text", PROHIBITED)
+def test_prohibited_phrasing_escalates(text):
+    assert find_matches(text)
+    assert not screen(text).clean
+    assert not screen(text, server_generated=True).clean
+
+
+@pytest.mark.parametrize("text", UNLISTED_ADVICE)
+def test_free_form_advice_escalates(text):
+    assert not screen(text).clean
+
+
+@pytest.mark.parametrize("text", ALLOWED)
+def test_allowed_phrasing_has_no_lexicon_hits(text):
+    assert not find_matches(text)
+    assert screen(text, server_generated=True).clean
+
+
+@pytest.mark.parametrize("text", PLAIN_QUESTIONS)
+def test_plain_questions_are_clean(text):
+    assert screen(text).clean
+
+
+def test_free_form_statements_escalate():
+    assert not screen("Your savings are $20,000.").clean
+    assert not screen("Thanks for sharing. What is your monthly rent?").clean
@@ -0,0 +1,61 @@
+"""Closed-form debt repayment against the month-by-month reference loop."""
+
+import random
+
+import numpy as np
+import pytest
+
+from services.calculation_engine import _debt_repayment_reference, calculate, calculate_batch
+
+
+def _cases() -> list[dict[str, float]]:
+    rng = random.Random(23)
+    cases = [
+        {"balance": 10_000, "annual_rate": 0.0, "monthly_payment": 300},  # rate = 0
+        {"balance": 12_000, "annual_rate": 0.0, "monthly_payment": 1_000},  # rate = 0, exact multiple
+        {"balance": 500_000, "annual_rate": 0.06, "monthly_payment": 2_550},  # ~100 years to repay
+        {"balance": 100_000, "annual_rate": 0.12, "monthly_payment": 1_000.5},  # barely above interest
+        {"balance": 0, "annual_rate": 0.2, "monthly_payment": 100},
+        {"balance": 5_000, "annual_rate": 0.2, "monthly_payment": 10},  # never repaid
+    ]
+    for _ in range(500):
+        balance = rng.uniform(100, 800_000)
+        rate = rng.choice([0.0, rng.uniform(0.001, 0.25)])
+        minimum = balance * rate / 12
+        cases.append({
+            "balance": balance,
+            "annual_rate": rate,
+            "monthly_payment": minimum + rng.uniform(1, balance / 6),
+        })
+    return cases
+
+
+CASES = _cases()
+
+
+def test_cases_include_long_payoffs():
+    months = [_debt_repayment_reference(case)["months"] or 0 for case in CASES]
+    assert max(months) > 1000
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_closed_form_matches_reference(case):
+    expected = _debt_repayment_reference(case)
+    result = calculate("debt_repayment", case)
+    assert result["months"] == expected["months"]
+    if expected["total_interest"] is None:
+        assert result["total_interest"] is None
+    else:
+        assert result["total_interest"] == pytest.approx(expected["total_interest"], rel=1e-6, abs=1e-6)
+
+
+def test_batch_matches_scalar():
+    columns = {name: [case[name] for case in CASES] for name in ("balance", "annual_rate", "monthly_payment")}
+    batch = calculate_batch("debt_repayment", columns)
+    for i, case in enumerate(CASES):
+        result = calculate("debt_repayment", case)
+        if result["months"] is None:
+            assert np.isnan(batch["months"][i])
+        else:
+            assert batch["months"][i] == result["months"]
+            assert batch["total_interest"][i] == pytest.approx(result["total_interest"], rel=1e-6, abs=1e-6)
@@ -0,0 +1,127 @@
+"""Session stores (snapshots and cross-process leases) and SessionManager sharing."""
+
+import asyncio
+import time
+
+import pytest
+
+from api.session_store import (
+    FileSessionStore,
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    encode_state,
+    new_lock_owner,
+)
+from api.sessions import SessionManager
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = InMemorySessionStore()
+    elif request.param == "sqlite":
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    else:
+        store = FileSessionStore(str(tmp_path / "sessions"))
+    yield store
+    store.close()
+
+
+def test_save_load_revision_delete(store):
+    assert store.load("s1") is None
+    assert store.revision("s1") == 0
+    store.save("s1", encode_state({"revision": 1, "value": "a"}))
+    store.save("s1", encode_state({"revision": 2, "value": "b"}))
+    assert store.load("s1") == {"revision": 2, "value": "b"}
+    assert store.revision("s1") == 2
+    store.delete("s1")
+    assert store.load("s1") is None
+    assert store.revision("s1") == 0
+
+
+def test_lock_contention_and_unlock(store):
+    a, b = new_lock_owner(), new_lock_owner()
+    assert store.try_lock("s1", a, 30)
+    assert not store.try_lock("s1", b, 30)
+    store.unlock("s1", b)  # not the owner: no effect
+    assert not store.try_lock("s1", b, 30)
+    store.unlock("s1", a)
+    assert store.try_lock("s1", b, 30)
+
+
+def test_lock_reentry_by_owner(store):
+    a = new_lock_owner()
+    assert store.try_lock("s1", a, 30)
+    assert store.try_lock("s1", a, 30)
+
+
+def test_expired_lock_is_taken_over(store):
+    a, b = new_lock_owner(), new_lock_owner()
+    assert store.try_lock("s1", a, 0.05)
+    time.sleep(0.1)
+    assert store.try_lock("s1", b, 30)
+    assert not store.try_lock("s1", a, 30)
+    store.unlock("s1", a)  # the old owner's late unlock must not release b's lease
+    assert not store.try_lock("s1", new_lock_owner(), 30)
+
+
+def test_file_lock_break_keeps_a_fresh_lease(tmp_path, monkeypatch):
+    # Another worker breaks the stale lease and takes its own after we read the
+    # stale one: we must not remove theirs or believe we own the session
+    store = FileSessionStore(str(tmp_path))
+    stale, fresh, late = new_lock_owner(), new_lock_owner(), new_lock_owner()
+    assert store.try_lock("s1", stale, 0.05)
+    time.sleep(0.1)
+    read_lock = store._read_lock
+    raced = []
+
+    def read_then_race(path):
+        body = read_lock(path)
+        if not raced:
+            raced.append(path)
+            assert store.try_lock("s1", fresh, 30)
+        return body
+
+    monkeypatch.setattr(store, "_read_lock", read_then_race)
+    assert not store.try_lock("s1", late, 30)
+    assert raced
+    assert store._owns_lock(store._lock_path("s1"), fresh)
+
+
+@pytest.mark.parametrize("shared", [True, False])
+def test_manager_loads_session_written_by_another_manager(tmp_path, shared):
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+
+    async def run():
+        writer = SessionManager(store=store, shared=shared)
+        session_id = await writer.create_session()
+        await writer.flush()
+        reader = SessionManager(store=store, shared=shared)
+        orchestrator = await reader.get_session(session_id)
+        assert orchestrator is not None
+        assert orchestrator.session_id == session_id
+        assert await reader.get_session("unknown") is None
+
+    asyncio.run(run())
+    store.close()
+
+
+def test_delete_during_flush_is_not_undone():
+    class SlowStore(InMemorySessionStore):
+        def save_many(self, states):
+            time.sleep(0.1)
+            super().save_many(states)
+
+    store = SlowStore()
+
+    async def run():
+        manager = SessionManager(store=store, shared=False)
+        session_id = await manager.create_session()
+        flush = asyncio.create_task(manager.flush())
+        await asyncio.sleep(0.02)  # the batch (with the session) is being written
+        await manager.delete_session(session_id)
+        await flush
+        assert store.load(session_id) is None
+        assert await manager.get_session(session_id) is None
+
+    asyncio.run(run())
@@ -0,0 +1,25 @@
+"""The latency benchmark attributes injected fake-LLM latency to turns in both modes."""
+
+import asyncio
+
+import pytest
+
+from agents.fake_llm import FAKE_LLM
+from benchmarks.turn_latency import run_orchestrator
+
+
+@pytest.fixture
+def fake_latency():
+    FAKE_LLM.reset()
+    latency, FAKE_LLM.latency_ms = FAKE_LLM.latency_ms, 5.0
+    yield
+    FAKE_LLM.latency_ms = latency
+    FAKE_LLM.reset()
+
+
+@pytest.mark.parametrize("sync", [False, True])
+def test_injected_latency_is_attributed(fake_latency, sync):
+    result = asyncio.run(run_orchestrator(sessions=2, script=["35", "married"], sync=sync))
+    assert len(result.turns) == 6
+    assert all(turn.injected_seconds > 0 for turn in result.turns)
+    assert all(turn.injected_seconds <= turn.seconds for turn in result.turns)